@@ -0,0 +1,273 @@
+"""
+Asset Baker
+Writes pre-scaled, display-ready copies of images to an on-disk cache so
+scenes can skip decoding and rescaling multi-megabyte PNGs.
+
+Run `python -m src.game.core.asset_baker` from the project root to bake
+every target listed in the "bake" rules of assets/metadata.json. The game
+reads baked copies, and bakes missing ones on first load, only once a
+cache directory is set with set_bake_cache_dir().
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+import pygame
+
+from .asset_pack import get_asset_pack
+
+# A bake target is either a uniform scale factor or an exact (width, height)
+Target = Union[float, Tuple[int, int], None]
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+DEFAULT_CACHE_DIR = 'cache/baked'
+
+# Source hashes shared by every baker, keyed by (path, mtime_ns, size), so
+# each source file is read and hashed at most once per process
+_source_hashes: Dict[Tuple[str, int, int], str] = {}
+
+def read_png_size(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    """Read an image's dimensions from its PNG header without decoding it.
+
+    Args:
+        path: Path to the image file.
+
+    Returns:
+        (width, height), or None if the file is not a PNG.
+    """
+    with open(path, 'rb') as f:
+        return png_size(f.read(24))
+
+def png_size(header: bytes) -> Optional[Tuple[int, int]]:
+    """Parse an image's dimensions from the first 24 bytes of a PNG.
+
+    Returns:
+        (width, height), or None if the data is not a PNG.
+    """
+    if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+def scaled_size(size: Tuple[int, int], target: Target) -> Tuple[int, int]:
+    """Resolve a bake target against an image's source size.
+
+    Args:
+        size: Source (width, height).
+        target: Scale factor, exact size, or None for the source size.
+
+    Returns:
+        The target (width, height).
+    """
+    if target is None:
+        return size
+    if isinstance(target, (int, float)):
+        return (int(size[0] * target), int(size[1] * target))
+    return (int(target[0]), int(target[1]))
+
+def scale_surface(image: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    """Scale an image with the best filter its pixel format allows."""
+    if image.get_size() == size:
+        return image
+    if image.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(image, size)
+    return pygame.transform.scale(image, size)
+
+_bake_cache_dir: Optional[Path] = None
+
+def set_bake_cache_dir(path: Optional[Union[str, Path]]) -> None:
+    """Set the directory bakers created without one read and write.
+
+    Args:
+        path: Directory of baked copies, or None to turn baking on load off.
+    """
+    global _bake_cache_dir
+    _bake_cache_dir = Path(path) if path is not None else None
+
+def get_bake_cache_dir() -> Optional[Path]:
+    """Get the configured directory of baked copies, if baking is on."""
+    return _bake_cache_dir
+
+class AssetBaker:
+    """Stores and retrieves baked image copies keyed by source hash and size.
+
+    Baked copies are raw RGB/RGBA pixel dumps, so loading one is a single
+    file read with no image decoder involved.
+    """
+
+    def __init__(self, assets_dir: str = 'assets', cache_dir: Optional[Union[str, Path]] = None):
+        """Initialize the baker.
+
+        Args:
+            assets_dir: Root directory of the source assets.
+            cache_dir: Directory baked copies are written to. Defaults to
+                the one set with set_bake_cache_dir(); with neither, the
+                baker neither reads nor writes anything.
+        """
+        self.assets_dir = Path(assets_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_bake_cache_dir()
+
+    def source_hash(self, filename: str) -> str:
+        """Hash a source image.
+
+        Images in the open asset pack use the hash recorded in its index;
+        loose files are hashed once per modification time and size.
+
+        Args:
+            filename: Image path relative to the assets directory.
+        """
+        pack = get_asset_pack()
+        if pack is not None and filename in pack:
+            entry = pack.index[filename]
+            if 'sha1' not in entry:
+                # Packs built before hashes were recorded in the index
+                entry['sha1'] = hashlib.sha1(pack.view(filename)).hexdigest()
+            return entry['sha1']
+
+        path = self.assets_dir / filename
+        stat = path.stat()
+        memo_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        digest = _source_hashes.get(memo_key)
+        if digest is None:
+            digest = hashlib.sha1(path.read_bytes()).hexdigest()
+            _source_hashes[memo_key] = digest
+        return digest
+
+    def target_size(self, filename: str, target: Target) -> Optional[Tuple[int, int]]:
+        """Work out the baked size of an image without decoding it.
+
+        Args:
+            filename: Image path relative to the assets directory.
+            target: Scale factor or exact (width, height).
+
+        Returns:
+            The target size, or None if it cannot be determined cheaply.
+        """
+        if target is not None and not isinstance(target, (int, float)):
+            return scaled_size((0, 0), target)
+        pack = get_asset_pack()
+        if pack is not None and filename in pack:
+            entry = pack.index[filename]
+            source_size = tuple(entry['size']) if 'size' in entry else png_size(bytes(pack.view(filename)[:24]))
+        else:
+            source_size = read_png_size(self.assets_dir / filename)
+        if source_size is None:
+            return None
+        return scaled_size(source_size, target)
+
+    def baked_path(self, filename: str, size: Tuple[int, int], alpha: bool) -> Path:
+        """Get the cache path of a baked copy."""
+        digest = self.source_hash(filename)
+        extension = 'rgba' if alpha else 'rgb'
+        return self.cache_dir / f"{digest}_{size[0]}x{size[1]}.{extension}"
+
+    def load(self, filename: str, target: Target) -> Optional[pygame.Surface]:
+        """Load a baked copy if one exists.
+
+        Args:
+            filename: Image path relative to the assets directory.
+            target: Scale factor or exact (width, height).
+
+        Returns:
+            The baked surface (not yet display-converted), or None.
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            size = self.target_size(filename, target)
+            if size is None:
+                return None
+            for alpha, pixel_format in ((True, 'RGBA'), (False, 'RGB')):
+                path = self.baked_path(filename, size, alpha)
+                if path.exists():
+                    return pygame.image.frombytes(path.read_bytes(), size, pixel_format)
+        except (OSError, ValueError, pygame.error):
+            return None
+        return None
+
+    def store(self, filename: str, image: pygame.Surface) -> None:
+        """Write a baked copy of an already scaled image.
+
+        Args:
+            filename: Source image path relative to the assets directory.
+            image: The scaled image.
+        """
+        if self.cache_dir is None:
+            return
+        alpha = bool(image.get_flags() & pygame.SRCALPHA)
+        try:
+            path = self.baked_path(filename, image.get_size(), alpha)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(path.suffix + '.tmp')
+            temp_path.write_bytes(pygame.image.tobytes(image, 'RGBA' if alpha else 'RGB'))
+            os.replace(temp_path, path)
+        except (OSError, pygame.error) as e:
+            print(f"Error baking image {filename}: {e}")
+
+    def bake(self, filename: str, target: Target) -> bool:
+        """Decode, scale and store one image unless it is already baked.
+
+        Args:
+            filename: Image path relative to the assets directory.
+            target: Scale factor or exact (width, height).
+
+        Returns:
+            bool: True if a baked copy exists afterwards.
+        """
+        if self.cache_dir is None:
+            return False
+        if self.load(filename, target) is not None:
+            return True
+        try:
+            image = pygame.image.load(str(self.assets_dir / filename))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading image {filename}: {e}")
+            return False
+        self.store(filename, scale_surface(image, scaled_size(image.get_size(), target)))
+        return True
+
+    def iter_targets(self, metadata_path: str = 'assets/metadata.json') -> Iterator[Tuple[str, Target]]:
+        """Expand the "bake" rules of the asset metadata into targets.
+
+        Each rule has a glob "pattern" relative to the assets directory
+        and lists the "sizes" and/or "scales" scenes load it at.
+
+        Args:
+            metadata_path: Path to the asset metadata file.
+
+        Yields:
+            (filename, target) pairs.
+        """
+        with open(metadata_path, encoding='utf-8') as f:
+            rules = json.load(f).get('bake', [])
+        files = sorted(
+            path.relative_to(self.assets_dir).as_posix()
+            for path in self.assets_dir.rglob('*') if path.is_file()
+        )
+        for rule in rules:
+            for filename in fnmatch.filter(files, rule['pattern']):
+                for size in rule.get('sizes', []):
+                    yield filename, tuple(size)
+                for scale in rule.get('scales', []):
+                    yield filename, float(scale)
+
+    def bake_all(self, metadata_path: str = 'assets/metadata.json') -> int:
+        """Bake every target listed in the asset metadata.
+
+        Returns:
+            int: Number of targets with a baked copy afterwards.
+        """
+        return sum(self.bake(filename, target) for filename, target in self.iter_targets(metadata_path))
+
+def main() -> None:
+    """Bake all configured targets from the command line."""
+    pygame.init()
+    baked = AssetBaker(cache_dir=DEFAULT_CACHE_DIR).bake_all()
+    print(f"Baked {baked} image targets")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Asset Cache
+Process-wide, reference-counted registry of decoded game assets with a
+memory budget and least-recently-used eviction.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+import pygame
+
+CacheKey = Tuple[str, Hashable]
+
+# Decoded assets may use at most this much memory before unreferenced
+# entries are evicted (well under the 1 GB target of the whole game).
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by a decoded asset.
+
+    Surfaces are sized as width * height * bytes per pixel, sounds by the
+    length of their raw sample buffer and texture atlases by their sheets.
+    Other assets count as zero.
+
+    Args:
+        value: The decoded asset.
+
+    Returns:
+        int: Size in bytes.
+    """
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, pygame.mixer.Sound):
+        mixer_init = pygame.mixer.get_init()
+        if not mixer_init:
+            return 0
+        frequency, sample_format, channels = mixer_init
+        frames = int(round(value.get_length() * frequency))
+        return frames * channels * (abs(sample_format) // 8)
+    if hasattr(value, 'sheets'):
+        return sum(estimate_size(sheet) for sheet in value.sheets)
+    return 0
+
+@dataclass
+class CacheEntry:
+    """A single decoded asset held by the cache."""
+    value: Any
+    size: int = 0
+    refcount: int = 0
+
+class AssetCache:
+    """Shares decoded assets between every ResourceManager in the process.
+
+    Assets are stored per category ('images', 'sounds', 'fonts') under a
+    hashable key. Each owner that acquires an asset holds one reference.
+    Referenced assets are pinned by the scene or entity using them and are
+    never evicted; once the last reference is released the asset stays
+    resident for fast re-entry until the memory budget forces it out in
+    least-recently-used order.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            budget_bytes: Memory budget for decoded assets in bytes.
+        """
+        self.entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        # Assets decoded ahead of time by a prefetch worker, waiting for the
+        # main thread to finish them (e.g. convert()) and take ownership
+        self.staged: Dict[CacheKey, Any] = {}
+        self.staged_lock = threading.Lock()
+
+    def acquire(self, category: str, key: Hashable) -> Optional[Any]:
+        """Look up an asset and take a reference to it.
+
+        Args:
+            category: Asset category, e.g. 'images'.
+            key: Key of the asset inside its category.
+
+        Returns:
+            The cached asset, or None on a miss.
+        """
+        entry = self.entries.get((category, key))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry.refcount += 1
+        self.entries.move_to_end((category, key))
+        return entry.value
+
+    def insert(self, category: str, key: Hashable, value: Any) -> Any:
+        """Store a freshly decoded asset and take a reference to it.
+
+        If another owner inserted the same key in the meantime, the
+        existing asset wins so every caller shares one object.
+
+        Args:
+            category: Asset category, e.g. 'images'.
+            key: Key of the asset inside its category.
+            value: The decoded asset.
+
+        Returns:
+            The asset now held by the cache.
+        """
+        entry = self.entries.get((category, key))
+        if entry is None:
+            entry = CacheEntry(value, estimate_size(value))
+            self.entries[(category, key)] = entry
+            self.used_bytes += entry.size
+        entry.refcount += 1
+        self.entries.move_to_end((category, key))
+        self._enforce_budget()
+        return entry.value
+
+    def release(self, category: str, key: Hashable) -> None:
+        """Drop one reference to an asset.
+
+        The asset stays cached but becomes eligible for eviction once no
+        owner references it.
+
+        Args:
+            category: Asset category, e.g. 'images'.
+            key: Key of the asset inside its category.
+        """
+        entry = self.entries.get((category, key))
+        if entry is None or entry.refcount <= 0:
+            return
+        entry.refcount -= 1
+        if entry.refcount == 0:
+            self._enforce_budget()
+
+    def refcount(self, category: str, key: Hashable) -> int:
+        """Get the number of live references to an asset."""
+        entry = self.entries.get((category, key))
+        return entry.refcount if entry else 0
+
+    def is_pinned(self, category: str, key: Hashable) -> bool:
+        """Check whether an asset is in use and therefore never evicted."""
+        return self.refcount(category, key) > 0
+
+    def set_budget(self, budget_bytes: int) -> None:
+        """Change the memory budget, evicting assets if it shrank.
+
+        Args:
+            budget_bytes: New memory budget in bytes.
+        """
+        self.budget_bytes = budget_bytes
+        self._enforce_budget()
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """Get current memory usage per asset category.
+
+        Returns:
+            Dict mapping each category to its resident 'bytes', number of
+            'entries' and number of 'pinned' entries.
+        """
+        usage: Dict[str, Dict[str, int]] = {}
+        for (category, _), entry in self.entries.items():
+            totals = usage.setdefault(category, {'bytes': 0, 'entries': 0, 'pinned': 0})
+            totals['bytes'] += entry.size
+            totals['entries'] += 1
+            if entry.refcount > 0:
+                totals['pinned'] += 1
+        return usage
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters, resident asset count and memory use."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'used_bytes': self.used_bytes,
+            'budget_bytes': self.budget_bytes
+        }
+
+    def stage(self, category: str, key: Hashable, value: Any) -> None:
+        """Hand over an asset decoded on a worker thread.
+
+        Args:
+            category: Asset category, e.g. 'images'.
+            key: Key of the asset inside its category.
+            value: The decoded, not yet display-converted asset.
+        """
+        with self.staged_lock:
+            self.staged[(category, key)] = value
+
+    def take_staged(self, category: str, key: Hashable) -> Optional[Any]:
+        """Remove and return a staged asset, or None if none is waiting."""
+        with self.staged_lock:
+            return self.staged.pop((category, key), None)
+
+    def is_staged(self, category: str, key: Hashable) -> bool:
+        """Check whether a prefetched asset is waiting to be taken."""
+        with self.staged_lock:
+            return (category, key) in self.staged
+
+    def contains(self, category: str, key: Hashable) -> bool:
+        """Check whether an asset is resident without touching counters."""
+        return (category, key) in self.entries
+
+    def clear_staged(self) -> None:
+        """Drop prefetched assets nobody picked up."""
+        with self.staged_lock:
+            self.staged.clear()
+
+    def clear(self) -> None:
+        """Drop every asset and reset the counters."""
+        self.clear_staged()
+        self.entries.clear()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _enforce_budget(self) -> None:
+        """Evict unreferenced assets, oldest first, until within budget."""
+        if self.used_bytes <= self.budget_bytes:
+            return
+        for cache_key in list(self.entries):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            entry = self.entries[cache_key]
+            if entry.refcount > 0:
+                continue
+            del self.entries[cache_key]
+            self.used_bytes -= entry.size
+            self.evictions += 1
+
+_shared_cache = AssetCache()
+
+def get_asset_cache() -> AssetCache:
+    """Get the process-wide asset cache."""
+    return _shared_cache
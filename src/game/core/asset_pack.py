@@ -0,0 +1,278 @@
+"""
+Asset Pack
+Single-file, indexed archive of the assets tree that is read through mmap,
+so scenes load from one open file instead of many small ones.
+
+Pack layout:
+    8 bytes   magic b'LDSPACK1'
+    4 bytes   little-endian length of the JSON index
+    n bytes   UTF-8 JSON index: name -> {offset, length, format, ...}
+    ...       asset data at the offsets given in the index
+
+Run `python -m src.game.core.asset_pack` from the project root to build
+cache/assets.pack from the assets directory.
+"""
+
+import hashlib
+import io
+import json
+import mmap
+import struct
+import wave
+from pathlib import Path
+from typing import Dict, Optional, Union
+import numpy as np
+import pygame
+
+MAGIC = b'LDSPACK1'
+HEADER = struct.Struct('<8sI')
+DEFAULT_PACK_PATH = 'cache/assets.pack'
+
+class MemoryReader(io.RawIOBase):
+    """Seekable file object over a memoryview, so decoders read straight
+    from the mapped pack without copying the asset first."""
+
+    def __init__(self, view: memoryview):
+        """Initialize the reader.
+
+        Args:
+            view: Bytes of a single asset.
+        """
+        super().__init__()
+        self.view = view
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self.view) - self.position)
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, min(offset, len(self.view)))
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+class AssetPack:
+    """Read-only view of a pack file mapped into memory."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open and map a pack file.
+
+        Args:
+            path: Path to the pack.
+
+        Raises:
+            ValueError: If the file is not an asset pack.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(self._map, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+        magic, index_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not an asset pack")
+        index_start = HEADER.size
+        self.index: Dict[str, Dict] = json.loads(
+            bytes(self._map[index_start:index_start + index_length]).decode('utf-8')
+        )
+        self._view = memoryview(self._map)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def view(self, name: str) -> memoryview:
+        """Get a zero-copy slice of an asset's bytes.
+
+        Args:
+            name: Asset path relative to the assets directory.
+        """
+        entry = self.index[name]
+        return self._view[entry['offset']:entry['offset'] + entry['length']]
+
+    def load_image(self, name: str) -> pygame.Surface:
+        """Decode an image straight from the mapped pack.
+
+        Args:
+            name: Image path relative to the assets directory.
+        """
+        with self.view(name) as view:
+            return pygame.image.load(MemoryReader(view), name)
+
+    def load_sound(self, name: str) -> pygame.mixer.Sound:
+        """Create a sound from the mapped pack.
+
+        Sounds stored as raw PCM in the mixer's format are handed to the
+        mixer as a buffer slice; anything else is decoded as a file.
+
+        Args:
+            name: Sound path relative to the assets directory.
+        """
+        entry = self.index[name]
+        if entry['format'] == 'pcm':
+            if pygame.mixer.get_init() == tuple(entry['mixer']):
+                return pygame.mixer.Sound(buffer=self.view(name))
+            return pygame.mixer.Sound(file=io.BytesIO(_pcm_to_wav(self.view(name), entry['mixer'])))
+        return pygame.mixer.Sound(file=MemoryReader(self.view(name)))
+
+    def close(self) -> None:
+        """Unmap and close the pack.
+
+        If slices from view() are still alive, e.g. held by sounds created
+        from the pack, the mapping stays until the last of them is freed.
+        """
+        try:
+            if hasattr(self, '_view'):
+                self._view.release()
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+def _pcm_to_wav(pcm: memoryview, mixer: list) -> bytes:
+    """Wrap raw PCM in a WAV header for mixers with a different format."""
+    frequency, sample_format, channels = mixer
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(abs(sample_format) // 8)
+        wav.setframerate(frequency)
+        wav.writeframes(pcm)
+    return output.getvalue()
+
+def _wav_to_pcm(path: Path, frequency: int, channels: int) -> Optional[bytes]:
+    """Convert a 16-bit WAV file to interleaved PCM in the target layout.
+
+    Returns:
+        The PCM bytes, or None if the file needs resampling or is not
+        16-bit, in which case it is packed as-is.
+    """
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getsampwidth() != 2 or wav.getframerate() != frequency:
+            return None
+        source_channels = wav.getnchannels()
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype='<i2')
+    samples = samples.reshape(-1, source_channels)
+    if source_channels == 1 and channels > 1:
+        samples = np.repeat(samples, channels, axis=1)
+    elif source_channels != channels:
+        return None
+    return samples.astype('<i2').tobytes()
+
+def build_pack(assets_dir: str = 'assets', output_path: str = DEFAULT_PACK_PATH,
+               metadata_path: str = 'assets/metadata.json') -> Path:
+    """Build a pack from every file in the assets tree.
+
+    WAV sounds are converted to raw PCM in the layout given by the
+    "sounds" rules of the asset metadata (the mixer's default format), so
+    the mixer can take them as a buffer without parsing. Images are
+    indexed with the SHA-1 of their bytes and, for PNGs, their size, so
+    baked copies can be found without reading the image.
+
+    Args:
+        assets_dir: Root directory of the assets.
+        output_path: Path of the pack to write.
+        metadata_path: Path to the asset metadata file.
+
+    Returns:
+        Path: Path of the written pack.
+    """
+    from .asset_baker import png_size  # asset_baker imports this module
+
+    with open(metadata_path, encoding='utf-8') as f:
+        sound_rules = json.load(f).get('sounds', {}).get('optimization', {})
+    frequency = sound_rules.get('sample_rate', 44100)
+    channels = sound_rules.get('channels', 2)
+
+    root = Path(assets_dir)
+    blobs = []
+    index: Dict[str, Dict] = {}
+    for path in sorted(p for p in root.rglob('*') if p.is_file()):
+        name = path.relative_to(root).as_posix()
+        entry = {'format': path.suffix.lower().lstrip('.')}
+        data = None
+        if entry['format'] == 'wav':
+            data = _wav_to_pcm(path, frequency, channels)
+            if data is not None:
+                entry = {'format': 'pcm', 'mixer': [frequency, -16, channels]}
+        if data is None:
+            data = path.read_bytes()
+            entry['sha1'] = hashlib.sha1(data).hexdigest()
+            size = png_size(data[:24])
+            if size is not None:
+                entry['size'] = list(size)
+        entry['length'] = len(data)
+        index[name] = entry
+        blobs.append((name, data))
+
+    # Offsets depend on the index size, which depends on the offsets;
+    # reserve room for them and pad the index to a stable length.
+    for entry in index.values():
+        entry['offset'] = 0
+    index_length = len(json.dumps(index, ensure_ascii=False).encode('utf-8')) + 16 * len(index)
+    offset = HEADER.size + index_length
+    for name, data in blobs:
+        index[name]['offset'] = offset
+        offset += len(data)
+    index_bytes = json.dumps(index, ensure_ascii=False).encode('utf-8').ljust(index_length)
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, index_length))
+        f.write(index_bytes)
+        for _, data in blobs:
+            f.write(data)
+    return output
+
+_active_pack: Optional[AssetPack] = None
+
+def open_asset_pack(path: Union[str, Path] = DEFAULT_PACK_PATH) -> Optional[AssetPack]:
+    """Open a pack and make ResourceManager read assets from it.
+
+    Args:
+        path: Path to the pack.
+
+    Returns:
+        The opened pack, or None if the file does not exist.
+    """
+    global _active_pack
+    if not Path(path).exists():
+        return None
+    close_asset_pack()
+    _active_pack = AssetPack(path)
+    return _active_pack
+
+def close_asset_pack() -> None:
+    """Close the active pack; assets are read from loose files again."""
+    global _active_pack
+    if _active_pack is not None:
+        _active_pack.close()
+        _active_pack = None
+
+def get_asset_pack() -> Optional[AssetPack]:
+    """Get the active pack, if one is open."""
+    return _active_pack
+
+def main() -> None:
+    """Build the asset pack from the command line."""
+    output = build_pack()
+    print(f"Wrote {output} ({output.stat().st_size // 1024} KB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Dirty Rectangles
+Tracks which screen regions a scene changed so only those are redrawn and
+pushed to the display.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+import pygame
+
+class DirtyRectTracker:
+    """Collects the regions of the screen that need redrawing this frame."""
+
+    def __init__(self, screen_size: Tuple[int, int] = (1280, 720)):
+        """Initialize the tracker with a pending full redraw.
+
+        Args:
+            screen_size: Size of the screen the rects are clipped to.
+        """
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.rects: List[pygame.Rect] = []
+        self.sprites: Dict[Hashable, pygame.Rect] = {}
+        self.full_redraw = True
+
+    def mark(self, rect: pygame.Rect) -> None:
+        """Mark a region as changed.
+
+        Args:
+            rect: The changed region in screen coordinates.
+        """
+        self.rects.append(pygame.Rect(rect))
+
+    def track(self, key: Hashable, rect: pygame.Rect) -> None:
+        """Report where a moving sprite is drawn this frame.
+
+        When the sprite moved, both its old and new area are marked, so
+        the background is restored where it used to be.
+
+        Args:
+            key: Identifier of the sprite.
+            rect: Area the sprite now covers.
+        """
+        previous = self.sprites.get(key)
+        if previous == rect:
+            return
+        if previous is not None:
+            self.rects.append(previous)
+        self.rects.append(pygame.Rect(rect))
+        self.sprites[key] = pygame.Rect(rect)
+
+    def untrack(self, key: Hashable) -> None:
+        """Stop tracking a sprite and mark the area it covered."""
+        previous = self.sprites.pop(key, None)
+        if previous is not None:
+            self.rects.append(previous)
+
+    def invalidate(self) -> None:
+        """Request a redraw of the whole screen."""
+        self.full_redraw = True
+
+    def collect(self) -> Optional[List[pygame.Rect]]:
+        """Take the regions to redraw and reset for the next frame.
+
+        Returns:
+            Merged, screen-clipped rects, or None if the whole screen
+            must be redrawn.
+        """
+        rects, self.rects = self.rects, []
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.clip(self.screen_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            # Fold overlapping rects together so no pixel is drawn twice
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
@@ -0,0 +1,114 @@
+"""
+Event Batcher
+Pre-processes each frame's pygame events before dispatch: runs of mouse
+motion are coalesced and held-key repeats collapsed, and a per-frame input
+snapshot is produced, so input cost no longer scales with device rate.
+"""
+
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, List, Set, Tuple
+import pygame
+
+@dataclass(frozen=True)
+class InputSnapshot:
+    """State of the pointer and keyboard at the end of a frame's events."""
+    frame: int
+    mouse_pos: Tuple[int, int] = (0, 0)
+    mouse_rel: Tuple[int, int] = (0, 0)  # Total movement this frame
+    mouse_buttons: FrozenSet[int] = field(default_factory=frozenset)
+    keys_down: FrozenSet[int] = field(default_factory=frozenset)
+
+    @property
+    def moved(self) -> bool:
+        """Whether the pointer moved this frame."""
+        return self.mouse_rel != (0, 0)
+
+class EventBatcher:
+    """Coalesces a frame's events and tracks the input snapshot."""
+
+    def __init__(self, mouse_pos: Tuple[int, int] = (0, 0)):
+        """Initialize the batcher.
+
+        Args:
+            mouse_pos: Pointer position before the first event arrives.
+        """
+        self.frame = 0
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons: Set[int] = set()
+        self.keys_down: Set[int] = set()
+
+    def coalesce(self, events: Iterable[pygame.event.Event]) -> List[pygame.event.Event]:
+        """Merge redundant events while keeping the order of the rest.
+
+        Consecutive MOUSEMOTION events become one event with the last
+        position and buttons and the summed rel; motion is never merged
+        across another event, so clicks still see the position they
+        happened at. A KEYDOWN for a key that is already held (an OS key
+        repeat) is dropped.
+
+        Args:
+            events: The frame's events, oldest first.
+
+        Returns:
+            List[pygame.event.Event]: The events to dispatch.
+        """
+        result: List[pygame.event.Event] = []
+        held = set(self.keys_down)
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                previous = result[-1] if result else None
+                if previous is not None and previous.type == pygame.MOUSEMOTION:
+                    rel = getattr(previous, 'rel', (0, 0))
+                    extra = getattr(event, 'rel', (0, 0))
+                    result[-1] = pygame.event.Event(pygame.MOUSEMOTION, {
+                        'pos': event.pos,
+                        'rel': (rel[0] + extra[0], rel[1] + extra[1]),
+                        'buttons': getattr(event, 'buttons', (0, 0, 0)),
+                    })
+                    continue
+            elif event.type == pygame.KEYDOWN:
+                if event.key in held:
+                    continue
+                held.add(event.key)
+            elif event.type == pygame.KEYUP:
+                held.discard(event.key)
+            result.append(event)
+        return result
+
+    def process(self, events: Iterable[pygame.event.Event]) -> Tuple[List[pygame.event.Event], InputSnapshot]:
+        """Coalesce a frame's events and build its input snapshot.
+
+        Args:
+            events: The frame's events, e.g. from pygame.event.get().
+
+        Returns:
+            The events to dispatch and the frame's input snapshot.
+        """
+        events = self.coalesce(events)
+        rel_x = rel_y = 0
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                self.mouse_pos = event.pos
+                rel = getattr(event, 'rel', (0, 0))
+                rel_x += rel[0]
+                rel_y += rel[1]
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.mouse_pos = event.pos
+                self.mouse_buttons.add(event.button)
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self.mouse_pos = event.pos
+                self.mouse_buttons.discard(event.button)
+            elif event.type == pygame.KEYDOWN:
+                self.keys_down.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.keys_down.discard(event.key)
+
+        snapshot = InputSnapshot(
+            frame=self.frame,
+            mouse_pos=tuple(self.mouse_pos),
+            mouse_rel=(rel_x, rel_y),
+            mouse_buttons=frozenset(self.mouse_buttons),
+            keys_down=frozenset(self.keys_down),
+        )
+        self.frame += 1
+        return events, snapshot
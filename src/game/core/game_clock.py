@@ -0,0 +1,66 @@
+"""
+Game Clock
+Fixed-timestep simulation clock. Real frame time is accumulated and spent
+in whole simulation steps, so gameplay speed does not depend on how fast
+frames are rendered.
+"""
+
+from typing import Iterator
+
+class GameClock:
+    """Authoritative simulation time advanced in fixed steps."""
+
+    def __init__(self, step: float = 1.0 / 60.0, max_frame_time: float = 0.25):
+        """Initialize the clock.
+
+        Args:
+            step: Length of one simulation step in seconds.
+            max_frame_time: Longest frame time that is simulated; anything
+                beyond it (e.g. after a stall) is dropped rather than
+                caught up, so one slow frame cannot snowball.
+        """
+        self.step = step
+        self.max_frame_time = max_frame_time
+        self.time = 0.0  # Simulation seconds since the clock started
+        self.steps_run = 0
+        self.accumulator = 0.0
+
+    def advance(self, frame_time: float) -> Iterator[float]:
+        """Spend a frame's real time in fixed simulation steps.
+
+        The clock's time is moved forward before each step is yielded, so
+        code running during the step reads the time it simulates.
+
+        Args:
+            frame_time: Real seconds since the previous frame.
+
+        Yields:
+            float: The step length, once per simulation step due.
+        """
+        self.accumulator += min(frame_time, self.max_frame_time)
+        while self.accumulator >= self.step:
+            self.accumulator -= self.step
+            self.time += self.step
+            self.steps_run += 1
+            yield self.step
+
+    @property
+    def alpha(self) -> float:
+        """How far, from 0 to 1, rendering is between the last step and the next.
+
+        Renderers can interpolate between previous and current positions
+        with this to keep motion smooth when frame and step rates differ.
+        """
+        return self.accumulator / self.step
+
+    def reset(self) -> None:
+        """Restart simulation time from zero."""
+        self.time = 0.0
+        self.steps_run = 0
+        self.accumulator = 0.0
+
+_game_clock = GameClock()
+
+def get_game_clock() -> GameClock:
+    """Get the game's simulation clock."""
+    return _game_clock
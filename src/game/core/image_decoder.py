@@ -0,0 +1,39 @@
+"""
+Image Decoder
+Pillow-based image decoding that runs in worker processes. Kept free of
+pygame imports so worker start-up stays cheap.
+"""
+
+import io
+from typing import Tuple, Union
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; callers fall back to pygame
+    Image = None
+
+# (pixel format, (width, height), raw pixel bytes) as accepted by
+# pygame.image.frombuffer
+DecodedImage = Tuple[str, Tuple[int, int], bytes]
+
+def pillow_available() -> bool:
+    """Check whether Pillow can be used for decoding."""
+    return Image is not None
+
+def decode_image(source: Union[str, bytes]) -> DecodedImage:
+    """Decode an image to raw pixels at its full size.
+
+    Scaling is left to the caller so every load path resamples with the
+    same filter and baked copies do not depend on which path made them.
+
+    Args:
+        source: Path to the image file, or its encoded bytes.
+
+    Returns:
+        DecodedImage: Pixel format ('RGB' or 'RGBA'), size and pixel bytes.
+    """
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        mode = 'RGBA' if has_alpha else 'RGB'
+        image = image.convert(mode)
+        return mode, image.size, image.tobytes()
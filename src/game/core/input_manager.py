@@ -3,9 +3,11 @@ Input Manager
 Handles user input and interactions.
 """
 
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, Hashable, List, Optional, Tuple
 import pygame
 
+from .spatial_index import SpatialIndex
+
 class InputManager:
     def __init__(self):
         """Initialize the input manager."""
@@ -14,8 +16,9 @@ class InputManager:
         self.mouse_pos = (0, 0)
         self.mouse_clicked = False
         self.mouse_released = False
-        self.hotspots: Dict[str, pygame.Rect] = {}
-        self.active_hotspot: Optional[str] = None
+        self.hotspots: Dict[Hashable, pygame.Rect] = {}
+        self.hotspot_index = SpatialIndex()
+        self.active_hotspot: Optional[Hashable] = None
         
     def bind_key(self, key: int, callback: Callable) -> None:
         """Bind a key to a callback function."""
@@ -25,14 +28,33 @@ class InputManager:
         """Bind a mouse button to a callback function."""
         self.mouse_bindings[button] = callback
         
-    def add_hotspot(self, name: str, rect: pygame.Rect) -> None:
-        """Add an interactive hotspot."""
+    def add_hotspot(self, name: Hashable, rect: pygame.Rect, z: int = 0) -> None:
+        """Add an interactive hotspot.
+        
+        Args:
+            name: Identifier of the hotspot.
+            rect: Screen area of the hotspot.
+            z: Priority when hotspots overlap; higher wins, and equal
+                priorities go to the hotspot added first.
+        """
         self.hotspots[name] = rect
+        self.hotspot_index.add(name, rect, z)
         
-    def remove_hotspot(self, name: str) -> None:
+    def remove_hotspot(self, name: Hashable) -> None:
         """Remove an interactive hotspot."""
         if name in self.hotspots:
             del self.hotspots[name]
+            self.hotspot_index.remove(name)
+            
+    def move_hotspot(self, name: Hashable, rect: pygame.Rect) -> None:
+        """Update the area of a moving hotspot."""
+        if name in self.hotspots:
+            self.hotspots[name] = rect
+            self.hotspot_index.move(name, rect)
+            
+    def hotspots_at(self, pos: Tuple[int, int]) -> List[Hashable]:
+        """Get the hotspots under a point, highest priority first."""
+        return self.hotspot_index.query_point(pos)
             
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle input events."""
@@ -54,17 +76,13 @@ class InputManager:
             
     def _update_active_hotspot(self) -> None:
         """Update the currently active hotspot based on mouse position."""
-        self.active_hotspot = None
-        for name, rect in self.hotspots.items():
-            if rect.collidepoint(self.mouse_pos):
-                self.active_hotspot = name
-                break
+        self.active_hotspot = self.hotspot_index.top_at(self.mouse_pos)
                 
-    def is_hotspot_active(self, name: str) -> bool:
+    def is_hotspot_active(self, name: Hashable) -> bool:
         """Check if a hotspot is currently active."""
         return self.active_hotspot == name
         
-    def get_active_hotspot(self) -> Optional[str]:
+    def get_active_hotspot(self) -> Optional[Hashable]:
         """Get the name of the currently active hotspot."""
         return self.active_hotspot
         
@@ -0,0 +1,129 @@
+"""
+Layer Compositor
+Flattens a scene's static backdrop layers into one cached opaque surface
+and draws animated layers over it each frame.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import pygame
+
+# A layer is drawn from a surface, or by a function drawing onto the target
+LayerSource = Union[pygame.Surface, Callable[[pygame.Surface], None]]
+
+@dataclass
+class Layer:
+    """A single compositor layer."""
+    name: str
+    source: LayerSource
+    position: Tuple[int, int] = (0, 0)
+    static: bool = True
+    visible: bool = True
+
+    def draw(self, target: pygame.Surface) -> None:
+        """Draw the layer onto a surface."""
+        if isinstance(self.source, pygame.Surface):
+            target.blit(self.source, self.position)
+        else:
+            self.source(target)
+
+class LayerCompositor:
+    """Composites a stack of static and animated layers.
+
+    Static layers are flattened, in the order they were added, into a
+    single opaque surface that is only rebuilt after invalidate(). Animated
+    layers are drawn on top of that, in order, every frame.
+    """
+
+    def __init__(self, size: Tuple[int, int] = (1280, 720)):
+        """Initialize the compositor.
+
+        Args:
+            size: Size of the composited backdrop.
+        """
+        self.size = size
+        self.layers: List[Layer] = []
+        self._by_name: Dict[str, Layer] = {}
+        self._cache: Optional[pygame.Surface] = None
+
+    def add_static(self, name: str, source: LayerSource,
+                   position: Tuple[int, int] = (0, 0), visible: bool = True) -> None:
+        """Add a layer that only changes when invalidated.
+
+        Args:
+            name: Unique name of the layer.
+            source: Surface to blit, or function drawing onto the backdrop.
+            position: Where a surface source is blitted.
+            visible: Whether the layer is drawn.
+        """
+        self._add(Layer(name, source, position, static=True, visible=visible))
+        self.invalidate()
+
+    def add_animated(self, name: str, source: LayerSource,
+                     position: Tuple[int, int] = (0, 0), visible: bool = True) -> None:
+        """Add a layer that is drawn every frame over the static backdrop.
+
+        Args:
+            name: Unique name of the layer.
+            source: Surface to blit, or function drawing onto the screen.
+            position: Where a surface source is blitted.
+            visible: Whether the layer is drawn.
+        """
+        self._add(Layer(name, source, position, static=False, visible=visible))
+
+    def _add(self, layer: Layer) -> None:
+        if layer.name in self._by_name:
+            raise ValueError(f"Layer '{layer.name}' already exists")
+        self.layers.append(layer)
+        self._by_name[layer.name] = layer
+
+    def get(self, name: str) -> Layer:
+        """Get a layer by name."""
+        return self._by_name[name]
+
+    def set_visible(self, name: str, visible: bool) -> None:
+        """Show or hide a layer, rebuilding the backdrop if it is static."""
+        layer = self._by_name[name]
+        if layer.visible != visible:
+            layer.visible = visible
+            if layer.static:
+                self.invalidate()
+
+    def set_alpha(self, name: str, alpha: int) -> None:
+        """Set the opacity of a surface layer without copying it."""
+        source = self._by_name[name].source
+        if isinstance(source, pygame.Surface):
+            source.set_alpha(alpha)
+
+    def invalidate(self) -> None:
+        """Rebuild the static backdrop before the next render."""
+        self._cache = None
+
+    def _flatten(self) -> pygame.Surface:
+        """Draw every visible static layer into an opaque surface."""
+        cache = pygame.Surface(self.size)
+        if pygame.display.get_surface():
+            cache = cache.convert()
+        for layer in self.layers:
+            if layer.static and layer.visible:
+                layer.draw(cache)
+        return cache
+
+    def render(self, screen: pygame.Surface) -> None:
+        """Draw the backdrop and animated layers.
+
+        Args:
+            screen: The pygame surface to render to.
+        """
+        if self._cache is None:
+            self._cache = self._flatten()
+        screen.blit(self._cache, (0, 0))
+        for layer in self.layers:
+            if not layer.static and layer.visible:
+                layer.draw(screen)
+
+    def clear(self) -> None:
+        """Remove all layers and the cached backdrop."""
+        self.layers.clear()
+        self._by_name.clear()
+        self._cache = None
@@ -0,0 +1,115 @@
+"""
+Logging Setup
+Routes log records through a bounded queue to a background listener so
+file and console writes never block the game loop, and rate-limits
+errors that repeat every frame.
+"""
+
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+class RateLimitFilter(logging.Filter):
+    """Suppresses repeats of the same warning or error within an interval.
+
+    When a suppressed message is next let through, it notes how many
+    repeats were dropped in between.
+    """
+
+    def __init__(self, interval: float = 5.0, min_level: int = logging.WARNING, max_keys: int = 1024):
+        """Initialize the filter.
+
+        Args:
+            interval: Seconds during which an identical message is logged once.
+            min_level: Records below this level always pass.
+            max_keys: Number of distinct messages tracked before the oldest
+                are forgotten.
+        """
+        super().__init__()
+        self.interval = interval
+        self.min_level = min_level
+        self.max_keys = max_keys
+        # (logger, level, message) -> (time last let through, repeats dropped since)
+        self._seen: Dict[Tuple[str, int, str], Tuple[float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level:
+            return True
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        last, dropped = self._seen.get(key, (None, 0))
+        if last is not None and now - last < self.interval:
+            self._seen[key] = (last, dropped + 1)
+            return False
+        if dropped:
+            record.msg = f"{record.getMessage()} (repeated {dropped} more times)"
+            record.args = None
+        self._seen.pop(key, None)
+        self._seen[key] = (now, 0)
+        if len(self._seen) > self.max_keys:
+            del self._seen[next(iter(self._seen))]
+        return True
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_listener: Optional[QueueListener] = None
+
+def setup_logging(log_path: str = 'game.log', level: int = logging.INFO,
+                  queue_size: int = 1000, repeat_interval: float = 5.0) -> QueueListener:
+    """Configure the root logger to log asynchronously.
+
+    Args:
+        log_path: File the log is written to, besides the console.
+        level: Minimum level logged.
+        queue_size: Records buffered before new ones are dropped.
+        repeat_interval: Seconds an identical warning or error is
+            suppressed for after being logged.
+
+    Returns:
+        QueueListener: The started listener writing the records.
+    """
+    global _listener
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_path), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = BoundedQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(repeat_interval))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,179 @@
+"""
+Profiler
+Lightweight frame profiler. Named timing spans are recorded per frame into
+a ring buffer that can be summarized on screen or dumped as a Chrome trace
+(load it in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Tuple, Union
+
+@dataclass
+class Span:
+    """A timed region of code."""
+    name: str
+    start: float  # perf_counter seconds
+    end: float
+    thread: int
+
+@dataclass
+class FrameRecord:
+    """Spans recorded during one frame."""
+    start: float
+    end: float = 0.0
+    spans: List[Span] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000.0
+
+class _NullSpan:
+    """Context manager used while profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+_NULL_SPAN = _NullSpan()
+
+class _ActiveSpan:
+    """Context manager timing one span."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, self.start, time.perf_counter())
+
+class Profiler:
+    """Records timing spans per frame while enabled."""
+
+    def __init__(self, capacity: int = 300):
+        """Initialize the profiler.
+
+        Args:
+            capacity: Number of most recent frames kept.
+        """
+        self.enabled = False
+        self.frames: Deque[FrameRecord] = deque(maxlen=capacity)
+        self._current = FrameRecord(time.perf_counter())
+        self._lock = threading.Lock()
+        self._epoch = time.perf_counter()
+
+    def span(self, name: str) -> Union[_ActiveSpan, _NullSpan]:
+        """Time a block of code: `with profiler.span("scene.render"): ...`
+
+        Costs a single attribute check while profiling is off.
+
+        Args:
+            name: Name the span is reported under.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, name)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Record a finished span; safe to call from worker threads."""
+        with self._lock:
+            self._current.spans.append(Span(name, start, end, threading.get_ident()))
+
+    def begin_frame(self) -> None:
+        """Start recording a new frame."""
+        if self.enabled:
+            with self._lock:
+                self._current = FrameRecord(time.perf_counter(), spans=self._current.spans)
+
+    def end_frame(self) -> None:
+        """Finish the current frame and add it to the ring buffer."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._current.end = time.perf_counter()
+            self.frames.append(self._current)
+            self._current = FrameRecord(self._current.end)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Turn recording on or off, discarding frames from a previous run."""
+        if enabled and not self.enabled:
+            self.frames.clear()
+            self._current = FrameRecord(time.perf_counter())
+        self.enabled = enabled
+
+    def frame_times(self) -> List[float]:
+        """Get recorded frame durations in milliseconds, oldest first."""
+        return [frame.duration_ms for frame in self.frames]
+
+    def top_spans(self, count: int = 5, frames: int = 60) -> List[Tuple[str, float]]:
+        """Get the spans with the highest average cost per frame.
+
+        Args:
+            count: Number of spans to return.
+            frames: Number of most recent frames to average over.
+
+        Returns:
+            List[Tuple[str, float]]: (name, milliseconds per frame) pairs.
+        """
+        recent = list(self.frames)[-frames:]
+        if not recent:
+            return []
+        totals: Dict[str, float] = {}
+        for frame in recent:
+            for span in frame.spans:
+                totals[span.name] = totals.get(span.name, 0.0) + (span.end - span.start)
+        ranked = sorted(totals.items(), key=lambda item: -item[1])[:count]
+        return [(name, total * 1000.0 / len(recent)) for name, total in ranked]
+
+    def to_chrome_trace(self) -> Dict[str, list]:
+        """Convert the recorded frames to Chrome trace event format."""
+        events = []
+        for number, frame in enumerate(self.frames):
+            events.append(self._event(f"frame {number}", frame.start, frame.end,
+                                      threading.main_thread().ident))
+            for span in frame.spans:
+                events.append(self._event(span.name, span.start, span.end, span.thread))
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def _event(self, name: str, start: float, end: float, thread: int) -> Dict:
+        return {
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self._epoch) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': 0,
+            'tid': thread,
+        }
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """Write the recorded frames as a Chrome trace JSON file.
+
+        Args:
+            path: Output file path.
+
+        Returns:
+            Path: The written file.
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return output
+
+_profiler = Profiler()
+
+def get_profiler() -> Profiler:
+    """Get the game's profiler."""
+    return _profiler
@@ -3,17 +3,80 @@ Resource Manager
 Handles loading and caching of game assets.
 """
 
+import multiprocessing
 import os
-from typing import Dict, Optional, Tuple
+from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import pygame
 
+from .asset_cache import AssetCache, get_asset_cache
+from .asset_baker import AssetBaker, Target, scale_surface, scaled_size
+from .texture_atlas import TextureAtlas, logical_name
+from .asset_pack import get_asset_pack
+from .image_decoder import decode_image, pillow_available
+from .profiler import get_profiler
+
+# Built by texture_atlas.py; only read at run time
+ATLASES_PATH = 'cache/atlases'
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Get the worker thread used to read and decode assets ahead of time."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="asset-prefetch"
+        )
+    return _prefetch_executor
+
+# Scene batches are a handful of images; more workers only cost start-up
+MAX_DECODE_WORKERS = 4
+
+_decode_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_decode_pool() -> ProcessPoolExecutor:
+    """Get the process pool used to decode batches of images in parallel.
+    
+    Workers are started from a fork server (or spawned where there is
+    none) rather than forked from the game, whose logging and prefetch
+    threads may hold locks at fork time. They start on demand, so a small
+    batch only starts as many workers as it has images.
+    """
+    global _decode_pool
+    if _decode_pool is None:
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        _decode_pool = ProcessPoolExecutor(
+            max_workers=min(MAX_DECODE_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(start_method)
+        )
+    return _decode_pool
+
+def shutdown_decode_pool() -> None:
+    """Stop the image decoding worker processes."""
+    global _decode_pool
+    if _decode_pool is not None:
+        _decode_pool.shutdown(cancel_futures=True)
+        _decode_pool = None
+
 class ResourceManager:
-    def __init__(self):
-        """Initialize the resource manager."""
-        self.images: Dict[str, pygame.Surface] = {}
+    def __init__(self, cache: Optional[AssetCache] = None):
+        """Initialize the resource manager.
+
+        Args:
+            cache: Asset cache to load through. Defaults to the shared
+                process-wide cache so scenes and entities reuse decoded assets.
+        """
+        self.cache = cache or get_asset_cache()
+        self.baker = AssetBaker()
+        
+        # Assets this manager holds a cache reference to
+        self.images: Dict[Tuple[str, Target], pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.music: Dict[str, str] = {}
         self.fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+        self.atlases: Dict[str, Optional[TextureAtlas]] = {}
         
         # Base paths for different asset types
         self.base_paths = {
@@ -23,45 +86,271 @@ class ResourceManager:
             'sounds': 'assets/sounds',
             'music': 'assets/music',
             'fonts': 'assets/fonts',
-            'items': 'assets/items'  # Add items path
+            'items': 'assets/items',  # Add items path
         }
         
         # Create asset directories if they don't exist
         for path in self.base_paths.values():
             os.makedirs(path, exist_ok=True)
+        self.base_paths['atlases'] = ATLASES_PATH
+            
+    def load_image(
+        self,
+        filename: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None
+    ) -> pygame.Surface:
+        """Load and cache an image.
+        
+        Scaled images are served from the baked on-disk cache when a copy
+        exists, and baked on first use otherwise.
+        
+        Args:
+            filename: Image path relative to the assets directory.
+            scale: Optional uniform scale factor.
+            size: Optional exact (width, height); takes precedence over scale.
+            
+        Returns:
+            pygame.Surface: The display-converted image.
+        """
+        key = (filename, tuple(size) if size else scale)
+        if key in self.images:
+            return self.images[key]
             
-    def load_image(self, filename: str, scale: Optional[float] = None) -> pygame.Surface:
-        """Load and cache an image."""
-        if filename in self.images:
-            return self.images[filename]
+        image = self.cache.acquire('images', key)
+        if image is not None:
+            self.images[key] = image
+            return image
             
         try:
-            # Determine the correct base path based on the filename
-            base_path = 'assets'  # All assets are under the assets directory
-            
-            image = pygame.image.load(os.path.join(base_path, filename))
-            if scale:
-                new_size = (int(image.get_width() * scale), int(image.get_height() * scale))
-                image = pygame.transform.scale(image, new_size)
-            self.images[filename] = image
+            # Use the copy prepared by the prefetch worker if there is one
+            image = self.cache.take_staged('images', key)
+            if image is None:
+                image = self._load_source_image(*key)
+            image = self._convert_for_display(image)
+            image = self.cache.insert('images', key, image)
+            self.images[key] = image
             return image
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading image {filename}: {e}")
             return self._get_error_surface()
             
+    def load_images(
+        self,
+        images: Iterable[Union[str, Tuple[str, Target]]]
+    ) -> List[pygame.Surface]:
+        """Load a batch of images, decoding cache misses in parallel.
+        
+        Images that are neither cached, prefetched nor baked are decoded
+        with Pillow in a process pool. The raw pixel buffers come back to
+        the main thread, where they are wrapped with frombuffer(), scaled
+        with the same filter as single loads and converted for display,
+        so load time scales with core count instead of batch size.
+        
+        Args:
+            images: Image filenames relative to the assets directory, or
+                (filename, target) pairs where target is the scale factor
+                or (width, height) to load the image at.
+                
+        Returns:
+            List[pygame.Surface]: The images, in request order.
+        """
+        with get_profiler().span("resources.load_images"):
+            return self._load_images(images)
+            
+    def _load_images(
+        self,
+        images: Iterable[Union[str, Tuple[str, Target]]]
+    ) -> List[pygame.Surface]:
+        """Body of load_images()."""
+        keys = [
+            (entry, None) if isinstance(entry, str) else (entry[0], entry[1])
+            for entry in images
+        ]
+        
+        # Baked copies are cheaper to read here than to ship to a worker
+        pending = []
+        for key in dict.fromkeys(keys):
+            if (key in self.images or self.cache.contains('images', key)
+                    or self.cache.is_staged('images', key)):
+                continue
+            baked = self.baker.load(*key) if key[1] is not None else None
+            if baked is not None:
+                self.cache.stage('images', key, baked)
+            else:
+                pending.append(key)
+                
+        # A pool only pays off with more than one image and more than one core
+        if len(pending) > 1 and pillow_available() and (os.cpu_count() or 1) > 1:
+            pool = _get_decode_pool()
+            futures = {key: pool.submit(decode_image, self._image_source(key[0])) for key in pending}
+            for key, future in futures.items():
+                try:
+                    pixel_format, size, pixels = future.result()
+                except Exception as e:
+                    print(f"Error decoding image {key[0]}: {e}")
+                    continue
+                image = pygame.image.frombuffer(pixels, size, pixel_format)
+                if key[1] is not None:
+                    image = scale_surface(image, scaled_size(size, key[1]))
+                    self.baker.store(key[0], image)
+                self.cache.stage('images', key, image)
+                
+        return [self.load_image(filename, size=target if isinstance(target, tuple) else None,
+                                scale=target if not isinstance(target, tuple) else None)
+                for filename, target in keys]
+        
+    def load_atlas(self, name: str) -> Optional[TextureAtlas]:
+        """Load and cache a texture atlas built by texture_atlas.py.
+        
+        Args:
+            name: Atlas name, e.g. 'items'.
+            
+        Returns:
+            The atlas, or None if it has not been built.
+        """
+        if name in self.atlases:
+            return self.atlases[name]
+            
+        atlas = self.cache.acquire('atlases', name)
+        if atlas is None:
+            index_path = Path(self.base_paths['atlases']) / f"{name}.json"
+            if not index_path.exists():
+                self.atlases[name] = None
+                return None
+            try:
+                atlas = self.cache.insert('atlases', name, TextureAtlas.load(index_path))
+            except (pygame.error, OSError, ValueError) as e:
+                print(f"Error loading atlas {name}: {e}")
+                self.atlases[name] = None
+                return None
+        self.atlases[name] = atlas
+        return atlas
+        
+    def get_sprite(self, logical_name: str) -> Optional[pygame.Surface]:
+        """Get an atlas sprite by logical name, e.g. 'items/Belt of Truth'.
+        
+        The atlas is chosen by the first path component of the name.
+        
+        Returns:
+            A subsurface of the atlas sheet, or None if no atlas has it.
+        """
+        atlas = self.load_atlas(logical_name.split('/', 1)[0])
+        if atlas is None:
+            return None
+        return atlas.get(logical_name)
+        
+    def load_icon(self, path: str, size: int, persist: bool = True) -> pygame.Surface:
+        """Load a square thumbnail of an image, e.g. an inventory item icon.
+        
+        Icons are made once per (source, size) pair and shared through the
+        asset cache. They are smoothscaled from the item atlas sprite when
+        one exists, otherwise from the baked copy or the decoded source.
+        
+        Args:
+            path: Image path, relative to the assets directory or starting with it.
+            size: Width and height of the icon in pixels.
+            persist: Whether to bake an icon scaled from the source to disk.
+            
+        Returns:
+            pygame.Surface: The display-converted icon.
+            
+        Raises:
+            pygame.error, FileNotFoundError: If the image cannot be loaded.
+        """
+        filename = Path(path).as_posix()
+        if filename.startswith('assets/'):
+            filename = filename[len('assets/'):]
+        key = (filename, (size, size))
+        if key in self.images:
+            return self.images[key]
+            
+        icon = self.cache.acquire('images', key)
+        if icon is None:
+            sprite = self.get_sprite(logical_name(filename))
+            if sprite is not None:
+                icon = scale_surface(sprite, (size, size))
+            elif persist:
+                icon = self._load_source_image(filename, (size, size))
+            else:
+                icon = scale_surface(self._decode_image(filename), (size, size))
+            icon = self.cache.insert('images', key, self._convert_for_display(icon))
+        self.images[key] = icon
+        return icon
+        
     def load_sound(self, filename: str) -> pygame.mixer.Sound:
         """Load and cache a sound effect."""
         if filename in self.sounds:
             return self.sounds[filename]
             
+        sound = self.cache.acquire('sounds', filename)
+        if sound is not None:
+            self.sounds[filename] = sound
+            return sound
+            
         try:
-            sound = pygame.mixer.Sound(os.path.join(self.base_paths['sounds'], filename))
+            sound = self.cache.take_staged('sounds', filename)
+            if sound is None:
+                sound = self._decode_sound(filename)
+            sound = self.cache.insert('sounds', filename, sound)
             self.sounds[filename] = sound
             return sound
         except (pygame.error, FileNotFoundError) as e:
             print(f"Error loading sound {filename}: {e}")
             return self._get_error_sound()
             
+    def prefetch(
+        self,
+        images: Iterable[Union[str, Tuple[str, Target]]] = (),
+        sounds: Iterable[str] = ()
+    ) -> Future:
+        """Read and decode assets on a worker thread ahead of their first use.
+
+        Decoded (and scaled) assets are staged in the cache; the next
+        load_image or load_sound call for them only does the main-thread
+        convert() step. Assets that are already resident or staged are
+        skipped.
+        
+        Args:
+            images: Image filenames relative to the assets directory, or
+                (filename, target) pairs where target is the scale factor
+                or (width, height) the scene loads the image at.
+            sounds: Sound filenames relative to the sounds directory.
+            
+        Returns:
+            Future: Completes once every asset has been staged.
+        """
+        keys = [
+            (entry, None) if isinstance(entry, str) else (entry[0], entry[1])
+            for entry in images
+        ]
+        pending_images = [
+            key for key in dict.fromkeys(keys)
+            if not self.cache.contains('images', key)
+            and not self.cache.is_staged('images', key)
+        ]
+        pending_sounds = [
+            filename for filename in dict.fromkeys(sounds)
+            if not self.cache.contains('sounds', filename)
+            and not self.cache.is_staged('sounds', filename)
+        ]
+        return _get_prefetch_executor().submit(
+            self._decode_ahead, pending_images, pending_sounds
+        )
+        
+    def _decode_ahead(self, images: Iterable[Tuple[str, Target]], sounds: Iterable[str]) -> None:
+        """Worker-thread body of prefetch()."""
+        for filename, target in images:
+            try:
+                self.cache.stage('images', (filename, target), self._load_source_image(filename, target))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error prefetching image {filename}: {e}")
+        for filename in sounds:
+            try:
+                self.cache.stage('sounds', filename, self._decode_sound(filename))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error prefetching sound {filename}: {e}")
+            
     def load_music(self, filename: str) -> None:
         """Load a music track."""
         try:
@@ -76,21 +365,95 @@ class ResourceManager:
         if key in self.fonts:
             return self.fonts[key]
             
+        font = self.cache.acquire('fonts', key)
+        if font is not None:
+            self.fonts[key] = font
+            return font
+            
         try:
             font = pygame.font.Font(os.path.join(self.base_paths['fonts'], name), size)
+            font = self.cache.insert('fonts', key, font)
             self.fonts[key] = font
             return font
         except pygame.error as e:
             print(f"Error loading font {name}: {e}")
             return pygame.font.SysFont('Arial', size)
             
+    def get_memory_usage(self) -> Dict[str, Dict[str, int]]:
+        """Get the shared cache's current memory usage per asset category."""
+        return self.cache.usage()
+        
     def clear_cache(self) -> None:
-        """Clear all cached resources."""
+        """Release every resource this manager holds in the shared cache."""
+        for key in self.images:
+            self.cache.release('images', key)
+        for filename in self.sounds:
+            self.cache.release('sounds', filename)
+        for key in self.fonts:
+            self.cache.release('fonts', key)
+        for name, atlas in self.atlases.items():
+            if atlas is not None:
+                self.cache.release('atlases', name)
+        self.atlases.clear()
         self.images.clear()
         self.sounds.clear()
         self.music.clear()
         self.fonts.clear()
         
+    def _load_source_image(self, filename: str, target: Target) -> pygame.Surface:
+        """Get an image at its target size, not yet display-converted.
+        
+        Uses the baked copy when there is one; otherwise decodes the source,
+        scales it and bakes the result for next time.
+        """
+        with get_profiler().span(f"load_image {filename}"):
+            if target is None:
+                return self._decode_image(filename)
+                
+            image = self.baker.load(filename, target)
+            if image is not None:
+                return image
+                
+            image = self._decode_image(filename)
+            image = scale_surface(image, scaled_size(image.get_size(), target))
+            self.baker.store(filename, image)
+            return image
+        
+    def _decode_image(self, filename: str) -> pygame.Surface:
+        """Decode an image from the asset pack if one is open, else from disk."""
+        pack = get_asset_pack()
+        if pack and filename in pack:
+            return pack.load_image(filename)
+        return pygame.image.load(self._image_path(filename))
+        
+    def _decode_sound(self, filename: str) -> pygame.mixer.Sound:
+        """Create a sound from the asset pack if one is open, else from disk."""
+        with get_profiler().span(f"load_sound {filename}"):
+            pack = get_asset_pack()
+            name = f"sounds/{filename}"
+            if pack and name in pack:
+                return pack.load_sound(name)
+            return pygame.mixer.Sound(os.path.join(self.base_paths['sounds'], filename))
+        
+    def _image_source(self, filename: str) -> Union[str, bytes]:
+        """Get what a decoding worker should read: pack bytes or a file path."""
+        pack = get_asset_pack()
+        if pack and filename in pack:
+            return bytes(pack.view(filename))
+        return self._image_path(filename)
+        
+    def _image_path(self, filename: str) -> str:
+        """Resolve an image filename; all images live under the assets directory."""
+        return os.path.join('assets', filename)
+        
+    def _convert_for_display(self, image: pygame.Surface) -> pygame.Surface:
+        """Convert an image to the display's pixel format for fast blits."""
+        if not pygame.display.get_surface():
+            return image
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+        
     def _get_error_surface(self) -> pygame.Surface:
         """Create a placeholder surface for missing images."""
         surface = pygame.Surface((32, 32))
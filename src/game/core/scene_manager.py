@@ -4,12 +4,26 @@ Handles scene transitions, loading, and state management.
 """
 
 import logging
-from typing import Dict, Optional, Type, Protocol, runtime_checkable
+from collections import OrderedDict
+from concurrent.futures import Future
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Type, Protocol, Union, runtime_checkable
 import pygame
 from pygame.surface import Surface
 
+from .resource_manager import ResourceManager
+from .dirty_rects import DirtyRectTracker
+from .event_batcher import InputSnapshot
+from .profiler import get_profiler
+
 logger = logging.getLogger(__name__)
 
+class Retention(Enum):
+    """What happens to a scene instance when the game leaves it."""
+    DESTROY = "destroy"        # Cleaned up; re-entry constructs a new instance
+    SUSPEND = "suspend"        # suspend() is called and the instance is pooled
+    KEEP_ALIVE = "keep_alive"  # Pooled untouched
+    
 @runtime_checkable
 class SceneProtocol(Protocol):
     """Protocol defining the interface for game scenes."""
@@ -33,6 +47,18 @@ class SceneProtocol(Protocol):
 class Scene:
     """Base class for all game scenes."""
     
+    # Assets the scene loads on construction, prefetched during transitions.
+    # Images are filenames or (filename, scale or (width, height)) pairs.
+    preload_images: List[Union[str, Tuple]] = []
+    preload_sounds: List[str] = []
+    
+    # Scenes that report their changed regions through self.dirty can be
+    # drawn with partial display updates when dirty-rect rendering is on.
+    uses_dirty_rects: bool = False
+    
+    # Whether the instance is kept for a later return; see Retention
+    retention: Retention = Retention.DESTROY
+    
     def __init__(self, game_state) -> None:
         """Initialize the scene.
         
@@ -43,6 +69,7 @@ class Scene:
         self.next_scene: Optional[str] = None
         self.transition_time: float = 0.0
         self.transition_duration: float = 1.0  # seconds
+        self.dirty = DirtyRectTracker()
         
     def handle_events(self, event: pygame.event.Event) -> None:
         """Handle scene-specific events.
@@ -52,6 +79,17 @@ class Scene:
         """
         pass
         
+    def handle_input(self, snapshot: InputSnapshot) -> None:
+        """Handle the frame's input state, after its discrete events.
+        
+        Continuous input such as hover or held keys is cheaper to handle
+        here once per frame than per event.
+        
+        Args:
+            snapshot: Pointer and keyboard state at the end of the frame's events.
+        """
+        pass
+        
     def update(self, dt: float) -> None:
         """Update scene state.
         
@@ -72,6 +110,28 @@ class Scene:
         """Clean up scene resources."""
         pass
         
+    def suspend(self) -> None:
+        """Release what is cheap to rebuild before the scene is pooled.
+        
+        Only called for scenes retained with Retention.SUSPEND.
+        """
+        pass
+        
+    def resume(self) -> None:
+        """Prepare a pooled scene to be shown again."""
+        self.dirty.invalidate()
+        
+    def reset(self) -> bool:
+        """Return to the starting state in place, for a scene restarting itself.
+        
+        The scene keeps running across the reset: it is neither suspended
+        nor resumed.
+        
+        Returns:
+            bool: True if the scene was reset; False to have it rebuilt.
+        """
+        return False
+        
     def start_transition(self, next_scene: str) -> None:
         """Start transition to another scene.
         
@@ -84,18 +144,32 @@ class Scene:
 class SceneManager:
     """Manages scene transitions and state."""
     
-    def __init__(self, game_state) -> None:
+    def __init__(self, game_state, dirty_rects: bool = False, max_retained: int = 2) -> None:
         """Initialize the scene manager.
         
         Args:
             game_state: The game state manager instance.
+            dirty_rects: Redraw only the regions scenes report as changed,
+                for scenes that support it.
+            max_retained: Number of left scenes kept for re-entry; the least
+                recently left are cleaned up beyond that.
         """
         self.game_state = game_state
+        self.dirty_rects = dirty_rects
         self.current_scene: Optional[Scene] = None
+        self.current_name: Optional[str] = None
+        self.retained: "OrderedDict[str, Scene]" = OrderedDict()
+        self.max_retained = max_retained
         self.scenes: Dict[str, Type[Scene]] = {}
         self.transition_surface = Surface((1280, 720))  # Initialize with screen size
         self.transitioning: bool = False
         self.transition_progress: float = 0.0
+        self.profiler = get_profiler()
+        
+        # Background prefetch of the next scene's assets
+        self.resource_manager = ResourceManager()
+        self.prefetch_target: Optional[str] = None
+        self.prefetch_future: Optional[Future] = None
         
     def register_scene(self, name: str, scene_class: Type[Scene]) -> None:
         """Register a new scene type.
@@ -130,20 +204,95 @@ class SceneManager:
             return False
             
         try:
-            # Create new scene instance
-            new_scene = self.scenes[name](self.game_state)
+            # Let an in-flight prefetch finish so nothing is decoded twice
+            if self.prefetch_target == name and self.prefetch_future:
+                self.prefetch_future.result()
+                
+            old_scene = self.current_scene
+            restarting = old_scene is not None and name == self.current_name
+            if restarting and old_scene.reset():
+                # The scene restarted itself in place; it was never
+                # suspended, so it is only redrawn in full, not resumed
+                new_scene = old_scene
+                new_scene.dirty.invalidate()
+            elif name in self.retained:
+                new_scene = self.retained.pop(name)
+                with self.profiler.span(f"scene.resume {name}"):
+                    new_scene.resume()
+            else:
+                # Create new scene instance
+                with self.profiler.span(f"scene.construct {name}"):
+                    new_scene = self.scenes[name](self.game_state)
+            new_scene.next_scene = None
+            new_scene.transition_time = 0.0
             
-            # Clean up old scene if exists
-            if self.current_scene:
-                self.current_scene.cleanup()
+            # Retire the old scene, after the new one has taken its assets
+            if old_scene is not None and old_scene is not new_scene:
+                if restarting:
+                    self._destroy(old_scene)
+                else:
+                    self._retire(self.current_name, old_scene)
             
             self.current_scene = new_scene
+            self.current_name = name
             self.game_state.current_scene = name
             logger.info(f"Switched to scene: {name}")
             return True
         except Exception as e:
             logger.error(f"Error switching to scene '{name}': {e}")
             return False
+        finally:
+            if self.prefetch_target == name:
+                self.prefetch_target = None
+                self.prefetch_future = None
+                self.resource_manager.cache.clear_staged()
+                
+    def _retire(self, name: str, scene: Scene) -> None:
+        """Pool or clean up a scene the game is leaving, per its retention."""
+        retention = getattr(scene, 'retention', Retention.DESTROY)
+        if retention is Retention.DESTROY or self.max_retained <= 0:
+            self._destroy(scene)
+            return
+        if retention is Retention.SUSPEND:
+            with self.profiler.span(f"scene.suspend {name}"):
+                scene.suspend()
+        self.retained[name] = scene
+        while len(self.retained) > self.max_retained:
+            evicted_name, evicted = self.retained.popitem(last=False)
+            logger.info(f"Dropping retained scene: {evicted_name}")
+            self._destroy(evicted)
+            
+    def _destroy(self, scene: Scene) -> None:
+        """Clean up a scene for good."""
+        with self.profiler.span("scene.cleanup"):
+            scene.cleanup()
+            
+    def clear_retained(self) -> None:
+        """Clean up every pooled scene."""
+        while self.retained:
+            self._destroy(self.retained.popitem(last=False)[1])
+            
+    def prefetch(self, name: str) -> bool:
+        """Start decoding a scene's declared assets on a worker thread.
+        
+        Args:
+            name: Name of the scene about to be entered.
+            
+        Returns:
+            bool: True if a prefetch was started or is already running.
+        """
+        if name not in self.scenes:
+            return False
+        if self.prefetch_target == name:
+            return True
+            
+        scene_class = self.scenes[name]
+        self.prefetch_target = name
+        self.prefetch_future = self.resource_manager.prefetch(
+            scene_class.preload_images, scene_class.preload_sounds
+        )
+        logger.info(f"Prefetching assets for scene: {name}")
+        return True
             
     def handle_events(self, event: pygame.event.Event) -> None:
         """Handle events for the current scene.
@@ -152,7 +301,18 @@ class SceneManager:
             event: The pygame event to handle.
         """
         if self.current_scene:
-            self.current_scene.handle_events(event)
+            with self.profiler.span("scene.handle_events"):
+                self.current_scene.handle_events(event)
+                
+    def handle_input(self, snapshot: InputSnapshot) -> None:
+        """Pass the frame's input snapshot to the current scene.
+        
+        Args:
+            snapshot: Pointer and keyboard state at the end of the frame's events.
+        """
+        if self.current_scene and hasattr(self.current_scene, 'handle_input'):
+            with self.profiler.span("scene.handle_input"):
+                self.current_scene.handle_input(snapshot)
             
     def update(self, dt: float) -> None:
         """Update the current scene and handle transitions.
@@ -166,6 +326,11 @@ class SceneManager:
         try:
             # Handle scene transitions first
             if self.current_scene.next_scene:
+                # Decode the next scene's assets while the fade runs
+                next_scene = self.current_scene.next_scene
+                if self.prefetch_target != next_scene and next_scene not in self.retained:
+                    self.prefetch(next_scene)
+                    
                 self.current_scene.transition_time += dt
                 progress = min(1.0, self.current_scene.transition_time / self.current_scene.transition_duration)
                 
@@ -178,26 +343,53 @@ class SceneManager:
                     self.transitioning = True
                     self.transition_progress = progress
             else:
+                if self.transitioning:
+                    # The fade covered the whole screen
+                    self.current_scene.dirty.invalidate()
                 self.transitioning = False
                 self.transition_progress = 0.0
                 
             # Update current scene
-            self.current_scene.update(dt)
+            with self.profiler.span("scene.update"):
+                self.current_scene.update(dt)
         except Exception as e:
             logger.error(f"Error updating scene: {e}")
             
-    def render(self, screen: Surface) -> None:
+    def render(self, screen: Surface) -> Optional[List[pygame.Rect]]:
         """Render the current scene with transition effects.
         
         Args:
             screen: The pygame surface to render to.
+            
+        Returns:
+            The screen regions that changed, or None if the whole screen
+            was redrawn and should be flipped.
         """
+        with self.profiler.span("scene.render"):
+            return self._render(screen)
+            
+    def _render(self, screen: Surface) -> Optional[List[pygame.Rect]]:
+        """Body of render()."""
         if not self.current_scene:
-            return
+            return None
             
         try:
+            scene = self.current_scene
+            if self.dirty_rects and scene.uses_dirty_rects and not self.transitioning:
+                rects = scene.dirty.collect()
+                if rects is not None:
+                    # Redraw the scene clipped to each region; the scene's
+                    # background restores whatever moved out of it
+                    for rect in rects:
+                        screen.set_clip(rect)
+                        scene.render(screen)
+                    screen.set_clip(None)
+                    return rects
+                    
             # Render current scene
-            self.current_scene.render(screen)
+            if self.dirty_rects:
+                screen.fill((0, 0, 0))
+            scene.render(screen)
             
             # Apply transition effect if transitioning
             if self.transitioning:
@@ -206,4 +398,5 @@ class SceneManager:
                 self.transition_surface.set_alpha(alpha)
                 screen.blit(self.transition_surface, (0, 0))
         except Exception as e:
-            logger.error(f"Error rendering scene: {e}") 
\ No newline at end of file
+            logger.error(f"Error rendering scene: {e}")
+        return None
@@ -0,0 +1,120 @@
+"""
+Spatial Index
+Uniform-grid index of interactive screen regions, so pointer hit-tests
+only look at the regions near the pointer instead of every region.
+"""
+
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+import pygame
+
+class SpatialIndex:
+    """Z-ordered rectangles bucketed into a uniform grid of cells.
+
+    Regions are returned topmost first: higher z wins, and among regions
+    with equal z the one added first wins.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """Initialize the index.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self.rects: Dict[Hashable, pygame.Rect] = {}
+        self._order: Dict[Hashable, Tuple[int, int]] = {}  # key -> (-z, insertion number)
+        self._next = 0
+
+    def _cells(self, rect: pygame.Rect) -> Iterator[Tuple[int, int]]:
+        """Yield the grid cells a rect overlaps."""
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cell_x, cell_y
+
+    def add(self, key: Hashable, rect: pygame.Rect, z: int = 0) -> None:
+        """Add a region, replacing any region with the same key.
+
+        Args:
+            key: Identifier returned by queries.
+            rect: Screen area of the region.
+            z: Stacking order; higher is on top.
+        """
+        if key in self.rects:
+            self.remove(key)
+        rect = pygame.Rect(rect)
+        self.rects[key] = rect
+        self._order[key] = (-z, self._next)
+        self._next += 1
+        for cell in self._cells(rect):
+            self.cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a region if present."""
+        rect = self.rects.pop(key, None)
+        if rect is None:
+            return
+        del self._order[key]
+        for cell in self._cells(rect):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.cells[cell]
+
+    def move(self, key: Hashable, rect: pygame.Rect) -> None:
+        """Update a region's area, keeping its z order.
+
+        Only the cells the region enters or leaves are touched.
+        """
+        old = self.rects.get(key)
+        if old is None or old == rect:
+            return
+        old_cells = set(self._cells(old))
+        new_rect = pygame.Rect(rect)
+        new_cells = set(self._cells(new_rect))
+        for cell in old_cells - new_cells:
+            bucket = self.cells[cell]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[cell]
+        for cell in new_cells - old_cells:
+            self.cells.setdefault(cell, set()).add(key)
+        self.rects[key] = new_rect
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.rects
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def query_point(self, pos: Tuple[int, int]) -> List[Hashable]:
+        """Get the regions containing a point, topmost first."""
+        bucket = self.cells.get((int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size))
+        if not bucket:
+            return []
+        hits = [key for key in bucket if self.rects[key].collidepoint(pos)]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def query_rect(self, rect: pygame.Rect) -> List[Hashable]:
+        """Get the regions overlapping a rect, topmost first."""
+        rect = pygame.Rect(rect)
+        found: Set[Hashable] = set()
+        for cell in self._cells(rect):
+            found.update(self.cells.get(cell, ()))
+        hits = [key for key in found if self.rects[key].colliderect(rect)]
+        hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def top_at(self, pos: Tuple[int, int]) -> Optional[Hashable]:
+        """Get the topmost region containing a point, if any."""
+        hits = self.query_point(pos)
+        return hits[0] if hits else None
+
+    def clear(self) -> None:
+        """Remove every region."""
+        self.cells.clear()
+        self.rects.clear()
+        self._order.clear()
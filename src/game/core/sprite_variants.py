@@ -0,0 +1,99 @@
+"""
+Sprite Variants
+Bounded cache of flipped, scaled and rotated copies of sprites, so
+characters facing left or drawn at another size are transformed once
+instead of every frame.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+import pygame
+
+from .asset_baker import scale_surface
+
+class SpriteVariantCache:
+    """Least-recently-used cache of transformed sprite copies.
+
+    Variants are keyed by the source surface itself, so the same sprite
+    shared through the asset cache maps to the same variants everywhere.
+    """
+
+    def __init__(self, max_entries: int = 512, angle_step: float = 1.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of variants kept before the least recently
+                used are dropped.
+            angle_step: Rotations are rounded to a multiple of this many
+                degrees, so slowly turning sprites reuse variants.
+        """
+        self.max_entries = max_entries
+        self.angle_step = angle_step
+        self.entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        surface: pygame.Surface,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        size: Optional[Tuple[int, int]] = None,
+        angle: float = 0.0
+    ) -> pygame.Surface:
+        """Get a transformed copy of a sprite, creating it on first request.
+
+        The sprite is scaled first, then flipped, then rotated.
+
+        Args:
+            surface: The source sprite.
+            flip_x: Mirror horizontally.
+            flip_y: Mirror vertically.
+            size: Optional (width, height) to scale to.
+            angle: Counter-clockwise rotation in degrees.
+
+        Returns:
+            pygame.Surface: The variant; the source itself if nothing changes.
+        """
+        if size is not None and tuple(size) == surface.get_size():
+            size = None
+        angle = round(angle / self.angle_step) * self.angle_step % 360
+        if not (flip_x or flip_y or size or angle):
+            return surface
+
+        key = (surface, flip_x, flip_y, tuple(size) if size else None, angle)
+        variant = self.entries.get(key)
+        if variant is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return variant
+
+        self.misses += 1
+        variant = surface
+        if size:
+            variant = scale_surface(variant, size)
+        if flip_x or flip_y:
+            variant = pygame.transform.flip(variant, flip_x, flip_y)
+        if angle:
+            variant = pygame.transform.rotate(variant, angle)
+        self.entries[key] = variant
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return variant
+
+    def flipped(self, surface: pygame.Surface, flip_x: bool = True, flip_y: bool = False) -> pygame.Surface:
+        """Get a mirrored copy of a sprite."""
+        return self.get(surface, flip_x, flip_y)
+
+    def clear(self) -> None:
+        """Drop every variant."""
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+_sprite_variants = SpriteVariantCache()
+
+def get_sprite_variants() -> SpriteVariantCache:
+    """Get the shared sprite variant cache."""
+    return _sprite_variants
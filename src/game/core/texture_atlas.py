@@ -0,0 +1,214 @@
+"""
+Texture Atlas
+Packs many small item and UI sprites into a few sheets with a JSON index
+so they can be loaded with one decode and handed out as subsurfaces.
+
+Run `python -m src.game.core.texture_atlas` from the project root to build
+every atlas listed in the "atlases" rules of assets/metadata.json.
+"""
+
+import fnmatch
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+from .asset_baker import scale_surface
+
+class AtlasBuilder:
+    """Packs sprites into fixed-size sheets using shelf packing."""
+
+    def __init__(
+        self,
+        name: str,
+        sprite_size: Optional[Tuple[int, int]] = None,
+        max_sprite_size: int = 128,
+        sheet_size: Tuple[int, int] = (1024, 1024),
+        padding: int = 2
+    ):
+        """Initialize the builder.
+
+        Args:
+            name: Atlas name, used for the index and sheet filenames.
+            sprite_size: Exact size every sprite is scaled to, or None to
+                fit sprites within max_sprite_size keeping their aspect.
+            max_sprite_size: Longest side of a sprite when sprite_size is None.
+            sheet_size: Size of each sheet in pixels.
+            padding: Empty pixels between sprites to avoid filter bleeding.
+        """
+        self.name = name
+        self.sprite_size = sprite_size
+        self.max_sprite_size = max_sprite_size
+        self.sheet_size = sheet_size
+        self.padding = padding
+        self.sprites: Dict[str, pygame.Surface] = {}
+
+    def add(self, logical_name: str, image: pygame.Surface) -> None:
+        """Add a sprite, scaling it to its atlas size.
+
+        Args:
+            logical_name: Name the sprite is looked up by.
+            image: Full-resolution source image.
+        """
+        if self.sprite_size:
+            size = self.sprite_size
+        else:
+            width, height = image.get_size()
+            factor = min(1.0, self.max_sprite_size / max(width, height))
+            size = (max(1, int(width * factor)), max(1, int(height * factor)))
+        self.sprites[logical_name] = scale_surface(image, size)
+
+    def pack(self) -> Tuple[List[pygame.Surface], Dict[str, Dict]]:
+        """Pack every added sprite.
+
+        Returns:
+            The sheets and an index mapping each logical name to its
+            'sheet' number and 'rect' [x, y, width, height].
+        """
+        sheet_width, sheet_height = self.sheet_size
+        sheets: List[pygame.Surface] = []
+        index: Dict[str, Dict] = {}
+        x = y = shelf_height = 0
+
+        # Tallest first keeps shelves tight
+        ordered = sorted(self.sprites.items(), key=lambda item: -item[1].get_height())
+        for logical_name, sprite in ordered:
+            width, height = sprite.get_size()
+            if width > sheet_width or height > sheet_height:
+                raise ValueError(f"Sprite '{logical_name}' does not fit in a {self.sheet_size} sheet")
+            if x + width > sheet_width:
+                x, y = 0, y + shelf_height + self.padding
+                shelf_height = 0
+            if not sheets or y + height > sheet_height:
+                sheets.append(pygame.Surface(self.sheet_size, pygame.SRCALPHA))
+                x = y = shelf_height = 0
+            sheets[-1].blit(sprite, (x, y))
+            index[logical_name] = {'sheet': len(sheets) - 1, 'rect': [x, y, width, height]}
+            x += width + self.padding
+            shelf_height = max(shelf_height, height)
+        return sheets, index
+
+    def save(self, output_dir: str = 'cache/atlases') -> Path:
+        """Pack the sprites and write the sheets plus a JSON index.
+
+        Args:
+            output_dir: Directory to write the atlas files to.
+
+        Returns:
+            Path: Path of the written index file.
+        """
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        sheets, index = self.pack()
+        sheet_files = []
+        for number, sheet in enumerate(sheets):
+            sheet_file = f"{self.name}_{number}.png"
+            pygame.image.save(sheet, str(output / sheet_file))
+            sheet_files.append(sheet_file)
+        index_path = output / f"{self.name}.json"
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump({'sheets': sheet_files, 'sprites': index}, f, indent=4, ensure_ascii=False)
+        return index_path
+
+class TextureAtlas:
+    """A loaded atlas handing out sprites as subsurfaces of its sheets."""
+
+    def __init__(self, sheets: List[pygame.Surface], sprites: Dict[str, Dict]):
+        """Initialize the atlas.
+
+        Args:
+            sheets: The loaded sheet surfaces.
+            sprites: Index mapping logical names to 'sheet' and 'rect'.
+        """
+        self.sheets = sheets
+        self.sprites = sprites
+        self._subsurfaces: Dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def load(cls, index_path: Path) -> "TextureAtlas":
+        """Load an atlas from its JSON index.
+
+        Args:
+            index_path: Path to the index written by AtlasBuilder.save().
+
+        Returns:
+            TextureAtlas: The loaded atlas.
+        """
+        with open(index_path, encoding='utf-8') as f:
+            data = json.load(f)
+        sheets = []
+        for sheet_file in data['sheets']:
+            sheet = pygame.image.load(str(index_path.parent / sheet_file))
+            if pygame.display.get_surface():
+                sheet = sheet.convert_alpha()
+            sheets.append(sheet)
+        return cls(sheets, data['sprites'])
+
+    def __contains__(self, logical_name: str) -> bool:
+        return logical_name in self.sprites
+
+    def get(self, logical_name: str) -> Optional[pygame.Surface]:
+        """Get a sprite by logical name.
+
+        Returns:
+            A subsurface sharing pixels with its sheet, or None if unknown.
+        """
+        if logical_name not in self._subsurfaces:
+            entry = self.sprites.get(logical_name)
+            if entry is None:
+                return None
+            sheet = self.sheets[entry['sheet']]
+            self._subsurfaces[logical_name] = sheet.subsurface(pygame.Rect(entry['rect']))
+        return self._subsurfaces[logical_name]
+
+def logical_name(path: str, assets_dir: str = 'assets') -> str:
+    """Get the atlas name of an asset path, e.g. 'items/Belt of Truth'.
+
+    Args:
+        path: Asset path, either relative to the assets directory or
+            starting with it.
+        assets_dir: Root directory of the assets.
+    """
+    asset_path = Path(path)
+    if asset_path.parts and asset_path.parts[0] == Path(assets_dir).name:
+        asset_path = asset_path.relative_to(asset_path.parts[0])
+    return asset_path.with_suffix('').as_posix()
+
+def build_atlases(metadata_path: str = 'assets/metadata.json', assets_dir: str = 'assets',
+                  output_dir: str = 'cache/atlases') -> List[Path]:
+    """Build every atlas listed in the "atlases" rules of the asset metadata.
+
+    Each rule names the atlas, gives a glob "pattern" relative to the
+    assets directory and either an exact sprite "size" or a "max_size".
+
+    Returns:
+        List[Path]: Paths of the written index files.
+    """
+    with open(metadata_path, encoding='utf-8') as f:
+        rules = json.load(f).get('atlases', [])
+    root = Path(assets_dir)
+    files = sorted(path.relative_to(root).as_posix() for path in root.rglob('*.png'))
+    written = []
+    for rule in rules:
+        builder = AtlasBuilder(
+            rule['name'],
+            sprite_size=tuple(rule['size']) if 'size' in rule else None,
+            max_sprite_size=rule.get('max_size', 128)
+        )
+        for filename in fnmatch.filter(files, rule['pattern']):
+            try:
+                builder.add(logical_name(filename), pygame.image.load(str(root / filename)))
+            except pygame.error as e:
+                print(f"Error loading image {filename}: {e}")
+        written.append(builder.save(output_dir))
+    return written
+
+def main() -> None:
+    """Build all configured atlases from the command line."""
+    pygame.init()
+    for index_path in build_atlases():
+        print(f"Wrote {index_path}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
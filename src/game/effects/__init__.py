@@ -0,0 +1,3 @@
+"""
+Game Effects Package
+"""
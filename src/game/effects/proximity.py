@@ -0,0 +1,112 @@
+"""
+Proximity Glow
+Hover glow for collectibles near the pointer. Targets are found through
+the hotspot spatial index only when the pointer moves, and glows fade
+through pre-baked alpha frames, so idle frames cost nothing.
+"""
+
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+import pygame
+
+from ..core.spatial_index import SpatialIndex
+from .particles import bake_alpha_frames
+
+class ProximityGlow:
+    """Fades a glow in on targets within a radius of the pointer."""
+
+    def __init__(self, index: SpatialIndex, radius: float = 100.0,
+                 fade_speed: float = 300.0, alpha_steps: int = 16):
+        """Initialize the effect.
+
+        Args:
+            index: Spatial index holding the targets' regions under their keys.
+            radius: Distance from a target's center within which it glows.
+            fade_speed: Alpha change per second while fading in or out.
+            alpha_steps: Number of pre-baked glow opacities.
+        """
+        self.index = index
+        self.radius = radius
+        self.fade_speed = fade_speed
+        self.alpha_steps = alpha_steps
+        self.frames: Dict[Hashable, List[pygame.Surface]] = {}
+        self.alpha: Dict[Hashable, float] = {}
+        self.near: Set[Hashable] = set()
+        self.fading: Set[Hashable] = set()  # Targets whose alpha is still changing
+        self._baked: Dict[pygame.Surface, List[pygame.Surface]] = {}  # Glow surface -> frames
+
+    def add(self, key: Hashable, glow: pygame.Surface) -> None:
+        """Give a target in the index a glow.
+
+        Targets sharing one glow surface share its baked frames.
+
+        Args:
+            key: The target's key in the spatial index.
+            glow: The glow at full opacity.
+        """
+        frames = self._baked.get(glow)
+        if frames is None:
+            frames = self._baked[glow] = bake_alpha_frames(glow, self.alpha_steps)
+        self.frames[key] = frames
+        self.alpha[key] = 0.0
+
+    def remove(self, key: Hashable) -> None:
+        """Stop a target from glowing."""
+        self.frames.pop(key, None)
+        self.alpha.pop(key, None)
+        self.near.discard(key)
+        self.fading.discard(key)
+
+    def reset(self) -> None:
+        """Turn every glow off at once."""
+        for key in self.alpha:
+            self.alpha[key] = 0.0
+        self.near.clear()
+        self.fading.clear()
+
+    def pointer_moved(self, pos: Tuple[int, int]) -> None:
+        """Find the targets near the pointer; call only when it moves.
+
+        Args:
+            pos: New pointer position.
+        """
+        radius = self.radius
+        area = pygame.Rect(int(pos[0] - radius), int(pos[1] - radius),
+                           int(radius * 2) + 1, int(radius * 2) + 1)
+        radius_squared = radius * radius
+        near = set()
+        for key in self.index.query_rect(area):
+            if key not in self.frames:
+                continue
+            center = self.index.rects[key].center
+            dx = pos[0] - center[0]
+            dy = pos[1] - center[1]
+            if dx * dx + dy * dy < radius_squared:
+                near.add(key)
+        self.fading |= near ^ self.near
+        self.near = near
+
+    def update(self, dt: float) -> None:
+        """Fade the glows that are still changing.
+
+        Args:
+            dt: Time step in seconds.
+        """
+        step = self.fade_speed * dt
+        for key in list(self.fading):
+            if key in self.near:
+                alpha = min(self.alpha[key] + step, 255.0)
+                settled = alpha >= 255.0
+            else:
+                alpha = max(self.alpha[key] - step, 0.0)
+                settled = alpha <= 0.0
+            self.alpha[key] = alpha
+            if settled:
+                self.fading.discard(key)
+
+    def frame(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Get a target's glow at its current opacity, or None if it is dark."""
+        alpha = self.alpha.get(key)
+        if not alpha:
+            return None
+        step = round(alpha * (self.alpha_steps - 1) / 255.0)
+        return self.frames[key][step] if step else None
@@ -6,6 +6,7 @@ Defines common functionality for all NPCs in the game.
 from typing import Dict, List, Optional, Tuple
 import pygame
 from ..core.resource_manager import ResourceManager
+from ..core.sprite_variants import get_sprite_variants
 
 class NPC:
     def __init__(self, name: str, position: Tuple[int, int]):
@@ -13,6 +14,7 @@ class NPC:
         self.name = name
         self.position = position
         self.resource_manager = ResourceManager()
+        self.sprite_variants = get_sprite_variants()
         
         # Dialogue state
         self.dialogue_stage = 0
@@ -73,7 +75,7 @@ class NPC:
             
         # Flip frame if facing left
         if not self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
+            frame = self.sprite_variants.flipped(frame)
             
         # Draw NPC
         screen.blit(frame, self.position)
@@ -115,4 +117,8 @@ class NPC:
         
     def set_serpent_visible(self, visible: bool) -> None:
         """Set whether the NPC's serpent is visible."""
-        self.serpent_visible = visible 
\ No newline at end of file
+        self.serpent_visible = visible
+        
+    def cleanup(self) -> None:
+        """Release the NPC's sprites from the shared asset cache."""
+        self.resource_manager.clear_cache() 
\ No newline at end of file
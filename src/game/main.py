@@ -11,31 +11,34 @@ from pygame.locals import *
 from typing import NoReturn
 from pathlib import Path
 
-from src.game.scenes.starting_screen import StartingScreen
-from src.game.scenes.mirror_chamber import MirrorChamber
-from src.game.scenes.blind_marketplace import BlindMarketplace
+from src.game.scenes.registry import SCENES
 from src.game.core.scene_manager import SceneManager
 from src.game.core.game_state import GameState
+from src.game.core.asset_pack import open_asset_pack, close_asset_pack
+from src.game.core.asset_baker import set_bake_cache_dir
+from src.game.core.resource_manager import shutdown_decode_pool
+from src.game.core.game_clock import get_game_clock
+from src.game.core.event_batcher import EventBatcher
+from src.game.core.profiler import get_profiler
+from src.game.ui.profiler_overlay import ProfilerOverlay
+from src.game.core.logging_setup import setup_logging, shutdown_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('game.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 # Game Configuration
 class GameConfig:
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
-    FPS = 60
+    FPS = 60  # Render rate; may be lowered without changing gameplay speed
+    SIMULATION_RATE = 60  # Fixed update steps per second
     TITLE = "Land of Dragons and Snakes"
     ASSETS_PATH = Path("assets")
+    ASSET_PACK_PATH = Path("cache/assets.pack")  # Used instead of ASSETS_PATH when built
+    BAKE_CACHE_PATH = Path("cache/baked")  # Pre-scaled images, baked on first load
     SAVES_PATH = Path("saves")
+    DIRTY_RECTS = False  # Push only changed regions to the display
+    DEBUG = "--debug" in sys.argv  # Start with the profiler overlay shown
+    TRACE_PATH = Path("profile_trace.json")  # Written by F4 while profiling
 
 def initialize_pygame() -> tuple[pygame.Surface, pygame.time.Clock]:
     """Initialize Pygame and return screen and clock objects."""
@@ -54,43 +57,82 @@ def initialize_pygame() -> tuple[pygame.Surface, pygame.time.Clock]:
 
 def main() -> NoReturn:
     """Entry point of the game."""
+    # Configure logging; records are written by a background thread. Done
+    # here rather than on import, as decode workers re-import this module.
+    setup_logging('game.log', level=logging.INFO)
     try:
         # Initialize game components
         screen, clock = initialize_pygame()
+        if open_asset_pack(GameConfig.ASSET_PACK_PATH):
+            logger.info(f"Reading assets from {GameConfig.ASSET_PACK_PATH}")
+        set_bake_cache_dir(GameConfig.BAKE_CACHE_PATH)
         game_state = GameState()
-        scene_manager = SceneManager(game_state)
+        scene_manager = SceneManager(game_state, dirty_rects=GameConfig.DIRTY_RECTS)
         
         # Register scenes
-        scene_manager.register_scene("starting_screen", StartingScreen)
-        scene_manager.register_scene("mirror_chamber", MirrorChamber)
-        scene_manager.register_scene("blind_marketplace", BlindMarketplace)
+        for name, scene_class in SCENES.items():
+            scene_manager.register_scene(name, scene_class)
         
         # Start with the starting screen
         if not scene_manager.switch_scene("starting_screen"):
             logger.error("Failed to load starting screen")
             sys.exit(1)
         
+        game_clock = get_game_clock()
+        game_clock.step = 1.0 / GameConfig.SIMULATION_RATE
+        
+        # F3 toggles the profiler overlay, F4 dumps a Chrome trace
+        profiler = get_profiler()
+        profiler_overlay = ProfilerOverlay(budget_ms=1000.0 / GameConfig.FPS)
+        if GameConfig.DEBUG:
+            profiler_overlay.toggle()
+        
+        # Coalesces high-rate mouse motion and key repeats each frame
+        event_batcher = EventBatcher(pygame.mouse.get_pos())
+        
         # Game loop
         running = True
         while running:
             try:
-                # Calculate delta time
-                dt = clock.tick(GameConfig.FPS) / 1000.0
+                # Real time since the last rendered frame
+                frame_time = clock.tick(GameConfig.FPS) / 1000.0
+                profiler.begin_frame()
                 
                 # Handle events
-                for event in pygame.event.get():
+                events, input_snapshot = event_batcher.process(pygame.event.get())
+                for event in events:
                     if event.type == pygame.QUIT:
                         running = False
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             running = False
+                        elif event.key == pygame.K_F3:
+                            profiler_overlay.toggle()
+                            if scene_manager.current_scene:
+                                scene_manager.current_scene.dirty.invalidate()
+                        elif event.key == pygame.K_F4 and profiler.enabled:
+                            logger.info(f"Wrote profile trace to {profiler.dump(GameConfig.TRACE_PATH)}")
                     scene_manager.handle_events(event)
+                scene_manager.handle_input(input_snapshot)
                     
-                # Update and render
-                scene_manager.update(dt)
-                screen.fill((0, 0, 0))
-                scene_manager.render(screen)
-                pygame.display.flip()
+                # Simulate in fixed steps, then render once
+                for dt in game_clock.advance(frame_time):
+                    scene_manager.update(dt)
+                if not GameConfig.DIRTY_RECTS:
+                    screen.fill((0, 0, 0))
+                if profiler_overlay.visible and scene_manager.current_scene:
+                    # Restore the backdrop under the translucent overlay so
+                    # it is not blended onto its previous frame
+                    scene_manager.current_scene.dirty.mark(profiler_overlay.rect)
+                dirty_rects = scene_manager.render(screen)
+                if profiler_overlay.visible:
+                    profiler_overlay.render(screen, clock.get_fps())
+                with profiler.span("display.present"):
+                    if dirty_rects is None:
+                        pygame.display.flip()
+                    elif dirty_rects:
+                        pygame.display.update(dirty_rects)
+                profiler.end_frame()
                 
             except Exception as e:
                 logger.error(f"Error in game loop: {e}")
@@ -99,6 +141,9 @@ def main() -> NoReturn:
     except Exception as e:
         logger.critical(f"Fatal error: {e}")
     finally:
+        shutdown_decode_pool()
+        close_asset_pack()
+        shutdown_logging()
         pygame.quit()
         sys.exit(0)
 
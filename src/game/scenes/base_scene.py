@@ -8,11 +8,16 @@ from typing import Optional, Dict
 from pathlib import Path
 
 from src.game.core.scene_manager import Scene
+from src.game.core.resource_manager import ResourceManager
+from src.game.core.layer_compositor import LayerCompositor
+from src.game.core.profiler import get_profiler
 from src.game.ui.components import TextBox, Inventory, UIStyle
 
 class BaseScene(Scene):
     """Base class for all game scenes with shared UI components."""
     
+    preload_images = ["items/Inventory Full UI.png", "items/Dialogue Box.png"]
+    
     def __init__(self, game_state):
         """Initialize the base scene.
         
@@ -20,11 +25,14 @@ class BaseScene(Scene):
             game_state: The game state manager instance.
         """
         super().__init__(game_state)  # Pass game_state to parent Scene class
+        self.resource_manager = ResourceManager()
         
         # Scene state
         self.background: Optional[pygame.Surface] = None
         self.foreground: Optional[pygame.Surface] = None
         self.interactive_areas: Dict[str, pygame.Rect] = {}
+        self.layers = LayerCompositor((1280, 720))
+        self.profiler = get_profiler()
         
         # Visual effects
         self.fade_surface = pygame.Surface((1280, 720))
@@ -48,14 +56,14 @@ class BaseScene(Scene):
             # Load inventory background
             inv_bg_path = Path("assets/items/Inventory Full UI.png")
             if inv_bg_path.exists():
-                self.inventory_bg = pygame.image.load(str(inv_bg_path)).convert_alpha()
+                self.inventory_bg = self.resource_manager.load_image("items/Inventory Full UI.png")
             else:
                 self.inventory_bg = None
                 
             # Load dialogue box
             dialogue_path = Path("assets/items/Dialogue Box.png")
             if dialogue_path.exists():
-                self.dialogue_bg = pygame.image.load(str(dialogue_path)).convert_alpha()
+                self.dialogue_bg = self.resource_manager.load_image("items/Dialogue Box.png")
             else:
                 self.dialogue_bg = None
                 
@@ -107,7 +115,7 @@ class BaseScene(Scene):
         Args:
             event: The pygame event to handle.
         """
-        pass
+        self.inventory.handle_event(event)
         
     def update(self, dt: float) -> None:
         """Update scene state.
@@ -129,17 +137,21 @@ class BaseScene(Scene):
             screen: The pygame surface to render to.
         """
         # Render scene-specific content
-        self._render_scene(screen)
+        with self.profiler.span("render.scene"):
+            self._render_scene(screen)
         
         # Always render UI components on top
-        self.inventory.render(screen)
-        self.text_box.render(screen)
+        with self.profiler.span("render.inventory"):
+            self.inventory.render(screen)
+        with self.profiler.span("render.text_box"):
+            self.text_box.render(screen)
         
         # Render fade effect if active
         if self.fade_alpha > 0:
-            self.fade_surface.fill((0, 0, 0))
-            self.fade_surface.set_alpha(self.fade_alpha)
-            screen.blit(self.fade_surface, (0, 0))
+            with self.profiler.span("render.fade"):
+                self.fade_surface.fill((0, 0, 0))
+                self.fade_surface.set_alpha(self.fade_alpha)
+                screen.blit(self.fade_surface, (0, 0))
             
     def _render_scene(self, screen: pygame.Surface) -> None:
         """Render scene-specific content.
@@ -165,6 +177,27 @@ class BaseScene(Scene):
             self.ambient_sound.stop()
         if hasattr(self, 'voice_over') and self.voice_over:
             self.voice_over.stop()
+        if hasattr(self, 'layers'):
+            self.layers.clear()
+        if hasattr(self, 'resource_manager'):
+            self.resource_manager.clear_cache()
+        if hasattr(self, 'inventory'):
+            self.inventory.cleanup()
+            
+    def suspend(self) -> None:
+        """Silence the scene and drop its flattened backdrop while pooled."""
+        if self.ambient_sound:
+            self.ambient_sound.stop()
+        if self.voice_over:
+            self.voice_over.stop()
+        self.layers.invalidate()
+        self.inventory.invalidate()
+        
+    def resume(self) -> None:
+        """Restart the ambient loop when the scene is shown again."""
+        super().resume()
+        if self.ambient_sound:
+            self.ambient_sound.play(-1)
             
     def add_text(self, text: str) -> None:
         """Add text to the text box.
@@ -8,13 +8,26 @@ from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 
 from ..core.scene_manager import Scene
-from ..core.resource_manager import ResourceManager
 from ..core.input_manager import InputManager
+from ..core.sprite_variants import get_sprite_variants
+from ..core.event_batcher import InputSnapshot
 from .base_scene import BaseScene
+from ..ui.components import Inventory, MessagePanel, UIStyle
+from ..ui import chrome
 
 class BlindMarketplace(BaseScene):
     """Scene representing a ruined marketplace where people live in spiritual blindness."""
     
+    preload_images = BaseScene.preload_images + [
+        ("backgrounds/background_markedplace.png", (1280, 720)),
+        ("characters/main_character.png", 0.8),
+        ("characters/Justifier Portrait.png", (200, 300)),
+        ("characters/Mother Portrait.png", (200, 300)),
+        ("characters/Performer Portrait.png", (200, 300)),
+        ("characters/Mason Portrait.png", (200, 300)),
+        ("characters/Serpent.png", (100, 100))
+    ]
+    
     def __init__(self, game_state):
         """Initialize the blind marketplace scene.
         
@@ -23,7 +36,6 @@ class BlindMarketplace(BaseScene):
         """
         super().__init__(game_state)
         self.scene_name = "blind_marketplace"
-        self.resource_manager = ResourceManager()
         self.input_manager = InputManager()
         
         # Scene state
@@ -53,32 +65,28 @@ class BlindMarketplace(BaseScene):
             'haze': (100, 100, 100, 50)  # Gray haze color
         }
         
-        # Load and scale background
-        self.background = self.resource_manager.load_image("backgrounds/background_markedplace.png")
-        self.background = pygame.transform.scale(self.background, (1280, 720))
+        # Decode the scene's art in parallel; the loads below are cache hits
+        self.resource_manager.load_images(self.preload_images)
         
-        # Load and scale character
-        self.character_image = self.resource_manager.load_image("characters/main_character.png")
+        # Load background and character art at display size
+        self.background = self.resource_manager.load_image("backgrounds/background_markedplace.png",
+                                                           size=(1280, 720))
         self.character_scale = 0.8
-        char_size = (int(self.character_image.get_width() * self.character_scale),
-                    int(self.character_image.get_height() * self.character_scale))
-        self.character_image = pygame.transform.scale(self.character_image, char_size)
+        self.character_image = self.resource_manager.load_image("characters/main_character.png",
+                                                                scale=self.character_scale)
+        self.sprite_variants = get_sprite_variants()
         
         # Load NPC portraits
+        portrait_size = (200, 300)
         self.npc_images = {
-            'justifier': self.resource_manager.load_image("characters/Justifier Portrait.png"),
-            'mother': self.resource_manager.load_image("characters/Mother Portrait.png"),
-            'performer': self.resource_manager.load_image("characters/Performer Portrait.png"),
-            'mason': self.resource_manager.load_image("characters/Mason Portrait.png")
+            'justifier': self.resource_manager.load_image("characters/Justifier Portrait.png", size=portrait_size),
+            'mother': self.resource_manager.load_image("characters/Mother Portrait.png", size=portrait_size),
+            'performer': self.resource_manager.load_image("characters/Performer Portrait.png", size=portrait_size),
+            'mason': self.resource_manager.load_image("characters/Mason Portrait.png", size=portrait_size)
         }
-        
-        # Scale NPC images
-        for key in self.npc_images:
-            self.npc_images[key] = pygame.transform.scale(self.npc_images[key], (200, 300))
             
         # Load dragon images - only use Serpent.png for all dragons temporarily
-        serpent_img = self.resource_manager.load_image("characters/Serpent.png")
-        serpent_img = pygame.transform.scale(serpent_img, (100, 100))
+        serpent_img = self.resource_manager.load_image("characters/Serpent.png", size=(100, 100))
         self.dragon_images = {
             'pride': serpent_img,
             'idolatry': serpent_img,
@@ -145,53 +153,20 @@ class BlindMarketplace(BaseScene):
         
         # Inventory system
         self.inventory_rect = pygame.Rect(10, 10, 250, 300)
-        self.inventory_frame = pygame.Surface((270, 320), pygame.SRCALPHA)
-        
-        # Create gradient background for inventory
-        for i in range(320):
-            alpha = 128 + (i / 320) * 64
-            pygame.draw.line(self.inventory_frame, (20, 20, 30, alpha), (0, i), (270, i))
-        
-        # Draw main panel
-        pygame.draw.rect(self.inventory_frame, (30, 30, 40, 200), (10, 10, 250, 300))
-        
-        # Draw golden border
-        pygame.draw.rect(self.inventory_frame, (218, 165, 32, 255), (10, 10, 250, 300), 2)
-        
-        # Draw corner decorations
-        for x, y in [(10, 10), (250, 10), (10, 300), (250, 300)]:
-            pygame.draw.circle(self.inventory_frame, (218, 165, 32, 255), (x, y), 5)
-            pygame.draw.circle(self.inventory_frame, (255, 215, 0, 128), (x, y), 3)
-            
-        # Create slot frame template
-        self.slot_frame = pygame.Surface((60, 60), pygame.SRCALPHA)
-        # Gradient background for slot
-        for i in range(60):
-            alpha = 96 + (i / 60) * 32
-            pygame.draw.line(self.slot_frame, (25, 25, 35, alpha), (0, i), (60, i))
-        # Draw slot border
-        pygame.draw.rect(self.slot_frame, (218, 165, 32, 200), (0, 0, 60, 60), 2)
-        # Add inner highlight
-        pygame.draw.rect(self.slot_frame, (255, 255, 255, 30), (2, 2, 56, 56), 1)
-        # Add corner dots
-        for x, y in [(2, 2), (57, 2), (2, 57), (57, 57)]:
-            pygame.draw.circle(self.slot_frame, (218, 165, 32, 255), (x, y), 2)
+        self.inventory_frame = chrome.inventory_frame((270, 320))
 
-        # Initialize inventory slots
-        self.inventory_slots = []
-        slot_size = 60
-        slot_padding = 10
-        slots_per_row = 3
-        for i in range(5):  # 5 slots for items
-            row = i // slots_per_row
-            col = i % slots_per_row
-            x = self.inventory_rect.x + col * (slot_size + slot_padding) + slot_padding
-            y = self.inventory_rect.y + row * (slot_size + slot_padding) + slot_padding
-            self.inventory_slots.append({
-                'rect': pygame.Rect(x, y, slot_size, slot_size),
-                'item': None,
-                'highlighted': False
-            })
+        # Items are shown by the retained inventory widget, laid out inside
+        # the frame and scrolled with the mouse wheel
+        self.inventory.cleanup()
+        self.inventory = Inventory(self.inventory_rect, UIStyle(
+            font_name="Arial",
+            font_size=14,
+            text_color=self.colors['text'],
+            background_color=(0, 0, 0, 0),
+            border_color=self.colors['inventory_border'],
+            border_width=1,
+            padding=10
+        ), columns=3, item_size=60)
 
         # Initialize drag state
         self.dragged_item = None
@@ -214,15 +189,31 @@ class BlindMarketplace(BaseScene):
         ]
         self.current_welcome_index = 0
         self.show_welcome_message = True
+        
+        # Index the NPCs for hit-testing
+        for npc_id, npc_data in self.npcs.items():
+            self.input_manager.add_hotspot(("npc", npc_id), npc_data['rect'])
         self.message_delay = 3.0  # seconds between messages
         self.message_timer = 0.0
         
+        # Retained overlays; their surfaces are rebuilt only when the text changes
+        self.message_font = pygame.font.Font(None, 36)
+        self.welcome_panel = MessagePanel(self.message_font, self.colors['text'], self.colors['text_shadow'],
+                                          (0, 0, 0, 180),  # Darker, more atmospheric background
+                                          self.colors['panel_border'])
+        self.message_panel = MessagePanel(self.message_font, self.colors['text'], self.colors['text_shadow'],
+                                          self.colors['panel_background'], self.colors['panel_border'],
+                                          anchor="bottom")
+        self.haze = pygame.Surface((1280, 720), pygame.SRCALPHA)
+        self.haze.fill(self.colors['haze'])
+        
     def handle_events(self, event: pygame.event.Event) -> None:
         """Handle scene-specific events.
         
         Args:
             event: The pygame event to handle.
         """
+        super().handle_events(event)
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 if self.show_welcome_message:
@@ -257,6 +248,11 @@ class BlindMarketplace(BaseScene):
             elif event.key == pygame.K_RIGHT:
                 self.moving_right = False
                 
+    def handle_input(self, snapshot: InputSnapshot) -> None:
+        """Highlight the inventory item under the pointer when it moves."""
+        if snapshot.moved:
+            self.inventory.set_highlight(self.inventory.item_at(snapshot.mouse_pos))
+                
     def _handle_click(self, pos: tuple[int, int]) -> None:
         """Handle mouse click events.
         
@@ -264,8 +260,8 @@ class BlindMarketplace(BaseScene):
             pos: Mouse position (x, y)
         """
         # Check if click is on an NPC
-        for npc_id, npc_data in self.npcs.items():
-            if npc_data['rect'].collidepoint(pos):
+        for kind, npc_id in self.input_manager.hotspots_at(pos):
+            if kind == "npc":
                 self._handle_npc_click(npc_id)
                 return
                 
@@ -353,7 +349,9 @@ class BlindMarketplace(BaseScene):
         
         # Draw character
         if self.character_visible:
-            char_image = pygame.transform.flip(self.character_image, self.character_direction < 0, False)
+            char_image = self.character_image
+            if self.character_direction < 0:
+                char_image = self.sprite_variants.flipped(char_image)
             screen.blit(char_image, (self.character_pos[0] - char_image.get_width() // 2,
                                    self.character_pos[1] - char_image.get_height() // 2))
             
@@ -365,7 +363,9 @@ class BlindMarketplace(BaseScene):
                 screen.blit(self.dragon_images[npc_data['dragon']], dragon_pos)
             
         # Draw inventory
-        screen.blit(self.inventory_frame, (self.inventory_rect.x - 10, self.inventory_rect.y - 10))
+        with self.profiler.span("render.inventory"):
+            screen.blit(self.inventory_frame, (self.inventory_rect.x - 10, self.inventory_rect.y - 10))
+            self.inventory.render(screen)
         
         # Draw welcome message or regular text messages
         if self.show_welcome_message and self.current_welcome_index < len(self.welcome_messages):
@@ -374,50 +374,17 @@ class BlindMarketplace(BaseScene):
             self._draw_text_message(screen, self.text_messages[0])
             
         # Draw haze overlay
-        haze = pygame.Surface((1280, 720), pygame.SRCALPHA)
-        haze.fill(self.colors['haze'])
-        screen.blit(haze, (0, 0))
+        screen.blit(self.haze, (0, 0))
         
     def _draw_centered_text(self, screen: pygame.Surface, text: str) -> None:
         """Draw centered text with a semi-transparent background."""
-        font = pygame.font.Font(None, 36)
-        text_surface = font.render(text, True, self.colors['text'])
-        text_shadow = font.render(text, True, self.colors['text_shadow'])
-        
-        # Create background panel
-        panel_width = text_surface.get_width() + 40
-        panel_height = text_surface.get_height() + 20
-        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel.fill((0, 0, 0, 180))  # Darker, more atmospheric background
-        pygame.draw.rect(panel, self.colors['panel_border'], (0, 0, panel_width, panel_height), 2)
-        
-        # Position at center of screen
-        panel_x = (screen.get_width() - panel_width) // 2
-        panel_y = (screen.get_height() - panel_height) // 2
-        
-        # Draw panel and text
-        screen.blit(panel, (panel_x, panel_y))
-        screen.blit(text_shadow, (panel_x + 22, panel_y + 12))  # Offset shadow
-        screen.blit(text_surface, (panel_x + 20, panel_y + 10))
+        self.welcome_panel.set_text(text)
+        self.welcome_panel.render(screen)
         
     def _draw_text_message(self, screen: pygame.Surface, text: str) -> None:
         """Draw regular text message at the bottom of the screen."""
-        font = pygame.font.Font(None, 36)
-        text_surface = font.render(text, True, self.colors['text'])
-        text_shadow = font.render(text, True, self.colors['text_shadow'])
-        
-        panel_width = text_surface.get_width() + 40
-        panel_height = text_surface.get_height() + 20
-        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel.fill(self.colors['panel_background'])
-        pygame.draw.rect(panel, self.colors['panel_border'], (0, 0, panel_width, panel_height), 2)
-        
-        panel_x = (screen.get_width() - panel_width) // 2
-        panel_y = screen.get_height() - panel_height - 20
-        
-        screen.blit(panel, (panel_x, panel_y))
-        screen.blit(text_shadow, (panel_x + 22, panel_y + 12))
-        screen.blit(text_surface, (panel_x + 20, panel_y + 10))
+        self.message_panel.set_text(text)
+        self.message_panel.render(screen)
         
     def cleanup(self) -> None:
         """Clean up scene resources."""
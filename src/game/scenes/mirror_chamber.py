@@ -7,18 +7,39 @@ from typing import Dict, List, Optional, Tuple
 import pygame
 import math
 import random
-from ..core.scene_manager import Scene
-from ..core.resource_manager import ResourceManager
+import numpy as np
+from ..core.scene_manager import Retention, Scene
 from ..core.input_manager import InputManager
+from ..core.game_clock import get_game_clock
+from ..core.event_batcher import InputSnapshot
 from .base_scene import BaseScene
+from ..ui.text_cache import get_text_renderer
+from ..ui import chrome
+from ..effects.particles import ParticleSystem, bake_circles
+from ..effects.proximity import ProximityGlow
 
 class MirrorChamber(BaseScene):
+    preload_images = BaseScene.preload_images + [
+        ("backgrounds/background_home.png", (1280, 720)),
+        ("characters/main_character.png", 0.8),
+        ("characters/Serpent.png", 0.5)
+    ]
+    preload_sounds = [
+        "shard_collect.wav",
+        "shard_place.wav",
+        "serpent_appear.wav",
+        "serpent_defeat.wav"
+    ]
+    
+    # Pooled when left, so returning skips rebuilding its panels and art
+    retention = Retention.SUSPEND
+    
     def __init__(self, game_state):
         """Initialize the Mirror Chamber scene."""
         super().__init__(game_state)
         self.scene_name = "mirror_chamber"
-        self.resource_manager = ResourceManager()
         self.input_manager = InputManager()
+        self.clock = get_game_clock()
         
         # Scene state
         self.all_shards_collected = False
@@ -32,7 +53,6 @@ class MirrorChamber(BaseScene):
         self.light_flicker_speed = 2.0
         self.water_drip_timer = 0.0
         self.water_drip_interval = 3.0  # Seconds between drips
-        self.water_drips = []  # List of active water drip animations
         
         # Colors with new atmospheric effects
         self.colors = {
@@ -53,24 +73,21 @@ class MirrorChamber(BaseScene):
             'light_ray': (255, 255, 220, 30),  # Soft light color
             'water': (200, 220, 255, 128)  # Water droplet color
         }
+        self.water_drips = ParticleSystem(bake_circles(self.colors['water'], (2, 3, 4)), capacity=64)
         
-        # Load and scale background
-        self.background = self.resource_manager.load_image("backgrounds/background_home.png")
-        self.background = pygame.transform.scale(self.background, (1280, 720))
+        # Decode the scene's art in parallel; the loads below are cache hits
+        self.resource_manager.load_images(self.preload_images)
         
-        # Load and scale character
-        self.character_image = self.resource_manager.load_image("characters/main_character.png")
+        # Load background and character art at display size
+        self.background = self.resource_manager.load_image("backgrounds/background_home.png", size=(1280, 720))
         self.character_scale = 0.8
-        char_size = (int(self.character_image.get_width() * self.character_scale),
-                    int(self.character_image.get_height() * self.character_scale))
-        self.character_image = pygame.transform.scale(self.character_image, char_size)
+        self.character_image = self.resource_manager.load_image("characters/main_character.png",
+                                                                scale=self.character_scale)
         
         # Load serpent image
-        self.serpent_image = self.resource_manager.load_image("characters/Serpent.png")
         self.serpent_scale = 0.5
-        serpent_size = (int(self.serpent_image.get_width() * self.serpent_scale),
-                       int(self.serpent_image.get_height() * self.serpent_scale))
-        self.serpent_image = pygame.transform.scale(self.serpent_image, serpent_size)
+        self.serpent_image = self.resource_manager.load_image("characters/Serpent.png", scale=self.serpent_scale)
+        serpent_size = self.serpent_image.get_size()
         self.serpent_visible = False
         self.serpent_position = [640, 360]  # Center of the screen
         self.serpent_rect = pygame.Rect(self.serpent_position[0], self.serpent_position[1],
@@ -86,8 +103,7 @@ class MirrorChamber(BaseScene):
                 "rect": pygame.Rect(180, ground_y, 50, 50),
                 "image": None,
                 "symbol": "ichthys",  # Fish symbol
-                "whisper": "Now we see through a glass, darkly...",
-                "glow_alpha": 0
+                "whisper": "Now we see through a glass, darkly..."
             },
             {
                 "collected": False,
@@ -95,8 +111,7 @@ class MirrorChamber(BaseScene):
                 "rect": pygame.Rect(420, ground_y - 30, 50, 50),
                 "image": None,
                 "symbol": "cross",  # Cross symbol
-                "whisper": "You shall know the truth...",
-                "glow_alpha": 0
+                "whisper": "You shall know the truth..."
             },
             {
                 "collected": False,
@@ -104,8 +119,7 @@ class MirrorChamber(BaseScene):
                 "rect": pygame.Rect(650, ground_y + 20, 50, 50),
                 "image": None,
                 "symbol": "triangle",  # Trinity triangle
-                "whisper": "Who told you that you were naked?",
-                "glow_alpha": 0
+                "whisper": "Who told you that you were naked?"
             },
             {
                 "collected": False,
@@ -113,8 +127,7 @@ class MirrorChamber(BaseScene):
                 "rect": pygame.Rect(850, ground_y - 15, 50, 50),
                 "image": None,
                 "symbol": "serpent",  # Serpent symbol
-                "whisper": "The serpent was more crafty than any other...",
-                "glow_alpha": 0
+                "whisper": "The serpent was more crafty than any other..."
             },
             {
                 "collected": False,
@@ -122,8 +135,7 @@ class MirrorChamber(BaseScene):
                 "rect": pygame.Rect(1050, ground_y + 10, 50, 50),
                 "image": None,
                 "symbol": "dove",  # Dove symbol
-                "whisper": "The Spirit of truth will guide you...",
-                "glow_alpha": 0
+                "whisper": "The Spirit of truth will guide you..."
             }
         ]
         
@@ -140,37 +152,8 @@ class MirrorChamber(BaseScene):
         
         # Inventory system
         self.inventory_rect = pygame.Rect(10, 10, 250, 300)
-        self.inventory_frame = pygame.Surface((270, 320), pygame.SRCALPHA)
-        
-        # Create gradient background for inventory
-        for i in range(320):
-            alpha = 128 + (i / 320) * 64
-            pygame.draw.line(self.inventory_frame, (20, 20, 30, alpha), (0, i), (270, i))
-        
-        # Draw main panel
-        pygame.draw.rect(self.inventory_frame, (30, 30, 40, 200), (10, 10, 250, 300))
-        
-        # Draw golden border
-        pygame.draw.rect(self.inventory_frame, (218, 165, 32, 255), (10, 10, 250, 300), 2)
-        
-        # Draw corner decorations
-        for x, y in [(10, 10), (250, 10), (10, 300), (250, 300)]:
-            pygame.draw.circle(self.inventory_frame, (218, 165, 32, 255), (x, y), 5)
-            pygame.draw.circle(self.inventory_frame, (255, 215, 0, 128), (x, y), 3)
-        
-        # Create slot frame template
-        self.slot_frame = pygame.Surface((60, 60), pygame.SRCALPHA)
-        # Gradient background for slot
-        for i in range(60):
-            alpha = 96 + (i / 60) * 32
-            pygame.draw.line(self.slot_frame, (25, 25, 35, alpha), (0, i), (60, i))
-        # Draw slot border
-        pygame.draw.rect(self.slot_frame, (218, 165, 32, 200), (0, 0, 60, 60), 2)
-        # Add inner highlight
-        pygame.draw.rect(self.slot_frame, (255, 255, 255, 30), (2, 2, 56, 56), 1)
-        # Add corner dots
-        for x, y in [(2, 2), (57, 2), (2, 57), (57, 57)]:
-            pygame.draw.circle(self.slot_frame, (218, 165, 32, 255), (x, y), 2)
+        self.inventory_frame = chrome.inventory_frame((270, 320))
+        self.slot_frame = chrome.slot_frame(60)
 
         # Initialize inventory slots
         self.inventory_slots = []
@@ -188,67 +171,25 @@ class MirrorChamber(BaseScene):
                 'highlighted': False
             })
 
+        # Frame, slots, items and highlights are composed into one surface,
+        # rebuilt only when what the slots show changes
+        self.inventory_panel: Optional[pygame.Surface] = None
+        self.inventory_panel_state: Optional[Tuple] = None
+
         # Initialize drag state
         self.dragged_item = None
         self.drag_offset = (0, 0)
         
         # Mirror frame for shard placement (moved further right and up)
         self.mirror_frame_rect = pygame.Rect(1050, 30, 200, 350)  # Moved further right and made slightly smaller
-        self.mirror_frame = pygame.Surface((200, 350), pygame.SRCALPHA)
-        # Add gradient background to mirror frame
-        for y in range(350):
-            alpha = max(180, int(200 * (1 - y/350)))
-            pygame.draw.line(self.mirror_frame, (40, 35, 45, alpha), (0, y), (200, y))
-        # Add frame border
-        pygame.draw.rect(self.mirror_frame, (139, 105, 20), pygame.Rect(0, 0, 200, 350), 3)
+        self.mirror_frame = chrome.mirror_frame((200, 350))
         self.mirror_slots = []
         self._setup_mirror_frame()
         
         # UI Elements - Move dialogue to top middle
         self.dialogue_rect = pygame.Rect(280, 20, 720, 80)  # Moved to top
         self.dialogue_frame_rect = pygame.Rect(270, 10, 740, 100)  # Moved to top
-        self.dialogue_frame = pygame.Surface((740, 100), pygame.SRCALPHA)
-        
-        # Create gradient background for dialogue
-        for y in range(100):
-            alpha = max(180, int(200 * (1 - y/100)))
-            pygame.draw.line(self.dialogue_frame, (30, 25, 35, alpha), 
-                           (0, y), (740, y))
-        
-        # Main panel
-        pygame.draw.rect(self.dialogue_frame, (45, 40, 50, 230), pygame.Rect(10, 10, 720, 80))
-        # Golden border
-        pygame.draw.rect(self.dialogue_frame, (139, 105, 20), pygame.Rect(10, 10, 720, 80), 3)
-        
-        # Corner decorations
-        corner_size = 20
-        for x, y in [(10, 10), (710, 10), (10, 70), (710, 70)]:
-            # Outer corner
-            pygame.draw.rect(self.dialogue_frame, (184, 134, 11), (x, y, corner_size, corner_size), 2)
-            # Inner corner
-            pygame.draw.rect(self.dialogue_frame, (218, 165, 32), (x+3, y+3, corner_size-6, corner_size-6), 1)
-            # Corner dot
-            pygame.draw.circle(self.dialogue_frame, (218, 165, 32), (x + corner_size//2, y + corner_size//2), 2)
-        
-        # Add decorative lines along the border
-        line_length = 20
-        spacing = 40
-        for i in range(30, 700, spacing):
-            # Top border
-            pygame.draw.line(self.dialogue_frame, (184, 134, 11), 
-                           (i, 10), (i + line_length, 10), 2)
-            # Bottom border
-            pygame.draw.line(self.dialogue_frame, (184, 134, 11),
-                           (i, 90), (i + line_length, 90), 2)
-        
-        # Side decorations
-        for y in range(30, 70, spacing):
-            # Left border
-            pygame.draw.line(self.dialogue_frame, (184, 134, 11),
-                           (10, y), (10, y + line_length), 2)
-            # Right border
-            pygame.draw.line(self.dialogue_frame, (184, 134, 11),
-                           (730, y), (730, y + line_length), 2)
+        self.dialogue_frame = chrome.dialogue_frame((740, 100))
         
         self.dialogue_text = ""
         self.dialogue_timer = 0
@@ -256,6 +197,7 @@ class MirrorChamber(BaseScene):
         # Load fonts
         self.font = pygame.font.SysFont('Arial', 32)
         self.title_font = pygame.font.SysFont('Arial', 40)
+        self.text_renderer = get_text_renderer()
         
         # Dialogue state
         self.dialogues = [
@@ -305,10 +247,95 @@ class MirrorChamber(BaseScene):
         self.test_button_text = "Fill All Shards"
         self.test_button_font = pygame.font.Font(None, 24)
         
+        # Hit-testing goes through the input manager's hotspot index
+        self.hovered_slots: List[Dict[str, any]] = []
+        self.pointer_pos = pygame.mouse.get_pos()
+        self._register_hotspots()
+        
+        # Shards glow while the pointer is within 100 pixels of them
+        self.shard_glow = ProximityGlow(self.input_manager.hotspot_index, radius=100)
+        for index in range(len(self.mirror_shards)):
+            self.shard_glow.add(("shard", index), self.shard_glow_surface)
+        self.shard_glow.pointer_moved(self.pointer_pos)
+        
         # Initialize serpent animation
         self.serpent_animation_frame = 0
         self.serpent_animation_speed = 0.2
         
+        # Positions before the last simulation step, interpolated towards
+        # the current ones when rendering between steps
+        self.character_previous_pos: Optional[Tuple[int, int]] = None
+        self.serpent_previous_pos: Optional[Tuple[int, int]] = None
+        
+    def reset(self) -> bool:
+        """Restart the puzzle in place, keeping the built panels and art."""
+        self.all_shards_collected = False
+        self.mirror_complete = False
+        self.serpent_defeated = False
+        self.can_exit = False
+        self.water_drip_timer = 0.0
+        self.water_drips.clear()
+        
+        for shard in self.mirror_shards:
+            shard["collected"] = False
+        for slot in self.inventory_slots:
+            slot["item"] = None
+            slot["highlighted"] = False
+        for slot in self.mirror_slots:
+            slot["shard"] = None
+            slot["highlighted"] = False
+        self.hovered_slots = []
+        self.dragged_item = None
+        self.drag_offset = (0, 0)
+        
+        # Character and serpent
+        self.character_pos = [640, self.character_y]
+        self.character_position = (400, 500)
+        self.character_rect = pygame.Rect(400, 500, 100, 100)
+        self.character_target = None
+        self.character_direction = 1
+        self.character_visible = True
+        self.character_moving = False
+        self.serpent_visible = False
+        self.serpent_position = [640, 360]
+        self.serpent_rect.topleft = self.serpent_position
+        self.input_manager.move_hotspot(("serpent", 0), self.serpent_rect)
+        self.serpent_animation_frame = 0
+        self.serpent_image = self.serpent_frames[0]
+        self.character_previous_pos = None
+        self.serpent_previous_pos = None
+        
+        # Dialogue and cutscene
+        self.current_dialogue_index = 0
+        self.current_dialogue = self.dialogues[0]
+        self.dialogue_active = True
+        self.dialogue_text = self.dialogues[0]
+        self.displayed_text = ""
+        self.dialogue_timer = 0
+        self.typing_timer = 0
+        self.typing_index = 0
+        self.last_type_time = 0
+        self.cutscene_active = False
+        self.cutscene_timer = 0
+        self.cutscene_phase = 0
+        
+        self.shard_glow.reset()
+        self.shard_glow.pointer_moved(self.pointer_pos)
+        return True
+        
+    def _interpolated(self, previous: Optional[Tuple[int, int]], rect: pygame.Rect) -> Tuple[int, int]:
+        """Get where to draw a moving sprite between its last two simulated positions.
+        
+        Args:
+            previous: Top-left corner before the last step, or None.
+            rect: The sprite's current rect.
+        """
+        if previous is None:
+            return rect.topleft
+        alpha = self.clock.alpha
+        return (round(previous[0] + (rect.x - previous[0]) * alpha),
+                round(previous[1] + (rect.y - previous[1]) * alpha))
+        
     def _setup_inventory(self):
         """Setup inventory slots with medieval styling."""
         slot_size = 50
@@ -371,58 +398,73 @@ class MirrorChamber(BaseScene):
         self.current_dialogue = message
         self.dialogue_timer = 0
         
+    def _register_hotspots(self) -> None:
+        """Index every clickable region, ranked in click priority order."""
+        hotspots = self.input_manager
+        hotspots.add_hotspot(("test_button", 0), self.test_button, z=5)
+        hotspots.add_hotspot(("door", 0), self.door_rect, z=4)
+        hotspots.add_hotspot(("serpent", 0), self.serpent_rect, z=3)
+        for index, shard in enumerate(self.mirror_shards):
+            hotspots.add_hotspot(("shard", index), shard["rect"], z=2)
+        for index, slot in enumerate(self.inventory_slots):
+            hotspots.add_hotspot(("inventory", index), slot["rect"], z=1)
+        for index, slot in enumerate(self.mirror_slots):
+            hotspots.add_hotspot(("mirror", index), slot["rect"], z=0)
+            
+    def _fill_all_shards(self) -> None:
+        """Collect every shard and place them all in the mirror (test button)."""
+        for shard in self.mirror_shards:
+            if not shard["collected"]:
+                shard["collected"] = True
+                # Add to inventory
+                for slot in self.inventory_slots:
+                    if not slot["item"]:
+                        slot["item"] = shard
+                        break
+        
+        # Place all shards in mirror slots
+        for slot in self.mirror_slots:
+            if not slot["shard"]:
+                # Find a shard in inventory
+                for inv_slot in self.inventory_slots:
+                    if inv_slot["item"]:
+                        slot["shard"] = inv_slot["item"]
+                        inv_slot["item"] = None
+                        break
+        
+        # Check if mirror is complete
+        placed_count = sum(1 for s in self.mirror_slots if s["shard"])
+        if placed_count == len(self.mirror_slots):
+            self._check_puzzle_completion()
+            
     def handle_events(self, event: pygame.event.Event) -> None:
         """Handle scene events."""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            # Check test button
-            if self.test_button.collidepoint(event.pos):
-                # Fill all shards
-                for shard in self.mirror_shards:
-                    if not shard["collected"]:
-                        shard["collected"] = True
-                        # Add to inventory
-                        for slot in self.inventory_slots:
-                            if not slot["item"]:
-                                slot["item"] = shard
-                                break
-                
-                # Place all shards in mirror slots
-                for slot in self.mirror_slots:
-                    if not slot["shard"]:
-                        # Find a shard in inventory
-                        for inv_slot in self.inventory_slots:
-                            if inv_slot["item"]:
-                                slot["shard"] = inv_slot["item"]
-                                inv_slot["item"] = None
-                                break
-                
-                # Check if mirror is complete
-                placed_count = sum(1 for s in self.mirror_slots if s["shard"])
-                if placed_count == len(self.mirror_slots):
-                    self._check_puzzle_completion()
-                
-                return
-
-            # Check for door click when available
-            if self.can_exit and self.door_rect.collidepoint(event.pos):
-                self.start_transition("blind_marketplace")
-                return
-            
-            # Check for serpent defeat when all shards are placed
-            if self.mirror_complete and self.serpent_visible:
-                if self.serpent_rect.collidepoint(event.pos):
+            # A single index query returns the regions under the pointer in
+            # priority order; the first one that can act takes the click
+            for kind, index in self.input_manager.hotspots_at(event.pos):
+                if kind == "test_button":
+                    self._fill_all_shards()
+                    return
+                    
+                # Check for door click when available
+                if kind == "door" and self.can_exit:
+                    self.start_transition("blind_marketplace")
+                    return
+                    
+                # Check for serpent defeat when all shards are placed
+                if kind == "serpent" and self.mirror_complete and self.serpent_visible:
                     self._break_free_from_serpent()
                     return
-            
-            # Check for shard collection
-            for shard in self.mirror_shards:
-                if not shard["collected"] and shard["rect"].collidepoint(event.pos):
-                    self._collect_shard(shard)
+                    
+                # Check for shard collection
+                if kind == "shard" and not self.mirror_shards[index]["collected"]:
+                    self._collect_shard(self.mirror_shards[index])
                     return
-            
-            # Check for inventory interaction
-            for slot in self.inventory_slots:
-                if slot["rect"].collidepoint(event.pos) and slot["item"]:
+                    
+                # Check for inventory interaction
+                if kind == "inventory" and self.inventory_slots[index]["item"]:
+                    slot = self.inventory_slots[index]
                     self.dragged_item = slot["item"]
                     slot["item"] = None
                     self.drag_offset = (
@@ -430,13 +472,11 @@ class MirrorChamber(BaseScene):
                         slot["rect"].y - event.pos[1]
                     )
                     return
-            
-            # Check for mirror slot interaction
-            if self.dragged_item:
-                for slot in self.mirror_slots:
-                    if slot["rect"].collidepoint(event.pos) and not slot["shard"]:
-                        self._place_shard(slot)
-                        return
+                    
+                # Check for mirror slot interaction
+                if kind == "mirror" and self.dragged_item and not self.mirror_slots[index]["shard"]:
+                    self._place_shard(self.mirror_slots[index])
+                    return
             
             # Handle character movement
             if not self.mirror_frame_rect.collidepoint(event.pos):
@@ -451,19 +491,20 @@ class MirrorChamber(BaseScene):
             if self.dragged_item:
                 # Try to place in mirror slots first
                 mouse_pos = pygame.mouse.get_pos()
+                hits = self.input_manager.hotspots_at(mouse_pos)
                 placed = False
                 
-                for slot in self.mirror_slots:
-                    if slot["rect"].collidepoint(mouse_pos) and not slot["shard"]:
-                        self._place_shard(slot)
+                for kind, index in hits:
+                    if kind == "mirror" and not self.mirror_slots[index]["shard"]:
+                        self._place_shard(self.mirror_slots[index])
                         placed = True
                         break
                 
                 # If not placed in mirror, try inventory slots
                 if not placed:
-                    for slot in self.inventory_slots:
-                        if slot["rect"].collidepoint(mouse_pos) and not slot["item"]:
-                            slot["item"] = self.dragged_item
+                    for kind, index in hits:
+                        if kind == "inventory" and not self.inventory_slots[index]["item"]:
+                            self.inventory_slots[index]["item"] = self.dragged_item
                             placed = True
                             break
                 
@@ -476,27 +517,39 @@ class MirrorChamber(BaseScene):
                 
                 self.dragged_item = None
                 self.drag_offset = (0, 0)
-        
-        elif event.type == pygame.MOUSEMOTION:
-            # Update highlighted states
-            mouse_pos = pygame.mouse.get_pos()
+
+    def handle_input(self, snapshot: InputSnapshot) -> None:
+        """Track the pointer once per frame, however many motion events arrived."""
+        self.pointer_pos = snapshot.mouse_pos
+        if snapshot.moved:
+            self.shard_glow.pointer_moved(self.pointer_pos)
             
-            # Update inventory slot highlights
-            for slot in self.inventory_slots:
-                slot["highlighted"] = slot["rect"].collidepoint(mouse_pos)
+            # Update highlighted states
+            for slot in self.hovered_slots:
+                slot["highlighted"] = False
+            self.hovered_slots = []
             
-            # Update mirror slot highlights
-            for slot in self.mirror_slots:
-                slot["highlighted"] = (
-                    slot["rect"].collidepoint(mouse_pos) and 
-                    self.dragged_item and 
-                    not slot["shard"]
-                )
+            # Highlight the inventory slot under the pointer, and the mirror
+            # slot if a shard is being dragged onto it
+            for kind, index in self.input_manager.hotspots_at(self.pointer_pos):
+                if kind == "inventory":
+                    slot = self.inventory_slots[index]
+                elif kind == "mirror" and self.dragged_item and not self.mirror_slots[index]["shard"]:
+                    slot = self.mirror_slots[index]
+                else:
+                    continue
+                slot["highlighted"] = True
+                self.hovered_slots.append(slot)
 
     def update(self, dt: float) -> None:
         """Update game state."""
         super().update(dt)
         
+        # Remember where moving sprites were drawn from; a sprite that just
+        # appeared has nothing to interpolate from
+        self.character_previous_pos = self.character_rect.topleft if self.character_visible else None
+        self.serpent_previous_pos = self.serpent_rect.topleft if self.serpent_visible else None
+        
         # Check if all shards are collected
         self.all_shards_collected = all(shard["collected"] for shard in self.mirror_shards)
         
@@ -509,35 +562,29 @@ class MirrorChamber(BaseScene):
         # Update serpent position if visible
         if self.serpent_visible:
             # Make serpent move in a figure-8 pattern
-            time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
+            time = self.clock.time
             self.serpent_position[0] = 640 + math.sin(time) * 200
             self.serpent_position[1] = 360 + math.cos(time * 0.5) * 100
             self.serpent_rect.x = self.serpent_position[0] - self.serpent_rect.width // 2
             self.serpent_rect.y = self.serpent_position[1] - self.serpent_rect.height // 2
+            self.input_manager.move_hotspot(("serpent", 0), self.serpent_rect)
         
         # Update light flicker
-        self.light_flicker_intensity = (math.sin(pygame.time.get_ticks() * 0.001 * self.light_flicker_speed) + 1) * 0.5
+        self.light_flicker_intensity = (math.sin(self.clock.time * self.light_flicker_speed) + 1) * 0.5
         
         # Update water drips
         self.water_drip_timer += dt
         if self.water_drip_timer >= self.water_drip_interval:
             self.water_drip_timer = 0
-            # Add new water drip
-            self.water_drips.append({
-                'x': random.randint(100, 1180),
-                'y': 0,
-                'speed': random.uniform(100, 150),
-                'size': random.uniform(2, 4),
-                'alpha': 255
-            })
+            # Add new water drip; it falls off the bottom of the screen and
+            # fades out over the last 120 pixels
+            speed = random.uniform(100, 150)
+            self.water_drips.emit(1, random.randint(100, 1180), 0, vy=speed,
+                                  life=720 / speed, fade_time=120 / speed,
+                                  sprite=random.randrange(3))
         
         # Update existing water drips
-        for drip in self.water_drips[:]:
-            drip['y'] += drip['speed'] * dt
-            if drip['y'] > 720:
-                self.water_drips.remove(drip)
-            elif drip['y'] > 600:  # Start fading out near bottom
-                drip['alpha'] = max(0, drip['alpha'] - 300 * dt)
+        self.water_drips.update(dt)
         
         # Update character movement with proper boundaries
         if self.character_target is not None and self.character_moving:
@@ -566,7 +613,7 @@ class MirrorChamber(BaseScene):
         
         # Update dialogue typing effect
         if self.dialogue_active and self.dialogue_text:
-            current_time = pygame.time.get_ticks() / 1000  # Convert to seconds
+            current_time = self.clock.time
             if current_time - self.last_type_time >= self.typing_speed:
                 if self.typing_index < len(self.dialogue_text):
                     self.displayed_text = self.dialogue_text[:self.typing_index + 1]
@@ -591,18 +638,7 @@ class MirrorChamber(BaseScene):
                 self.cutscene_phase = 2
                 
         # Update shard glow effects
-        mouse_pos = pygame.mouse.get_pos()
-        for shard in self.mirror_shards:
-            if not shard["collected"]:
-                # Increase glow when mouse is near
-                distance = math.sqrt(
-                    (mouse_pos[0] - shard["rect"].centerx)**2 +
-                    (mouse_pos[1] - shard["rect"].centery)**2
-                )
-                if distance < 100:
-                    shard["glow_alpha"] = min(shard["glow_alpha"] + 300 * dt, 255)
-                else:
-                    shard["glow_alpha"] = max(shard["glow_alpha"] - 300 * dt, 0)
+        self.shard_glow.update(dt)
 
     def _draw_decorative_panel(self, surface: pygame.Surface, rect: pygame.Rect, title: str = None):
         """Draw a decorative panel with medieval styling."""
@@ -631,43 +667,60 @@ class MirrorChamber(BaseScene):
             text_rect = text_surface.get_rect(midtop=(rect.centerx, rect.y + 10))
             surface.blit(text_surface, text_rect)
             
+    def _draw_door(self, surface: pygame.Surface) -> None:
+        """Draw the exit door."""
+        door_color = (139, 69, 19)  # Brown
+        pygame.draw.rect(surface, door_color, self.door_rect)
+        # Door handle
+        handle_pos = (self.door_rect.right - 20, self.door_rect.centery)
+        pygame.draw.circle(surface, (218, 165, 32), handle_pos, 5)
+        # Door frame
+        pygame.draw.rect(surface, (101, 67, 33), self.door_rect, 3)
+            
+    def _inventory_state(self) -> Tuple:
+        """Get what the inventory slots currently show, to detect changes."""
+        return tuple((id(slot['item']) if slot['item'] else None, slot['highlighted'])
+                     for slot in self.inventory_slots)
+        
+    def _compose_inventory_panel(self) -> pygame.Surface:
+        """Draw the inventory frame with its slots, items and highlights."""
+        panel = self.inventory_frame.copy()
+        origin_x = self.inventory_rect.x - 20
+        origin_y = self.inventory_rect.y - 20
+        
+        # Draw inventory slots with improved styling and centered items
+        for slot in self.inventory_slots:
+            rect = slot['rect'].move(-origin_x, -origin_y)
+            panel.blit(self.slot_frame, rect)
+            if slot['item']:
+                # Center the item in the slot
+                item_x = rect.centerx - slot['item']['image'].get_width() // 2
+                item_y = rect.centery - slot['item']['image'].get_height() // 2
+                panel.blit(slot['item']['image'], (item_x, item_y))
+            if slot['highlighted']:
+                # Golden highlight effect, opaque as it appeared on the display
+                pygame.draw.rect(panel, (218, 165, 32), rect, 3)
+                # Inner glow
+                pygame.draw.rect(panel, (255, 223, 0), rect.inflate(-4, -4), 2)
+        return panel
+            
     def render(self, screen: pygame.Surface) -> None:
         """Render the scene."""
-        # Draw background and existing elements
-        screen.blit(self.background, (0, 0))
-        
-        # Draw door if player can exit
-        if self.can_exit:
-            door_color = (139, 69, 19)  # Brown
-            pygame.draw.rect(screen, door_color, self.door_rect)
-            # Door handle
-            handle_pos = (self.door_rect.right - 20, self.door_rect.centery)
-            pygame.draw.circle(screen, (218, 165, 32), handle_pos, 5)
-            # Door frame
-            pygame.draw.rect(screen, (101, 67, 33), self.door_rect, 3)
-        
-        # Draw scripture on walls
-        screen.blit(self.scripture_surface, (0, 0))
-        
-        # Draw stained glass dome with flicker effect
-        flicker_surface = self.dome_surface.copy()
-        flicker_surface.set_alpha(int(128 + 64 * self.light_flicker_intensity))
-        screen.blit(flicker_surface, (0, 0))
-        
-        # Draw light rays with flicker
-        ray_alpha = int(40 + 20 * self.light_flicker_intensity)
-        for ray in self.light_rays:
-            ray_surface = pygame.Surface((ray['width'], 720), pygame.SRCALPHA)
-            for y in range(0, 720, 2):
-                alpha = int(ray['alpha'] * (1 - y/720) * self.light_flicker_intensity)
-                pygame.draw.line(ray_surface, (*self.colors['light_ray'][:3], alpha),
-                               (ray['width']//2, y), (ray['width']//2, y+1), ray['width'])
-            screen.blit(ray_surface, (ray['x'] - ray['width']//2, 0))
+        # Background, door and scripture come from the cached backdrop; the
+        # dome flickers by changing its surface alpha
+        self.layers.set_visible("door", self.can_exit)
+        self.layers.set_alpha("dome", int(128 + 64 * self.light_flicker_intensity))
+        
+        # Light rays flicker by fading their precomputed gradient sprites
+        ray_alpha = int(255 * self.light_flicker_intensity)
+        for index in range(len(self.light_rays)):
+            self.layers.set_alpha(f"light_ray_{index}", ray_alpha)
+        with self.profiler.span("render.backdrop"):
+            self.layers.render(screen)
         
         # Draw water drips
-        for drip in self.water_drips:
-            pygame.draw.circle(screen, (*self.colors['water'][:3], int(drip['alpha'])),
-                             (int(drip['x']), int(drip['y'])), drip['size'])
+        with self.profiler.span("render.particles"):
+            self.water_drips.render(screen)
         
         # Draw mirror frame and slots
         screen.blit(self.mirror_frame, self.mirror_frame_rect)
@@ -678,99 +731,71 @@ class MirrorChamber(BaseScene):
                 screen.blit(slot['shard']['image'], slot['rect'])
         
         # Draw mirror shards with glow effects
-        for shard in self.mirror_shards:
+        for index, shard in enumerate(self.mirror_shards):
             if not shard["collected"]:
-                if shard["glow_alpha"] > 0:
-                    glow = shard["glow_surface"].copy()
-                    glow.set_alpha(int(shard["glow_alpha"]))
+                glow = self.shard_glow.frame(("shard", index))
+                if glow:
                     screen.blit(glow, (shard["rect"].x - 10, shard["rect"].y - 10))
                 screen.blit(shard["image"], shard["rect"])
         
         # Draw character
         if self.character_visible:
-            screen.blit(self.character_image, self.character_rect)
+            screen.blit(self.character_image, self._interpolated(self.character_previous_pos, self.character_rect))
         
         # Draw serpent if visible
         if self.serpent_visible:
-            screen.blit(self.serpent_image, self.serpent_rect)
+            screen.blit(self.serpent_image, self._interpolated(self.serpent_previous_pos, self.serpent_rect))
         
         # Draw dragged item if any
         if self.dragged_item:
-            pos = pygame.mouse.get_pos()
+            pos = self.pointer_pos
             screen.blit(self.dragged_item['image'], 
                        (pos[0] + self.drag_offset[0], 
                         pos[1] + self.drag_offset[1]))
         
         # Draw UI frames
-        screen.blit(self.inventory_frame, (self.inventory_rect.x - 20, self.inventory_rect.y - 20))
-        
-        # Draw inventory slots with improved styling and centered items
-        for slot in self.inventory_slots:
-            screen.blit(self.slot_frame, slot['rect'])
-            if slot['item']:
-                # Center the item in the slot
-                item_x = slot['rect'].centerx - slot['item']['image'].get_width() // 2
-                item_y = slot['rect'].centery - slot['item']['image'].get_height() // 2
-                screen.blit(slot['item']['image'], (item_x, item_y))
-            if slot['highlighted']:
-                # Golden highlight effect
-                pygame.draw.rect(screen, (218, 165, 32, 100), slot['rect'], 3)
-                # Inner glow
-                pygame.draw.rect(screen, (255, 223, 0, 50), slot['rect'].inflate(-4, -4), 2)
+        with self.profiler.span("render.inventory"):
+            state = self._inventory_state()
+            if state != self.inventory_panel_state:
+                self.inventory_panel = self._compose_inventory_panel()
+                self.inventory_panel_state = state
+            screen.blit(self.inventory_panel, (self.inventory_rect.x - 20, self.inventory_rect.y - 20))
         
         # Draw dialogue if active
-        if self.dialogue_active and self.dialogue_text:
-            # Draw dialogue frame with gradient background
-            screen.blit(self.dialogue_frame, self.dialogue_frame_rect)
+        with self.profiler.span("render.dialogue"):
+            if self.dialogue_active and self.dialogue_text:
+                # Draw dialogue frame with gradient background
+                screen.blit(self.dialogue_frame, self.dialogue_frame_rect)
             
-            # Calculate text dimensions for proper wrapping
-            max_width = self.dialogue_rect.width - 40
-            words = self.displayed_text.split()
-            lines = []
-            current_line = []
-            current_width = 0
-            
-            # Word wrap
-            for word in words:
-                word_surface = self.font.render(word + " ", True, (255, 246, 208))
-                word_width = word_surface.get_width()
-                
-                if current_width + word_width <= max_width:
-                    current_line.append(word)
-                    current_width += word_width
-                else:
-                    lines.append(" ".join(current_line))
-                    current_line = [word]
-                    current_width = word_width
+                # Word wrap, reusing the lines already typed out
+                max_width = self.dialogue_rect.width - 40
+                lines = self.text_renderer.wrap_prefix(self.font, self.displayed_text, max_width)
             
-            if current_line:
-                lines.append(" ".join(current_line))
+                # Draw text lines
+                line_height = self.font.get_linesize()
+                start_y = self.dialogue_rect.centery - (len(lines) * line_height) // 2
             
-            # Draw text lines
-            line_height = self.font.get_linesize()
-            start_y = self.dialogue_rect.centery - (len(lines) * line_height) // 2
-            
-            for i, line in enumerate(lines):
-                # Draw text shadow for depth
-                shadow_surface = self.font.render(line, True, (0, 0, 0))
-                shadow_rect = shadow_surface.get_rect(
-                    centerx=self.dialogue_rect.centerx + 2,
-                    y=start_y + i * line_height + 2
-                )
-                screen.blit(shadow_surface, shadow_rect)
+                for i, line in enumerate(lines):
+                    # Draw text shadow for depth
+                    shadow_surface = self.text_renderer.render(self.font, line, (0, 0, 0))
+                    shadow_rect = shadow_surface.get_rect(
+                        centerx=self.dialogue_rect.centerx + 2,
+                        y=start_y + i * line_height + 2
+                    )
+                    screen.blit(shadow_surface, shadow_rect)
                 
-                # Draw main text with golden tint
-                text_surface = self.font.render(line, True, (255, 246, 208))
-                text_rect = text_surface.get_rect(
-                    centerx=self.dialogue_rect.centerx,
-                    y=start_y + i * line_height
-                )
-                screen.blit(text_surface, text_rect)
+                    # Draw main text with golden tint
+                    text_surface = self.text_renderer.render(self.font, line, (255, 246, 208))
+                    text_rect = text_surface.get_rect(
+                        centerx=self.dialogue_rect.centerx,
+                        y=start_y + i * line_height
+                    )
+                    screen.blit(text_surface, text_rect)
         
         # Draw test button
         pygame.draw.rect(screen, (100, 100, 100), self.test_button)
         pygame.draw.rect(screen, (200, 200, 200), self.test_button, 2)
-        text_surface = self.test_button_font.render(self.test_button_text, True, (255, 255, 255))
+        text_surface = self.text_renderer.render(self.test_button_font, self.test_button_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.test_button.center)
         screen.blit(text_surface, text_rect)
         
@@ -850,13 +875,12 @@ class MirrorChamber(BaseScene):
             
             shard["image"] = surface
             
-            # Create glow surface
-            glow_surface = pygame.Surface((70, 70), pygame.SRCALPHA)
-            glow_rect = pygame.Rect(10, 10, 50, 50)
-            for radius in range(5, 0, -1):
-                pygame.draw.rect(glow_surface, (*self.colors['glow'][:3], 10),
-                               glow_rect.inflate(radius*2, radius*2), border_radius=radius)
-            shard["glow_surface"] = glow_surface
+        # Create the glow shared by every shard
+        self.shard_glow_surface = pygame.Surface((70, 70), pygame.SRCALPHA)
+        glow_rect = pygame.Rect(10, 10, 50, 50)
+        for radius in range(5, 0, -1):
+            pygame.draw.rect(self.shard_glow_surface, (*self.colors['glow'][:3], 10),
+                           glow_rect.inflate(radius*2, radius*2), border_radius=radius)
         
         # Create mirror frame with more detail
         self.mirror_frame_surface = pygame.Surface((200, 300), pygame.SRCALPHA)
@@ -934,7 +958,7 @@ class MirrorChamber(BaseScene):
         self.dialogue_text = text
         self.displayed_text = ""
         self.typing_index = 0
-        self.last_type_time = pygame.time.get_ticks() / 1000
+        self.last_type_time = self.clock.time
         self.dialogue_active = True 
 
     def _create_visual_elements(self) -> None:
@@ -1008,7 +1032,36 @@ class MirrorChamber(BaseScene):
                 'x': x,
                 'width': random.randint(40, 80),
                 'alpha': random.randint(20, 40)
-            }) 
+            })
+        for ray in self.light_rays:
+            ray['sprite'] = self._create_light_ray(ray['width'], ray['alpha'])
+        
+        # Static layers are flattened once; only the dome is drawn per frame
+        self.layers.add_static("background", self.background)
+        self.layers.add_static("door", self._draw_door, visible=self.can_exit)
+        self.layers.add_static("scripture", self.scripture_surface)
+        self.layers.add_animated("dome", self.dome_surface)
+        for index, ray in enumerate(self.light_rays):
+            self.layers.add_animated(f"light_ray_{index}", ray['sprite'],
+                                     (ray['x'] - ray['width'] // 2, 0))
+            
+    def _create_light_ray(self, width: int, alpha: int) -> pygame.Surface:
+        """Create a light ray sprite fading out towards the floor.
+        
+        The sprite holds the ray at full flicker intensity; the flicker is
+        applied per frame as a surface alpha.
+        
+        Args:
+            width: Width of the ray in pixels.
+            alpha: Opacity at the top of the ray.
+        """
+        sprite = pygame.Surface((width, 720), pygame.SRCALPHA)
+        sprite.fill((*self.colors['light_ray'][:3], 0))
+        ramp = (alpha * (1 - np.arange(720) / 720)).astype(np.uint8)
+        pixels = pygame.surfarray.pixels_alpha(sprite)
+        pixels[:] = ramp[np.newaxis, :]
+        del pixels  # Unlock the surface
+        return sprite
 
     def _collect_shard(self, shard: Dict[str, any]) -> None:
         """Collect a mirror shard and add it to inventory."""
@@ -0,0 +1,17 @@
+"""
+Scene Registry
+Maps scene names to their classes for the game loop and tools.
+"""
+
+from typing import Dict, Type
+
+from ..core.scene_manager import Scene
+from .starting_screen import StartingScreen
+from .mirror_chamber import MirrorChamber
+from .blind_marketplace import BlindMarketplace
+
+SCENES: Dict[str, Type[Scene]] = {
+    "starting_screen": StartingScreen,
+    "mirror_chamber": MirrorChamber,
+    "blind_marketplace": BlindMarketplace,
+}
@@ -9,8 +9,12 @@ from typing import Optional, Tuple
 from ..core.scene_manager import Scene
 from ..core.resource_manager import ResourceManager
 from ..core.input_manager import InputManager
+from ..ui.text_cache import get_text_renderer
 
 class StartingScreen(Scene):
+    preload_images = [("backgrounds/background_startingscreen.png", (1280, 720))]
+    uses_dirty_rects = True
+    
     def __init__(self, game_state):
         """Initialize the starting screen."""
         super().__init__(game_state)
@@ -35,8 +39,8 @@ class StartingScreen(Scene):
         }
         
         # Load background
-        self.background = self.resource_manager.load_image("backgrounds/background_startingscreen.png")
-        self.background = pygame.transform.scale(self.background, (1280, 720))
+        self.background = self.resource_manager.load_image("backgrounds/background_startingscreen.png",
+                                                           size=(1280, 720))
         
         # Create fade surface
         self.fade_surface = pygame.Surface((1280, 720))
@@ -47,6 +51,7 @@ class StartingScreen(Scene):
         self.title_font = pygame.font.SysFont('Arial', 72)
         self.subtitle_font = pygame.font.SysFont('Arial', 36)
         self.button_font = pygame.font.SysFont('Arial', 48)
+        self.text_renderer = get_text_renderer()
         
         # Create UI elements
         self.title_text = "Land of Dragons and Snakes"
@@ -63,6 +68,9 @@ class StartingScreen(Scene):
             button_height
         )
         
+        # Only the pulsing title changes from frame to frame
+        self.title_rect = self.text_renderer.render(self.title_font, self.title_text, self.colors['title']).get_rect(center=(640, 200))
+        
         # Animation state
         self.glow_alpha = 0
         self.glow_direction = 1
@@ -78,7 +86,10 @@ class StartingScreen(Scene):
                 
         # Only update hover state if not transitioning
         if event.type == pygame.MOUSEMOTION and not self.next_scene:
-            self.button_hovered = self.button_rect.collidepoint(event.pos)
+            hovered = self.button_rect.collidepoint(event.pos)
+            if hovered != self.button_hovered:
+                self.button_hovered = hovered
+                self.dirty.mark(self.button_rect)
             
     def update(self, dt):
         """Update with optimized animations."""
@@ -90,6 +101,7 @@ class StartingScreen(Scene):
                 self.glow_direction = -1
             elif self.glow_alpha <= 0:
                 self.glow_direction = 1
+            self.dirty.mark(self.title_rect)
                 
     def _draw_decorative_line(self, surface, start_pos, end_pos, color):
         """Draw a decorative line with medieval styling."""
@@ -110,13 +122,13 @@ class StartingScreen(Scene):
             if self.glow_alpha > 0:
                 glow_surface = pygame.Surface((1280, 200), pygame.SRCALPHA)
                 glow_color = (*self.colors['title'][:3], self.glow_alpha)
-                title_glow = self.title_font.render(self.title_text, True, glow_color)
+                title_glow = self.text_renderer.render(self.title_font, self.title_text, glow_color)
                 glow_rect = title_glow.get_rect(center=(640, 200))
                 glow_surface.blit(title_glow, glow_rect)
                 screen.blit(glow_surface, (0, 0))
         
         # Draw main title
-        title_surface = self.title_font.render(self.title_text, True, self.colors['title'])
+        title_surface = self.text_renderer.render(self.title_font, self.title_text, self.colors['title'])
         title_rect = title_surface.get_rect(center=(640, 200))
         screen.blit(title_surface, title_rect)
         
@@ -131,7 +143,7 @@ class StartingScreen(Scene):
         self._draw_decorative_line(screen, right_line_start, right_line_end, self.colors['title'])
         
         # Draw subtitle
-        subtitle_surface = self.subtitle_font.render(self.subtitle_text, True, self.colors['subtitle'])
+        subtitle_surface = self.text_renderer.render(self.subtitle_font, self.subtitle_text, self.colors['subtitle'])
         subtitle_rect = subtitle_surface.get_rect(center=(640, 280))
         screen.blit(subtitle_surface, subtitle_rect)
         
@@ -143,7 +155,7 @@ class StartingScreen(Scene):
         pygame.draw.rect(screen, self.colors['button']['text'], self.button_rect, 3, border_radius=10)
         
         # Button text
-        button_text_surface = self.button_font.render(self.button_text, True, self.colors['button']['text'])
+        button_text_surface = self.text_renderer.render(self.button_font, self.button_text, self.colors['button']['text'])
         button_text_rect = button_text_surface.get_rect(center=self.button_rect.center)
         screen.blit(button_text_surface, button_text_rect)
         
@@ -151,4 +163,8 @@ class StartingScreen(Scene):
         if self.button_hovered and not self.next_scene:
             glow_surface = pygame.Surface(self.button_rect.size, pygame.SRCALPHA)
             glow_surface.fill(self.colors['glow'])
-            screen.blit(glow_surface, self.button_rect) 
\ No newline at end of file
+            screen.blit(glow_surface, self.button_rect)
+            
+    def cleanup(self):
+        """Release the screen's assets from the shared cache."""
+        self.resource_manager.clear_cache()
@@ -0,0 +1,116 @@
+"""
+UI Chrome
+Shared procedural panel frames. Gradient backgrounds are written as one
+vectorized alpha ramp through pygame.surfarray, and each frame is built
+once per size and shared by every scene that asks for it.
+
+The returned surfaces are shared: blit them or copy() them before
+drawing on them.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+import pygame
+
+GOLD = (218, 165, 32)
+DARK_GOLD = (184, 134, 11)
+BRIGHT_GOLD = (255, 215, 0)
+BRONZE = (139, 105, 20)
+
+def vertical_gradient(size: Tuple[int, int], color: Tuple[int, int, int], alpha: np.ndarray) -> pygame.Surface:
+    """Create a surface of one color whose alpha changes from row to row.
+
+    Args:
+        size: (width, height) of the surface.
+        color: RGB color of every pixel.
+        alpha: Alpha of each row, top to bottom.
+
+    Returns:
+        pygame.Surface: The per-pixel alpha surface.
+    """
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((*color, 0))
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[:] = np.clip(alpha, 0, 255).astype(np.uint8)[np.newaxis, :]
+    del pixels  # Unlock the surface
+    return surface
+
+@lru_cache(maxsize=None)
+def inventory_frame(size: Tuple[int, int] = (270, 320)) -> pygame.Surface:
+    """Get the inventory panel: a darkening gradient, gold border and corner studs."""
+    width, height = size
+    rows = np.arange(height)
+    frame = vertical_gradient(size, (20, 20, 30), 128 + rows / height * 64)
+
+    # Draw main panel
+    panel = pygame.Rect(10, 10, width - 20, height - 20)
+    pygame.draw.rect(frame, (30, 30, 40, 200), panel)
+
+    # Draw golden border
+    pygame.draw.rect(frame, (*GOLD, 255), panel, 2)
+
+    # Draw corner decorations
+    for x, y in [(10, 10), (width - 20, 10), (10, height - 20), (width - 20, height - 20)]:
+        pygame.draw.circle(frame, (*GOLD, 255), (x, y), 5)
+        pygame.draw.circle(frame, (*BRIGHT_GOLD, 128), (x, y), 3)
+    return frame
+
+@lru_cache(maxsize=None)
+def slot_frame(size: int = 60) -> pygame.Surface:
+    """Get an inventory slot: a gradient square with a gold border and corner dots."""
+    rows = np.arange(size)
+    frame = vertical_gradient((size, size), (25, 25, 35), 96 + rows / size * 32)
+    # Draw slot border
+    pygame.draw.rect(frame, (*GOLD, 200), (0, 0, size, size), 2)
+    # Add inner highlight
+    pygame.draw.rect(frame, (255, 255, 255, 30), (2, 2, size - 4, size - 4), 1)
+    # Add corner dots
+    for x, y in [(2, 2), (size - 3, 2), (2, size - 3), (size - 3, size - 3)]:
+        pygame.draw.circle(frame, (*GOLD, 255), (x, y), 2)
+    return frame
+
+def _fading_alpha(height: int) -> np.ndarray:
+    """Alpha ramp fading from 200 at the top down to no less than 180."""
+    rows = np.arange(height)
+    return np.maximum(180, (200 * (1 - rows / height)).astype(np.int32))
+
+@lru_cache(maxsize=None)
+def mirror_frame(size: Tuple[int, int] = (200, 350)) -> pygame.Surface:
+    """Get the mirror frame backing: a gradient with a bronze border."""
+    frame = vertical_gradient(size, (40, 35, 45), _fading_alpha(size[1]))
+    pygame.draw.rect(frame, BRONZE, pygame.Rect(0, 0, *size), 3)
+    return frame
+
+@lru_cache(maxsize=None)
+def dialogue_frame(size: Tuple[int, int] = (740, 100)) -> pygame.Surface:
+    """Get the ornate dialogue panel with corner pieces and border dashes."""
+    width, height = size
+    frame = vertical_gradient(size, (30, 25, 35), _fading_alpha(height))
+
+    # Main panel
+    panel = pygame.Rect(10, 10, width - 20, height - 20)
+    pygame.draw.rect(frame, (45, 40, 50, 230), panel)
+    # Golden border
+    pygame.draw.rect(frame, BRONZE, panel, 3)
+
+    # Corner decorations
+    corner_size = 20
+    for x, y in [(10, 10), (width - 30, 10), (10, height - 30), (width - 30, height - 30)]:
+        # Outer corner
+        pygame.draw.rect(frame, DARK_GOLD, (x, y, corner_size, corner_size), 2)
+        # Inner corner
+        pygame.draw.rect(frame, GOLD, (x + 3, y + 3, corner_size - 6, corner_size - 6), 1)
+        # Corner dot
+        pygame.draw.circle(frame, GOLD, (x + corner_size // 2, y + corner_size // 2), 2)
+
+    # Add decorative lines along the border
+    line_length = 20
+    spacing = 40
+    for i in range(30, width - 40, spacing):
+        pygame.draw.line(frame, DARK_GOLD, (i, 10), (i + line_length, 10), 2)
+        pygame.draw.line(frame, DARK_GOLD, (i, height - 10), (i + line_length, height - 10), 2)
+    for y in range(30, height - 30, spacing):
+        pygame.draw.line(frame, DARK_GOLD, (10, y), (10, y + line_length), 2)
+        pygame.draw.line(frame, DARK_GOLD, (width - 10, y), (width - 10, y + line_length), 2)
+    return frame
@@ -6,8 +6,12 @@ Contains reusable UI elements like inventory and text boxes.
 import pygame
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
+from ..core.resource_manager import ResourceManager
+from .text_cache import get_text_renderer
+
 @dataclass
 class UIStyle:
     """Style configuration for UI components."""
@@ -41,6 +45,7 @@ class TextBox:
         self.lines: List[str] = []
         self.font = pygame.font.SysFont(self.style.font_name, self.style.font_size)
         self.background: Optional[pygame.Surface] = None
+        self.text_renderer = get_text_renderer()
         
     def set_background(self, image: pygame.Surface) -> None:
         """Set a custom background image for the text box.
@@ -56,19 +61,9 @@ class TextBox:
         Args:
             text: Text to add
         """
-        words = text.split()
-        current_line = ""
-        
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            if self.font.size(test_line)[0] <= self.rect.width - 2 * self.style.padding:
-                current_line = test_line
-            else:
-                self.lines.append(current_line)
-                current_line = word
-                
-        if current_line:
-            self.lines.append(current_line)
+        self.lines.extend(
+            self.text_renderer.wrap(self.font, text, self.rect.width - 2 * self.style.padding)
+        )
             
         # Keep only the last max_lines
         if len(self.lines) > self.max_lines:
@@ -103,15 +98,93 @@ class TextBox:
         # Draw text
         y = self.rect.top + self.style.padding
         for line in self.lines:
-            text_surface = self.font.render(line, True, self.style.text_color)
+            text_surface = self.text_renderer.render(self.font, line, self.style.text_color)
             surface.blit(
                 text_surface,
                 (self.rect.left + self.style.padding, y)
             )
             y += self.font.get_linesize()
 
+class MessagePanel:
+    """A bordered, shadowed one-line message that is only redrawn when its text changes."""
+    
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        text_color: Tuple[int, int, int],
+        shadow_color: Tuple[int, int, int],
+        background_color: Tuple[int, ...],
+        border_color: Tuple[int, ...],
+        anchor: str = "center",
+        margin: int = 20
+    ):
+        """Initialize the message panel.
+        
+        Args:
+            font: Font the message is drawn with
+            text_color: Colour of the message text
+            shadow_color: Colour of the text's drop shadow
+            background_color: Panel fill colour, optionally with alpha
+            border_color: Panel border colour
+            anchor: "center" for the middle of the screen, "bottom" for
+                centred above the bottom edge
+            margin: Distance from the bottom edge when anchored there
+        """
+        self.font = font
+        self.text_color = text_color
+        self.shadow_color = shadow_color
+        self.background_color = background_color
+        self.border_color = border_color
+        self.anchor = anchor
+        self.margin = margin
+        self.text: Optional[str] = None
+        self.surface: Optional[pygame.Surface] = None
+        self.text_renderer = get_text_renderer()
+        
+    def set_text(self, text: str) -> None:
+        """Set the message, rebuilding the panel only if it changed.
+        
+        Args:
+            text: Message to show
+        """
+        if text == self.text:
+            return
+        self.text = text
+        text_surface = self.text_renderer.render(self.font, text, self.text_color)
+        text_shadow = self.text_renderer.render(self.font, text, self.shadow_color)
+        
+        panel_width = text_surface.get_width() + 40
+        panel_height = text_surface.get_height() + 20
+        self.surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        self.surface.fill(self.background_color)
+        pygame.draw.rect(self.surface, self.border_color, (0, 0, panel_width, panel_height), 2)
+        self.surface.blit(text_shadow, (22, 12))  # Offset shadow
+        self.surface.blit(text_surface, (20, 10))
+        
+    def render(self, surface: pygame.Surface) -> None:
+        """Render the panel.
+        
+        Args:
+            surface: Surface to render to
+        """
+        if self.surface is None:
+            return
+        panel_width, panel_height = self.surface.get_size()
+        x = (surface.get_width() - panel_width) // 2
+        if self.anchor == "bottom":
+            y = surface.get_height() - panel_height - self.margin
+        else:
+            y = (surface.get_height() - panel_height) // 2
+        surface.blit(self.surface, (x, y))
+
 class Inventory:
-    """A reusable inventory component for displaying collected items."""
+    """A reusable inventory component for displaying collected items.
+    
+    The panel is retained: background, slots, items and names are composed
+    into one cached surface that is only rebuilt when the items, highlight
+    or scroll position change, so drawing it is a single blit however many
+    items it holds.
+    """
     
     def __init__(
         self,
@@ -135,6 +208,31 @@ class Inventory:
         self.items: Dict[str, pygame.Surface] = {}
         self.font = pygame.font.SysFont(self.style.font_name, self.style.font_size)
         self.background: Optional[pygame.Surface] = None
+        self.resource_manager = ResourceManager()
+        self.text_renderer = get_text_renderer()
+        self.highlighted: Optional[str] = None
+        self.scroll_row = 0  # First visible row of the item grid
+        self._panel: Optional[pygame.Surface] = None
+        
+    @property
+    def row_height(self) -> int:
+        """Vertical distance between slot rows in pixels."""
+        return self.item_size + self.style.padding
+        
+    @property
+    def visible_rows(self) -> int:
+        """Number of slot rows that fit in the panel."""
+        return max(1, (self.rect.height - self.style.padding) // self.row_height)
+        
+    @property
+    def max_scroll(self) -> int:
+        """Highest row the grid can be scrolled to."""
+        rows = -(-len(self.items) // self.columns)
+        return max(0, rows - self.visible_rows)
+        
+    def invalidate(self) -> None:
+        """Rebuild the cached panel on the next render."""
+        self._panel = None
         
     def set_background(self, image: pygame.Surface) -> None:
         """Set a custom background image for the inventory.
@@ -143,6 +241,7 @@ class Inventory:
             image: The background image to use
         """
         self.background = pygame.transform.scale(image, (self.rect.width, self.rect.height))
+        self.invalidate()
         
     def add_item(self, item_id: str, image_path: str) -> bool:
         """Add an item to the inventory.
@@ -155,9 +254,10 @@ class Inventory:
             bool: True if item was added successfully
         """
         try:
-            image = pygame.image.load(image_path).convert_alpha()
-            image = pygame.transform.scale(image, (self.item_size, self.item_size))
+            # Slot-sized icons are made once and shared by every inventory
+            image = self.resource_manager.load_icon(image_path, self.item_size)
             self.items[item_id] = image
+            self.invalidate()
             return True
         except Exception as e:
             print(f"Error loading item image: {e}")
@@ -174,6 +274,10 @@ class Inventory:
         """
         if item_id in self.items:
             del self.items[item_id]
+            if self.highlighted == item_id:
+                self.highlighted = None
+            self.scroll_row = min(self.scroll_row, self.max_scroll)
+            self.invalidate()
             return True
         return False
         
@@ -188,51 +292,115 @@ class Inventory:
         """
         return item_id in self.items
         
-    def render(self, surface: pygame.Surface) -> None:
-        """Render the inventory.
+    def set_highlight(self, item_id: Optional[str]) -> None:
+        """Highlight an item's slot.
         
         Args:
-            surface: Surface to render to
+            item_id: ID of the item to highlight, or None to clear
+        """
+        if item_id != self.highlighted:
+            self.highlighted = item_id
+            self.invalidate()
+            
+    def scroll(self, rows: int) -> None:
+        """Scroll the item grid.
+        
+        Args:
+            rows: Number of rows to scroll; positive scrolls down
         """
+        scroll_row = max(0, min(self.scroll_row + rows, self.max_scroll))
+        if scroll_row != self.scroll_row:
+            self.scroll_row = scroll_row
+            self.invalidate()
+            
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Scroll with the mouse wheel while the pointer is over the panel.
+        
+        Args:
+            event: The pygame event to handle
+            
+        Returns:
+            bool: True if the event was used
+        """
+        if event.type == pygame.MOUSEWHEEL and self.rect.collidepoint(pygame.mouse.get_pos()):
+            self.scroll(-event.y)
+            return True
+        return False
+        
+    def item_at(self, pos: Tuple[int, int]) -> Optional[str]:
+        """Get the item in the slot under a screen position.
+        
+        Args:
+            pos: Screen position to test
+            
+        Returns:
+            Optional[str]: ID of the item, or None if there is none
+        """
+        x = pos[0] - self.rect.left - self.style.padding
+        y = pos[1] - self.rect.top - self.style.padding
+        if x < 0 or y < 0 or not self.rect.collidepoint(pos):
+            return None
+        col, col_offset = divmod(x, self.item_size + self.style.padding)
+        row, row_offset = divmod(y, self.row_height)
+        if col >= self.columns or row >= self.visible_rows:
+            return None
+        if col_offset >= self.item_size or row_offset >= self.item_size:
+            return None
+        index = (self.scroll_row + row) * self.columns + col
+        return next(islice(self.items, index, None), None)
+        
+    def cleanup(self) -> None:
+        """Release the inventory's atlas references."""
+        self.resource_manager.clear_cache()
+        self.invalidate()
+        
+    def _build_panel(self) -> pygame.Surface:
+        """Compose the background, border and visible slots into one surface."""
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        
         # Draw background
         if self.background:
-            surface.blit(self.background, self.rect)
+            panel.blit(self.background, (0, 0))
         else:
-            background = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-            background.fill(self.style.background_color)
-            surface.blit(background, self.rect)
+            panel.fill(self.style.background_color)
         
         # Draw border
-        pygame.draw.rect(
-            surface,
-            self.style.border_color,
-            self.rect,
-            self.style.border_width
-        )
+        pygame.draw.rect(panel, self.style.border_color, panel.get_rect(), self.style.border_width)
         
-        # Draw items
-        for i, (item_id, image) in enumerate(self.items.items()):
+        # Draw the items in the visible rows only
+        first = self.scroll_row * self.columns
+        last = first + self.visible_rows * self.columns
+        for i, (item_id, image) in enumerate(islice(self.items.items(), first, last)):
             row = i // self.columns
             col = i % self.columns
             
-            x = self.rect.left + col * (self.item_size + self.style.padding) + self.style.padding
-            y = self.rect.top + row * (self.item_size + self.style.padding) + self.style.padding
+            x = col * (self.item_size + self.style.padding) + self.style.padding
+            y = row * self.row_height + self.style.padding
             
             # Draw item slot
             slot_rect = pygame.Rect(x, y, self.item_size, self.item_size)
-            pygame.draw.rect(
-                surface,
-                self.style.border_color,
-                slot_rect,
-                1
-            )
+            if item_id == self.highlighted:
+                pygame.draw.rect(panel, self.style.text_color, slot_rect, 3)
+            else:
+                pygame.draw.rect(panel, self.style.border_color, slot_rect, 1)
             
             # Draw item
-            surface.blit(image, slot_rect)
+            panel.blit(image, slot_rect)
             
             # Draw item name
-            name_surface = self.font.render(item_id, True, self.style.text_color)
+            name_surface = self.text_renderer.render(self.font, item_id, self.style.text_color)
             name_rect = name_surface.get_rect(
                 midtop=(slot_rect.centerx, slot_rect.bottom + 5)
             )
-            surface.blit(name_surface, name_rect) 
\ No newline at end of file
+            panel.blit(name_surface, name_rect)
+        return panel
+        
+    def render(self, surface: pygame.Surface) -> None:
+        """Render the inventory.
+        
+        Args:
+            surface: Surface to render to
+        """
+        if self._panel is None:
+            self._panel = self._build_panel()
+        surface.blit(self._panel, self.rect)
@@ -0,0 +1,83 @@
+"""
+Profiler Overlay
+On-screen frame-time graph and costliest spans from the profiler.
+"""
+
+from typing import Optional
+import pygame
+
+from ..core.profiler import Profiler, get_profiler
+from .text_cache import get_text_renderer
+
+class ProfilerOverlay:
+    """Debug panel drawn over the scene while profiling is on."""
+    
+    def __init__(self, profiler: Optional[Profiler] = None, position: tuple = (10, 10),
+                 graph_frames: int = 120, budget_ms: float = 1000.0 / 60.0):
+        """Initialize the overlay.
+        
+        Args:
+            profiler: Profiler to display; defaults to the game's profiler
+            position: Top-left corner of the panel on screen
+            graph_frames: Number of recent frames shown in the graph
+            budget_ms: Frame budget drawn as a reference line
+        """
+        self.profiler = profiler or get_profiler()
+        self.graph_frames = graph_frames
+        self.budget_ms = budget_ms
+        self.rect = pygame.Rect(position, (360, 200))
+        self.graph_rect = pygame.Rect(self.rect.x + 10, self.rect.y + 30, self.rect.width - 20, 60)
+        self.background = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, 180))
+        self.font = pygame.font.Font(None, 20)
+        self.text_renderer = get_text_renderer()
+        
+    @property
+    def visible(self) -> bool:
+        """Whether the overlay is shown; it is shown while the profiler records."""
+        return self.profiler.enabled
+        
+    def toggle(self) -> None:
+        """Show or hide the overlay, starting or stopping recording."""
+        self.profiler.set_enabled(not self.profiler.enabled)
+        
+    def render(self, screen: pygame.Surface, fps: Optional[float] = None) -> None:
+        """Render the overlay.
+        
+        Args:
+            screen: The pygame surface to render to.
+            fps: Measured frame rate; frame times only cover the work done
+                in a frame, not the wait for the next one.
+        """
+        if not self.visible:
+            return
+        screen.blit(self.background, self.rect)
+        
+        times = self.profiler.frame_times()[-self.graph_frames:]
+        average = sum(times) / len(times) if times else 0.0
+        if fps is None:
+            fps = 1000.0 / average if average else 0.0
+        header = f"{fps:5.1f} FPS  {average:5.2f} ms avg  {max(times, default=0.0):5.2f} ms max"
+        # The numbers change every frame, so they are rendered directly
+        screen.blit(self.font.render(header, True, (255, 255, 255)), (self.rect.x + 10, self.rect.y + 8))
+        
+        # Frame-time bars scaled so twice the budget fills the graph
+        graph = self.graph_rect
+        scale = graph.height / (2 * self.budget_ms)
+        bar_width = max(1, graph.width // self.graph_frames)
+        for index, frame_ms in enumerate(times):
+            height = min(graph.height, int(frame_ms * scale))
+            color = (90, 200, 90) if frame_ms <= self.budget_ms else (220, 80, 60)
+            pygame.draw.rect(screen, color, (graph.x + index * bar_width, graph.bottom - height,
+                                             bar_width, height))
+        budget_y = graph.bottom - int(self.budget_ms * scale)
+        pygame.draw.line(screen, (255, 223, 0), (graph.x, budget_y), (graph.right, budget_y))
+        
+        # Costliest spans over the last second
+        y = graph.bottom + 8
+        for name, cost_ms in self.profiler.top_spans(count=5):
+            label = self.text_renderer.render(self.font, name, (220, 220, 220))
+            screen.blit(label, (self.rect.x + 10, y))
+            cost = self.font.render(f"{cost_ms:6.2f} ms", True, (220, 220, 220))
+            screen.blit(cost, (self.rect.right - 10 - cost.get_width(), y))
+            y += self.font.get_linesize()
@@ -0,0 +1,148 @@
+"""
+Text Cache
+Shared text rendering service that caches rendered lines, word widths and
+word-wrap layouts, so steady-state text drawing is only blits.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Tuple
+import pygame
+
+Color = Tuple[int, ...]
+
+class TextRenderer:
+    """Renders and lays out text through LRU caches keyed by font and string.
+
+    Fonts are keyed by object, which identifies both the face and its size.
+    """
+
+    def __init__(self, max_surfaces: int = 512, max_layouts: int = 128):
+        """Initialize the renderer.
+
+        Args:
+            max_surfaces: Number of rendered strings to keep.
+            max_layouts: Number of wrap layouts to keep.
+        """
+        self.max_surfaces = max_surfaces
+        self.max_layouts = max_layouts
+        self.surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.layouts: "OrderedDict[Hashable, List[str]]" = OrderedDict()
+        self.widths: Dict[Tuple[pygame.font.Font, str], int] = {}
+        # Last typewriter layout per (font, width): the prefix and its lines
+        self._typing: Dict[Tuple[pygame.font.Font, int], Tuple[str, List[List[str]]]] = {}
+
+    def render(self, font: pygame.font.Font, text: str, color: Color,
+               antialias: bool = True) -> pygame.Surface:
+        """Get a rendered string, rendering it only on first use.
+
+        Args:
+            font: Font to render with.
+            text: The string.
+            color: Text colour.
+            antialias: Whether to antialias the glyphs.
+
+        Returns:
+            pygame.Surface: The shared rendered surface; do not modify it.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def measure(self, font: pygame.font.Font, text: str) -> int:
+        """Get the rendered width of a string without rendering it."""
+        key = (font, text)
+        width = self.widths.get(key)
+        if width is None:
+            width = font.size(text)[0]
+            if len(self.widths) >= self.max_surfaces * 4:
+                self.widths.clear()
+            self.widths[key] = width
+        return width
+
+    def _wrap_words(self, font: pygame.font.Font, words: List[str],
+                    max_width: int) -> List[List[str]]:
+        """Greedily wrap words into lines measured with a trailing space."""
+        lines: List[List[str]] = []
+        current_line: List[str] = []
+        current_width = 0
+        for word in words:
+            word_width = self.measure(font, word + " ")
+            if current_width + word_width <= max_width or not current_line:
+                current_line.append(word)
+                current_width += word_width
+            else:
+                lines.append(current_line)
+                current_line = [word]
+                current_width = word_width
+        if current_line:
+            lines.append(current_line)
+        return lines
+
+    def wrap(self, font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+        """Word-wrap text to a width, reusing earlier layouts.
+
+        Args:
+            font: Font the text is drawn with.
+            text: Text to wrap.
+            max_width: Maximum line width in pixels.
+
+        Returns:
+            List[str]: The lines; do not modify the list.
+        """
+        key = (font, text, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            return lines
+        lines = [" ".join(line) for line in self._wrap_words(font, text.split(), max_width)]
+        self.layouts[key] = lines
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def wrap_prefix(self, font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+        """Word-wrap a growing prefix, as shown by a typewriter effect.
+
+        When text extends the prefix last wrapped with this font and width,
+        every line but the last is kept: those lines only hold words that
+        are already complete, so only the last line is wrapped again.
+
+        Args:
+            font: Font the text is drawn with.
+            text: The currently displayed prefix.
+            max_width: Maximum line width in pixels.
+
+        Returns:
+            List[str]: The lines.
+        """
+        key = (font, max_width)
+        previous = self._typing.get(key)
+        words = text.split()
+        if previous and text.startswith(previous[0]) and previous[1]:
+            kept = previous[1][:-1]
+            consumed = sum(len(line) for line in kept)
+            lines = kept + self._wrap_words(font, words[consumed:], max_width)
+        else:
+            lines = self._wrap_words(font, words, max_width)
+        self._typing[key] = (text, lines)
+        return [" ".join(line) for line in lines]
+
+    def clear(self) -> None:
+        """Drop every cached surface and layout."""
+        self.surfaces.clear()
+        self.layouts.clear()
+        self.widths.clear()
+        self._typing.clear()
+
+_shared_renderer = TextRenderer()
+
+def get_text_renderer() -> TextRenderer:
+    """Get the text renderer shared by all scenes and UI components."""
+    return _shared_renderer
@@ -6,6 +6,8 @@ import pytest
 import pygame
 import os
 
+from ..game.core import asset_baker, resource_manager
+
 @pytest.fixture(autouse=True)
 def pygame_setup():
     """Initialize pygame for all tests."""
@@ -21,6 +23,12 @@ def pygame_setup():
     
     pygame.quit()
 
+@pytest.fixture(autouse=True)
+def asset_cache_dirs(tmp_path, monkeypatch):
+    """Bake images and look for atlases under tmp_path, not the working tree."""
+    monkeypatch.setattr(asset_baker, "_bake_cache_dir", tmp_path / "baked")
+    monkeypatch.setattr(resource_manager, "ATLASES_PATH", str(tmp_path / "atlases"))
+
 @pytest.fixture
 def mock_surface():
     """Create a mock pygame surface for testing."""
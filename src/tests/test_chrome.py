@@ -0,0 +1,15 @@
+import numpy as np
+from ..game.ui import chrome
+
+def test_frames_are_shared_per_size():
+    """Test that each frame is built once per size."""
+    assert chrome.inventory_frame((270, 320)) is chrome.inventory_frame((270, 320))
+    assert chrome.slot_frame(60) is chrome.slot_frame(60)
+    assert chrome.slot_frame(48).get_size() == (48, 48)
+
+def test_vertical_gradient_sets_row_alpha():
+    """Test that the gradient writes one clipped alpha per row."""
+    surface = chrome.vertical_gradient((4, 3), (10, 20, 30), np.array([0, 100, 300]))
+    assert surface.get_at((2, 0)) == (10, 20, 30, 0)
+    assert surface.get_at((2, 1)) == (10, 20, 30, 100)
+    assert surface.get_at((2, 2)) == (10, 20, 30, 255)
@@ -0,0 +1,28 @@
+import pygame
+from ..game.core.dirty_rects import DirtyRectTracker
+
+def test_first_collect_requests_full_redraw():
+    """Test that a new tracker asks for a full redraw exactly once."""
+    tracker = DirtyRectTracker((1280, 720))
+    assert tracker.collect() is None
+    assert tracker.collect() == []
+
+def test_moving_sprite_marks_old_and_new_area():
+    """Test that tracking a moved sprite restores the area it left."""
+    tracker = DirtyRectTracker((1280, 720))
+    tracker.collect()
+    tracker.track("npc", pygame.Rect(0, 0, 10, 10))
+    tracker.collect()
+    tracker.track("npc", pygame.Rect(100, 0, 10, 10))
+    assert sorted(map(tuple, tracker.collect())) == [(0, 0, 10, 10), (100, 0, 10, 10)]
+    tracker.track("npc", pygame.Rect(100, 0, 10, 10))
+    assert tracker.collect() == []
+
+def test_overlapping_rects_are_merged_and_clipped():
+    """Test that overlapping regions merge and stay on screen."""
+    tracker = DirtyRectTracker((100, 100))
+    tracker.collect()
+    tracker.mark(pygame.Rect(0, 0, 20, 20))
+    tracker.mark(pygame.Rect(10, 10, 20, 20))
+    tracker.mark(pygame.Rect(90, 90, 50, 50))
+    assert sorted(map(tuple, tracker.collect())) == [(0, 0, 30, 30), (90, 90, 10, 10)]
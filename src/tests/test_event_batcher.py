@@ -0,0 +1,44 @@
+import pygame
+from ..game.core.event_batcher import EventBatcher
+
+def motion(pos, rel):
+    return pygame.event.Event(pygame.MOUSEMOTION, {'pos': pos, 'rel': rel, 'buttons': (0, 0, 0)})
+
+def key(event_type, key_code):
+    return pygame.event.Event(event_type, {'key': key_code, 'mod': 0, 'unicode': '', 'scancode': 0})
+
+def test_motion_runs_are_coalesced():
+    """Test that consecutive motion keeps the last position and summed rel."""
+    batcher = EventBatcher()
+    events, snapshot = batcher.process([motion((i, 2 * i), (1, 2)) for i in range(1, 51)])
+    assert len(events) == 1
+    assert events[0].pos == (50, 100)
+    assert events[0].rel == (50, 100)
+    assert snapshot.mouse_pos == (50, 100)
+    assert snapshot.moved
+
+def test_clicks_split_motion_runs():
+    """Test that a click is still dispatched between the motion around it."""
+    batcher = EventBatcher()
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': (10, 10), 'button': 1})
+    events, snapshot = batcher.process([motion((5, 5), (5, 5)), motion((10, 10), (5, 5)), click,
+                                        motion((20, 20), (10, 10))])
+    assert [event.type for event in events] == [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                                                pygame.MOUSEMOTION]
+    assert events[0].pos == (10, 10)
+    assert snapshot.mouse_rel == (20, 20)
+    assert snapshot.mouse_buttons == {1}
+
+def test_key_repeats_are_collapsed():
+    """Test that repeats of a held key are dropped, within and across frames."""
+    batcher = EventBatcher()
+    events, snapshot = batcher.process([key(pygame.KEYDOWN, pygame.K_RIGHT)] * 5)
+    assert len(events) == 1
+    assert pygame.K_RIGHT in snapshot.keys_down
+
+    events, snapshot = batcher.process([key(pygame.KEYDOWN, pygame.K_RIGHT),
+                                        key(pygame.KEYUP, pygame.K_RIGHT),
+                                        key(pygame.KEYDOWN, pygame.K_RIGHT)])
+    assert [event.type for event in events] == [pygame.KEYUP, pygame.KEYDOWN]
+    assert not snapshot.moved
+    assert snapshot.frame == 1
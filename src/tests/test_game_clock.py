@@ -0,0 +1,18 @@
+import pytest
+from ..game.core.game_clock import GameClock
+
+def test_steps_are_fixed_regardless_of_frame_rate():
+    """Test that the same real time gives the same simulation at any frame rate."""
+    fast = GameClock(step=0.01)
+    slow = GameClock(step=0.01)
+    fast_steps = sum(len(list(fast.advance(0.005))) for _ in range(20))
+    slow_steps = sum(len(list(slow.advance(0.025))) for _ in range(4))
+    assert fast_steps == slow_steps == 10
+    assert fast.time == pytest.approx(slow.time)
+    assert fast.alpha == pytest.approx(0.0, abs=1e-6)
+
+def test_long_frames_are_clamped():
+    """Test that a stall is not caught up with a burst of steps."""
+    clock = GameClock(step=0.1, max_frame_time=0.25)
+    assert len(list(clock.advance(5.0))) == 2
+    assert clock.alpha == pytest.approx(0.5)
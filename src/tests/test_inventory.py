@@ -0,0 +1,69 @@
+import pygame
+from ..game.core.event_batcher import InputSnapshot
+from ..game.scenes.blind_marketplace import BlindMarketplace
+from ..game.ui.components import Inventory
+
+pygame.init()
+pygame.display.set_mode((1280, 720))
+
+def make_inventory(tmp_path, count):
+    image_path = tmp_path / "item.png"
+    pygame.image.save(pygame.Surface((64, 64)), str(image_path))
+    inventory = Inventory(pygame.Rect(0, 0, 232, 232), columns=3)
+    for i in range(count):
+        assert inventory.add_item(f"item{i}", str(image_path))
+    return inventory
+
+def test_panel_is_cached_until_contents_change(tmp_path):
+    """Test that the panel is only rebuilt after an add, remove or highlight."""
+    inventory = make_inventory(tmp_path, 4)
+    screen = pygame.Surface((400, 400))
+    inventory.render(screen)
+    panel = inventory._panel
+    inventory.render(screen)
+    assert inventory._panel is panel
+
+    inventory.set_highlight("item1")
+    assert inventory._panel is None
+    inventory.render(screen)
+    panel = inventory._panel
+    inventory.set_highlight("item1")
+    assert inventory._panel is panel
+
+    inventory.remove_item("item1")
+    assert inventory._panel is None
+    assert inventory.highlighted is None
+
+def test_scrolling_and_hit_testing(tmp_path):
+    """Test that scrolling is clamped and item_at follows the scroll position."""
+    inventory = make_inventory(tmp_path, 298)
+    assert inventory.visible_rows == 3
+    assert inventory.max_scroll == 97
+    inventory.scroll(1000)
+    assert inventory.scroll_row == 97
+    inventory.scroll(-1000)
+    assert inventory.scroll_row == 0
+
+    assert inventory.item_at((10 + 32, 10 + 32)) == "item0"
+    assert inventory.item_at((5, 5)) is None  # Padding
+    inventory.scroll(2)
+    assert inventory.item_at((10 + 74 + 32, 10 + 74 + 32)) == "item10"
+    inventory.scroll(1000)
+    assert inventory.item_at((10 + 148 + 32, 10 + 148 + 32)) is None  # Past the last item
+
+def test_marketplace_routes_its_inventory_through_the_widget(tmp_path, monkeypatch):
+    """Test that the marketplace scrolls and highlights its inventory widget."""
+    scene = BlindMarketplace(object())
+    image_path = tmp_path / "item.png"
+    pygame.image.save(pygame.Surface((64, 64)), str(image_path))
+    for i in range(30):
+        assert scene.add_item(f"item{i}", str(image_path))
+
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (100, 100))
+    scene.handle_events(pygame.event.Event(pygame.MOUSEWHEEL, {'x': 0, 'y': -1}))
+    assert scene.inventory.scroll_row == 1
+
+    scene.handle_input(InputSnapshot(frame=1, mouse_pos=(20 + 30, 20 + 30), mouse_rel=(1, 0)))
+    assert scene.inventory.highlighted == "item3"
+    scene.render(pygame.Surface((1280, 720)))
+    scene.cleanup()
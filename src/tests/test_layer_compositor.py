@@ -0,0 +1,48 @@
+import pygame
+from ..game.core.layer_compositor import LayerCompositor
+
+pygame.init()
+pygame.display.set_mode((1280, 720))
+
+def test_static_layers_flattened_once():
+    """Test that static layers are only redrawn after invalidation."""
+    calls = []
+    compositor = LayerCompositor((64, 64))
+    compositor.add_static("backdrop", lambda surface: calls.append(surface.fill((10, 20, 30))))
+    screen = pygame.Surface((64, 64))
+    compositor.render(screen)
+    compositor.render(screen)
+    assert len(calls) == 1
+    assert screen.get_at((5, 5))[:3] == (10, 20, 30)
+
+    compositor.invalidate()
+    compositor.render(screen)
+    assert len(calls) == 2
+
+def test_hiding_static_layer_rebuilds_backdrop():
+    """Test that toggling a static layer changes the cached backdrop."""
+    red = pygame.Surface((8, 8))
+    red.fill((255, 0, 0))
+    compositor = LayerCompositor((8, 8))
+    compositor.add_static("red", red, visible=False)
+    screen = pygame.Surface((8, 8))
+    compositor.render(screen)
+    assert screen.get_at((0, 0))[:3] == (0, 0, 0)
+    compositor.set_visible("red", True)
+    compositor.render(screen)
+    assert screen.get_at((0, 0))[:3] == (255, 0, 0)
+
+def test_animated_layers_drawn_over_backdrop():
+    """Test that animated layers are drawn each frame with their alpha."""
+    white = pygame.Surface((8, 8), pygame.SRCALPHA)
+    white.fill((255, 255, 255, 255))
+    compositor = LayerCompositor((8, 8))
+    compositor.add_static("black", lambda surface: surface.fill((0, 0, 0)))
+    compositor.add_animated("white", white)
+    compositor.set_alpha("white", 0)
+    screen = pygame.Surface((8, 8))
+    compositor.render(screen)
+    assert screen.get_at((0, 0))[:3] == (0, 0, 0)
+    compositor.set_alpha("white", 255)
+    compositor.render(screen)
+    assert screen.get_at((0, 0))[:3] == (255, 255, 255)
@@ -0,0 +1,19 @@
+import logging
+from ..game.core.logging_setup import RateLimitFilter
+
+def make_record(message, level=logging.ERROR):
+    return logging.LogRecord("src.game.core.scene_manager", level, __file__, 1, message, None, None)
+
+def test_repeated_errors_are_rate_limited():
+    """Test that a per-frame error is logged once per interval with a repeat count."""
+    log_filter = RateLimitFilter(interval=60.0)
+    assert log_filter.filter(make_record("Error rendering scene: boom"))
+    assert not any(log_filter.filter(make_record("Error rendering scene: boom")) for _ in range(10))
+    assert log_filter.filter(make_record("Error updating scene: other"))
+    assert log_filter.filter(make_record("Switched to scene: x", logging.INFO))
+    assert log_filter.filter(make_record("Switched to scene: x", logging.INFO))
+
+    log_filter.interval = 0.0
+    record = make_record("Error rendering scene: boom")
+    assert log_filter.filter(record)
+    assert record.getMessage() == "Error rendering scene: boom (repeated 10 more times)"
@@ -3,6 +3,7 @@ import pygame
 import sys
 from ..game.scenes.mirror_chamber import MirrorChamber
 from ..game.core.scene_manager import Scene
+from ..game.core.game_clock import GameClock
 
 # Initialize pygame for testing
 pygame.init()
@@ -96,4 +97,39 @@ def test_break_free_from_serpent(mirror_chamber):
     assert not mirror_chamber.cutscene_active
     assert not mirror_chamber.serpent_visible
     assert mirror_chamber.current_dialogue == mirror_chamber.dialogues[6]
-    assert mirror_chamber.game_state.armor_pieces.get("belt_of_truth") == True 
\ No newline at end of file
+    assert mirror_chamber.game_state.armor_pieces.get("belt_of_truth") == True 
+
+def test_moving_sprites_are_interpolated(mirror_chamber):
+    """Test that sprites are drawn between their last two simulated positions."""
+    mirror_chamber.clock = GameClock(step=0.1)
+    list(mirror_chamber.clock.advance(0.15))  # Half-way to the next step
+    rect = pygame.Rect(100, 40, 10, 10)
+
+    assert mirror_chamber._interpolated((80, 20), rect) == (90, 30)
+    assert mirror_chamber._interpolated(None, rect) == (100, 40)
+
+def test_reset_matches_a_fresh_scene(mirror_chamber, game_state):
+    """Test that restarting in place restores the state a new scene starts with."""
+    mirror_chamber.handle_events(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {
+        'button': 1,
+        'pos': mirror_chamber.mirror_shards[0]["position"]
+    }))
+    mirror_chamber.character_target = 900
+    mirror_chamber.character_moving = True
+    mirror_chamber.serpent_visible = True
+    for _ in range(30):
+        mirror_chamber.update(1 / 60)
+
+    assert mirror_chamber.reset()
+    fresh = MirrorChamber(game_state)
+    for name in ("character_rect", "character_position", "character_pos", "character_target",
+                 "character_moving", "character_direction", "character_previous_pos",
+                 "serpent_visible", "serpent_rect", "serpent_position", "serpent_previous_pos",
+                 "all_shards_collected", "mirror_complete", "can_exit", "dragged_item",
+                 "dialogue_text", "displayed_text", "typing_index", "cutscene_active", "cutscene_phase"):
+        assert getattr(mirror_chamber, name) == getattr(fresh, name), name
+    assert [shard["collected"] for shard in mirror_chamber.mirror_shards] == \
+        [shard["collected"] for shard in fresh.mirror_shards]
+    assert [slot["item"] for slot in mirror_chamber.inventory_slots] == \
+        [slot["item"] for slot in fresh.inventory_slots]
+    assert len(mirror_chamber.water_drips) == len(fresh.water_drips)
@@ -0,0 +1,56 @@
+import numpy as np
+import pygame
+from ..game.effects.particles import ParticleSystem, bake_circles
+
+def make_system(**kwargs):
+    return ParticleSystem(bake_circles((255, 255, 255), (2, 4)), **kwargs)
+
+def test_update_moves_and_compacts_dead_particles():
+    """Test that expired particles are dropped and survivors stay packed."""
+    system = make_system(capacity=8)
+    system.emit(3, x=[0, 10, 20], y=0, vy=100, life=[0.5, 2.0, 1.0])
+    system.update(0.75)
+    assert len(system) == 2
+    np.testing.assert_allclose(system.position[:2], [[10, 75], [20, 75]])
+    np.testing.assert_allclose(system.life[:2], [2.0, 1.0])
+
+def test_emit_is_bounded_by_capacity():
+    """Test that emissions beyond capacity are dropped."""
+    system = make_system(capacity=4)
+    assert system.emit(3, x=0, y=0) == 3
+    assert system.emit(3, x=0, y=0) == 1
+    assert len(system) == 4
+
+def test_bounds_and_fading():
+    """Test that particles leaving the bounds die and alpha fades at the end of life."""
+    system = make_system(bounds=pygame.Rect(0, 0, 100, 100))
+    system.emit(2, x=[50, 95], y=50, vx=[0, 100], life=1.0, fade_time=0.5)
+    system.update(0.75)
+    assert len(system) == 1
+    np.testing.assert_allclose(system.current_alpha(), [127.5])
+
+def test_render_draws_visible_particles():
+    """Test that particles are drawn centered on their position."""
+    system = make_system()
+    system.emit(1, x=10, y=10, sprite=1, life=1.0)
+    surface = pygame.Surface((20, 20))
+    system.render(surface)
+    assert surface.get_at((10, 10))[:3] == (255, 255, 255)
+    assert surface.get_at((1, 1))[:3] == (0, 0, 0)
+
+class BlitsOnlySurface:
+    """Surface stand-in without fblits(), as on upstream pygame."""
+
+    def __init__(self, surface):
+        self.surface = surface
+
+    def blits(self, sequence, doreturn=True):
+        return self.surface.blits(sequence, doreturn)
+
+def test_render_falls_back_to_blits():
+    """Test that rendering works where Surface.fblits() does not exist."""
+    system = make_system()
+    system.emit(1, x=10, y=10, sprite=1, life=1.0)
+    surface = pygame.Surface((20, 20))
+    system.render(BlitsOnlySurface(surface))
+    assert surface.get_at((10, 10))[:3] == (255, 255, 255)
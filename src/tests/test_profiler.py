@@ -0,0 +1,34 @@
+import pytest
+from ..game.core.profiler import Profiler
+
+def test_spans_recorded_only_while_enabled():
+    """Test that spans are grouped per frame and ignored while disabled."""
+    profiler = Profiler(capacity=2)
+    with profiler.span("scene.update"):
+        pass
+    profiler.end_frame()
+    assert not profiler.frames
+
+    profiler.set_enabled(True)
+    for _ in range(3):
+        profiler.begin_frame()
+        with profiler.span("scene.update"):
+            pass
+        with profiler.span("scene.render"):
+            pass
+        profiler.end_frame()
+    assert len(profiler.frames) == 2
+    assert [span.name for span in profiler.frames[-1].spans] == ["scene.update", "scene.render"]
+    assert {name for name, _ in profiler.top_spans()} == {"scene.update", "scene.render"}
+
+def test_chrome_trace_events():
+    """Test that the dump uses complete events with microsecond timings."""
+    profiler = Profiler()
+    profiler.set_enabled(True)
+    profiler.begin_frame()
+    profiler.record("load_image a.png", 1.0, 1.002)
+    profiler.end_frame()
+    events = profiler.to_chrome_trace()['traceEvents']
+    span = next(event for event in events if event['name'] == "load_image a.png")
+    assert span['ph'] == 'X'
+    assert span['dur'] == pytest.approx(2000.0)
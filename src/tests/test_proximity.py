@@ -0,0 +1,49 @@
+import pygame
+from ..game.core.spatial_index import SpatialIndex
+from ..game.effects.proximity import ProximityGlow
+
+def make_glow():
+    index = SpatialIndex()
+    index.add(("shard", 0), pygame.Rect(100, 100, 50, 50))
+    index.add(("shard", 1), pygame.Rect(600, 100, 50, 50))
+    index.add(("slot", 0), pygame.Rect(110, 110, 10, 10))
+    glow = ProximityGlow(index, radius=100, fade_speed=300)
+    surface = pygame.Surface((70, 70), pygame.SRCALPHA)
+    glow.add(("shard", 0), surface)
+    glow.add(("shard", 1), surface)
+    return glow
+
+def test_only_targets_within_radius_glow():
+    """Test that targets glow by squared distance to their center."""
+    glow = make_glow()
+    glow.pointer_moved((125 + 99, 125))
+    assert glow.near == {("shard", 0)}
+    glow.pointer_moved((125 + 100, 125))
+    assert glow.near == set()
+
+def test_glow_fades_and_settles():
+    """Test that glows fade in and out and stop updating once settled."""
+    glow = make_glow()
+    assert glow.frame(("shard", 0)) is None
+    glow.pointer_moved((125, 125))
+    glow.update(0.5)
+    assert glow.alpha[("shard", 0)] == 150
+    glow.update(0.5)
+    assert glow.alpha[("shard", 0)] == 255
+    assert not glow.fading
+    assert glow.frame(("shard", 0)) is glow.frames[("shard", 0)][-1]
+
+    glow.pointer_moved((900, 600))
+    glow.update(1.0)
+    assert glow.frame(("shard", 0)) is None
+    assert not glow.fading
+    assert glow.frames[("shard", 0)] is glow.frames[("shard", 1)]
+
+def test_frames_are_shared_per_glow_surface():
+    """Test that targets share frames only when they share a glow surface."""
+    glow = make_glow()
+    assert glow.frames[("shard", 0)] is glow.frames[("shard", 1)]
+    other = pygame.Surface((70, 70), pygame.SRCALPHA)
+    glow.add(("slot", 0), other)
+    assert glow.frames[("slot", 0)] is not glow.frames[("shard", 0)]
+    assert other in glow._baked  # Kept alive while its frames are cached
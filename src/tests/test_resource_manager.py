@@ -0,0 +1,212 @@
+import os
+import wave
+import pytest
+import pygame
+from ..game.core.asset_baker import AssetBaker
+from ..game.core.asset_cache import AssetCache
+from ..game.core.asset_pack import AssetPack, build_pack, close_asset_pack, open_asset_pack
+from ..game.core import resource_manager
+from ..game.core.resource_manager import ResourceManager, shutdown_decode_pool
+
+@pytest.fixture
+def cache():
+    return AssetCache()
+
+def test_repeated_key_returns_same_surface(cache):
+    """Test that two managers share one decoded surface."""
+    first = ResourceManager(cache)
+    second = ResourceManager(cache)
+
+    image_a = first.load_image("characters/Serpent.png")
+    image_b = second.load_image("characters/Serpent.png")
+
+    assert image_a is image_b
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hits'] == 1
+    assert cache.refcount('images', ("characters/Serpent.png", None)) == 2
+
+def test_released_assets_stay_resident_until_evicted(cache):
+    """Test that unreferenced assets are kept for re-entry but evictable."""
+    first = ResourceManager(cache)
+    second = ResourceManager(cache)
+    first.load_image("characters/Serpent.png")
+    second.load_image("characters/Serpent.png")
+
+    first.clear_cache()
+    assert cache.is_pinned('images', ("characters/Serpent.png", None))
+
+    second.clear_cache()
+    assert not cache.is_pinned('images', ("characters/Serpent.png", None))
+    assert cache.stats()['entries'] == 1
+
+    cache.set_budget(0)
+    assert cache.stats()['entries'] == 0
+    assert cache.stats()['used_bytes'] == 0
+
+def test_lru_eviction_spares_pinned_assets():
+    """Test that eviction removes the least recently used unpinned asset."""
+    cache = AssetCache(budget_bytes=3 * 100 * 100 * 4)
+    for name in ("a", "b", "c"):
+        cache.insert('images', name, pygame.Surface((100, 100), pygame.SRCALPHA))
+    cache.release('images', "a")
+    cache.release('images', "b")
+
+    cache.insert('images', "d", pygame.Surface((100, 100), pygame.SRCALPHA))
+
+    assert cache.refcount('images', "a") == 0
+    assert ('images', "a") not in cache.entries
+    assert ('images', "b") in cache.entries
+    assert cache.is_pinned('images', "c")
+    assert cache.usage()['images'] == {'bytes': 120000, 'entries': 3, 'pinned': 2}
+
+def test_missing_image_is_not_cached(cache):
+    """Test that error placeholders never enter the shared cache."""
+    manager = ResourceManager(cache)
+    surface = manager.load_image("does_not_exist.png")
+
+    assert surface.get_size() == (32, 32)
+    assert cache.stats()['entries'] == 0
+
+def test_asset_pack_round_trip(tmp_path):
+    """Test that images and sounds read back from a pack unchanged."""
+    assets = tmp_path / "assets"
+    (assets / "sounds").mkdir(parents=True)
+    image = pygame.Surface((8, 4), pygame.SRCALPHA)
+    image.fill((10, 20, 30, 40))
+    pygame.image.save(image, str(assets / "Mother’s icon.png"))
+    (assets / "metadata.json").write_text("{}")
+    with wave.open(str(assets / "sounds" / "beep.wav"), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(44100)
+        wav.writeframes(bytes(range(200)))
+
+    pack = AssetPack(build_pack(str(assets), str(tmp_path / "assets.pack"), str(assets / "metadata.json")))
+    try:
+        loaded = pack.load_image("Mother’s icon.png")
+        assert loaded.get_size() == (8, 4)
+        assert loaded.get_at((0, 0)) == (10, 20, 30, 40)
+        assert pack.index["sounds/beep.wav"]['format'] == 'pcm'
+        assert len(pack.view("sounds/beep.wav")) == 400
+    finally:
+        pack.close()
+
+def test_icons_are_shared_per_source_and_size(cache, tmp_path, monkeypatch):
+    """Test that an icon is scaled once per (source, size) and then shared."""
+    first = ResourceManager(cache)
+    second = ResourceManager(cache)
+    for manager in (first, second):
+        monkeypatch.setattr(manager.baker, "cache_dir", tmp_path)
+
+    icon_a = first.load_icon("assets/characters/Serpent.png", 64)
+    icon_b = second.load_icon("characters/Serpent.png", 64)
+    icon_c = second.load_icon("characters/Serpent.png", 32)
+
+    assert icon_a is icon_b
+    assert icon_a.get_size() == (64, 64)
+    assert icon_c.get_size() == (32, 32)
+    assert cache.refcount('images', ("characters/Serpent.png", (64, 64))) == 2
+
+@pytest.mark.parametrize("flags, fill", [(0, (10, 20, 30)), (pygame.SRCALPHA, (10, 20, 30, 40))])
+def test_baked_copy_round_trip(tmp_path, flags, fill):
+    """Test that a stored bake loads back with identical pixels."""
+    (tmp_path / "assets").mkdir()
+    source = pygame.Surface((8, 4), flags)
+    source.fill(fill)
+    source.fill((200, 100, 50), pygame.Rect(0, 0, 2, 2))
+    pygame.image.save(source, str(tmp_path / "assets" / "icon.png"))
+    baker = AssetBaker(str(tmp_path / "assets"), str(tmp_path / "baked"))
+
+    scaled = pygame.transform.smoothscale(pygame.image.load(str(tmp_path / "assets" / "icon.png")), (4, 2))
+    baker.store("icon.png", scaled)
+    loaded = baker.load("icon.png", 0.5)
+
+    assert loaded.get_size() == (4, 2)
+    assert bool(loaded.get_flags() & pygame.SRCALPHA) == bool(flags)
+    pixel_format = 'RGBA' if flags else 'RGB'
+    assert pygame.image.tobytes(loaded, pixel_format) == pygame.image.tobytes(scaled, pixel_format)
+
+def test_changed_source_gets_a_new_bake_key(tmp_path):
+    """Test that editing a source image invalidates its baked copies."""
+    (tmp_path / "assets").mkdir()
+    path = tmp_path / "assets" / "icon.png"
+    baker = AssetBaker(str(tmp_path / "assets"), str(tmp_path / "baked"))
+
+    pygame.image.save(pygame.Surface((8, 4)), str(path))
+    old_path = baker.baked_path("icon.png", (4, 2), False)
+    baker.store("icon.png", pygame.Surface((4, 2)))
+
+    edited = pygame.Surface((8, 4))
+    edited.fill((255, 0, 0))
+    pygame.image.save(edited, str(path))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # Coarse filesystem clocks
+
+    assert baker.baked_path("icon.png", (4, 2), False) != old_path
+    assert baker.load("icon.png", 0.5) is None
+
+def test_bakes_are_keyed_off_the_open_pack(tmp_path):
+    """Test that packed images are baked without touching loose files."""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    source = pygame.Surface((8, 4))
+    source.fill((10, 20, 30))
+    pygame.image.save(source, str(assets / "icon.png"))
+    (assets / "metadata.json").write_text("{}")
+    pack_path = build_pack(str(assets), str(tmp_path / "assets.pack"), str(assets / "metadata.json"))
+    loose_baker = AssetBaker(str(assets), str(tmp_path / "baked"))
+    loose_path = loose_baker.baked_path("icon.png", (4, 2), False)
+    (assets / "icon.png").unlink()  # Only the pack ships
+
+    pack = open_asset_pack(pack_path)
+    try:
+        assert pack.index["icon.png"]['size'] == [8, 4]
+        baker = AssetBaker(str(assets), str(tmp_path / "baked"))
+        assert baker.target_size("icon.png", 0.5) == (4, 2)
+        assert baker.baked_path("icon.png", (4, 2), False) == loose_path
+        baker.store("icon.png", pygame.transform.scale(source, (4, 2)))
+        assert baker.load("icon.png", 0.5).get_at((0, 0)) == (10, 20, 30, 255)
+    finally:
+        close_asset_pack()
+
+def test_pool_decodes_match_single_loads(tmp_path, monkeypatch):
+    """Test that batch loads decoded in worker processes match single loads."""
+    monkeypatch.setattr(resource_manager.os, "cpu_count", lambda: 2)
+    pools = []
+    get_decode_pool = resource_manager._get_decode_pool
+
+    def recording_pool():
+        pools.append(get_decode_pool())
+        return pools[-1]
+
+    monkeypatch.setattr(resource_manager, "_get_decode_pool", recording_pool)
+    targets = [("characters/Serpent.png", 0.25), ("characters/main_character.png", (64, 96))]
+
+    batch = ResourceManager(AssetCache())
+    batch.baker.cache_dir = tmp_path / "batch"
+    try:
+        images = batch.load_images(targets)
+    finally:
+        shutdown_decode_pool()
+    assert pools
+    assert len(list(batch.baker.cache_dir.iterdir())) == 2
+
+    single = ResourceManager(AssetCache())
+    single.baker.cache_dir = tmp_path / "single"
+    expected = [single.load_image("characters/Serpent.png", scale=0.25),
+                single.load_image("characters/main_character.png", size=(64, 96))]
+    for image, reference in zip(images, expected):
+        assert image.get_size() == reference.get_size()
+        assert pygame.image.tobytes(image, 'RGBA') == pygame.image.tobytes(reference, 'RGBA')
+
+def test_pack_closes_while_views_are_alive(tmp_path):
+    """Test that closing a pack does not fail while a slice is still in use."""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "data.bin").write_bytes(b"0123456789")
+    (assets / "metadata.json").write_text("{}")
+    pack = AssetPack(build_pack(str(assets), str(tmp_path / "assets.pack"), str(assets / "metadata.json")))
+
+    view = pack.view("data.bin")
+    pack.close()
+    assert bytes(view) == b"0123456789"
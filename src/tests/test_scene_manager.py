@@ -0,0 +1,127 @@
+import pygame
+from ..game.core.asset_cache import AssetCache
+from ..game.core.resource_manager import ResourceManager
+from ..game.core.scene_manager import Retention, Scene, SceneManager
+
+class MockGameState:
+    def __init__(self):
+        self.current_scene = None
+
+    def can_access_scene(self, name):
+        return True
+
+class RecordingScene(Scene):
+    def __init__(self, game_state):
+        super().__init__(game_state)
+        self.calls = []
+
+    def suspend(self):
+        self.calls.append("suspend")
+
+    def resume(self):
+        super().resume()
+        self.calls.append("resume")
+
+    def cleanup(self):
+        self.calls.append("cleanup")
+
+class PooledScene(RecordingScene):
+    retention = Retention.SUSPEND
+
+class KeptScene(RecordingScene):
+    retention = Retention.KEEP_ALIVE
+
+class RestartableScene(RecordingScene):
+    def reset(self):
+        self.calls.append("reset")
+        return True
+
+def make_manager(max_retained=2):
+    manager = SceneManager(MockGameState(), max_retained=max_retained)
+    for name, scene_class in (("pooled", PooledScene), ("kept", KeptScene),
+                              ("plain", RecordingScene), ("restartable", RestartableScene)):
+        manager.register_scene(name, scene_class)
+    return manager
+
+def test_retained_scenes_are_resumed():
+    """Test that a suspended scene is reused on re-entry."""
+    manager = make_manager()
+    manager.switch_scene("pooled")
+    pooled = manager.current_scene
+    pooled.start_transition("kept")
+    manager.switch_scene("kept")
+    kept = manager.current_scene
+    manager.switch_scene("pooled")
+
+    assert manager.current_scene is pooled
+    assert pooled.calls == ["suspend", "resume"]
+    assert pooled.next_scene is None
+    assert manager.retained["kept"] is kept
+    assert kept.calls == []  # Kept alive without suspending
+
+def test_destroyed_and_evicted_scenes_are_cleaned_up():
+    """Test that DESTROY scenes and scenes past the pool size are cleaned up."""
+    manager = make_manager(max_retained=1)
+    manager.switch_scene("plain")
+    plain = manager.current_scene
+    manager.switch_scene("pooled")
+    assert plain.calls == ["cleanup"]
+    assert "plain" not in manager.retained
+
+    pooled = manager.current_scene
+    manager.switch_scene("kept")
+    manager.switch_scene("plain")
+    assert pooled.calls == ["suspend", "cleanup"]
+    assert list(manager.retained) == ["kept"]
+
+def test_restart_resets_in_place():
+    """Test that a scene switching to itself is reset instead of rebuilt."""
+    manager = make_manager()
+    manager.switch_scene("restartable")
+    scene = manager.current_scene
+    scene.start_transition("restartable")
+    scene.dirty.collect()
+    manager.switch_scene("restartable")
+    assert manager.current_scene is scene
+    assert scene.calls == ["reset"]  # Not resumed, so ambient loops are not restarted
+    assert scene.dirty.collect() is None  # Redrawn in full
+
+    manager.switch_scene("plain")
+    plain = manager.current_scene
+    manager.switch_scene("plain")
+    assert manager.current_scene is not plain
+    assert plain.calls == ["cleanup"]
+
+def test_prefetched_images_are_used_by_the_next_scene(monkeypatch):
+    """Test that a scene built after a prefetch takes the staged images."""
+    cache = AssetCache()
+    decoded = []
+    decode_image = ResourceManager._decode_image
+
+    def counting_decode(self, filename):
+        decoded.append(filename)
+        return decode_image(self, filename)
+
+    monkeypatch.setattr(ResourceManager, "_decode_image", counting_decode)
+
+    class PreloadingScene(RecordingScene):
+        preload_images = ["characters/Serpent.png"]
+
+        def __init__(self, game_state):
+            super().__init__(game_state)
+            self.image = ResourceManager(cache).load_image("characters/Serpent.png")
+
+    manager = make_manager()
+    manager.resource_manager = ResourceManager(cache)
+    manager.register_scene("preloading", PreloadingScene)
+
+    assert manager.prefetch("preloading")
+    manager.prefetch_future.result()
+    assert cache.is_staged('images', ("characters/Serpent.png", None))
+    cache.stage('images', ("unused.png", None), pygame.Surface((1, 1)))
+
+    assert manager.switch_scene("preloading")
+    assert decoded == ["characters/Serpent.png"]  # Only the prefetch decoded it
+    assert manager.current_scene.image is cache.entries[('images', ("characters/Serpent.png", None))].value
+    assert manager.prefetch_target is None
+    assert not cache.staged  # Leftovers are dropped
@@ -0,0 +1,31 @@
+import pygame
+from ..game.core.spatial_index import SpatialIndex
+
+def test_point_query_is_z_ordered():
+    """Test that overlapping regions come back topmost first."""
+    index = SpatialIndex(cell_size=32)
+    index.add("floor", pygame.Rect(0, 0, 200, 200))
+    index.add("door", pygame.Rect(50, 50, 40, 80), z=2)
+    index.add("shard", pygame.Rect(60, 60, 10, 10), z=1)
+    assert index.query_point((65, 65)) == ["door", "shard", "floor"]
+    assert index.top_at((150, 150)) == "floor"
+    assert index.top_at((500, 500)) is None
+
+def test_equal_z_keeps_insertion_order():
+    """Test that regions with equal z resolve to the one added first."""
+    index = SpatialIndex()
+    index.add("first", pygame.Rect(0, 0, 10, 10))
+    index.add("second", pygame.Rect(0, 0, 10, 10))
+    assert index.query_point((5, 5)) == ["first", "second"]
+
+def test_move_and_remove_update_cells():
+    """Test that moved and removed regions are found only where they are."""
+    index = SpatialIndex(cell_size=16)
+    index.add("serpent", pygame.Rect(0, 0, 20, 20))
+    index.move("serpent", pygame.Rect(300, 300, 20, 20))
+    assert index.top_at((5, 5)) is None
+    assert index.top_at((310, 310)) == "serpent"
+    assert index.query_rect(pygame.Rect(250, 250, 60, 60)) == ["serpent"]
+    index.remove("serpent")
+    assert index.top_at((310, 310)) is None
+    assert not index.cells
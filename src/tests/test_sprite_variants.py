@@ -0,0 +1,29 @@
+import pygame
+from ..game.core.sprite_variants import SpriteVariantCache
+
+def test_variants_are_created_once():
+    """Test that repeated requests return the cached variant."""
+    cache = SpriteVariantCache()
+    sprite = pygame.Surface((10, 20), pygame.SRCALPHA)
+    sprite.fill((255, 0, 0, 255), pygame.Rect(0, 0, 1, 20))
+
+    flipped = cache.flipped(sprite)
+    assert cache.flipped(sprite) is flipped
+    assert flipped.get_at((9, 0)) == (255, 0, 0, 255)
+    assert cache.get(sprite, size=(5, 10)).get_size() == (5, 10)
+    assert cache.get(sprite, angle=90.2) is cache.get(sprite, angle=90)
+    assert cache.get(sprite, angle=90).get_size() == (20, 10)
+    assert cache.misses == 3
+    assert cache.get(sprite, size=(10, 20), angle=360) is sprite
+
+def test_cache_is_bounded():
+    """Test that the least recently used variants are dropped."""
+    cache = SpriteVariantCache(max_entries=2)
+    first, second, third = (pygame.Surface((4, 4)) for _ in range(3))
+    first_flipped = cache.flipped(first)
+    cache.flipped(second)
+    assert cache.flipped(first) is first_flipped
+    cache.flipped(third)
+    assert len(cache) == 2
+    assert (second, True, False, None, 0) not in cache.entries
+    assert cache.flipped(first) is first_flipped
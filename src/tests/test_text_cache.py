@@ -0,0 +1,26 @@
+import pygame
+from ..game.ui.text_cache import TextRenderer
+
+pygame.init()
+
+def test_render_reuses_surfaces_and_evicts_oldest():
+    """Test that rendered strings are shared and bounded by LRU."""
+    font = pygame.font.Font(None, 24)
+    renderer = TextRenderer(max_surfaces=2)
+    first = renderer.render(font, "Truth", (255, 255, 255))
+    assert renderer.render(font, "Truth", (255, 255, 255)) is first
+    assert renderer.render(font, "Truth", (0, 0, 0)) is not first
+
+    renderer.render(font, "Light", (255, 255, 255))
+    assert len(renderer.surfaces) == 2
+    assert renderer.render(font, "Truth", (255, 255, 255)) is not first
+
+def test_wrap_prefix_matches_full_wrap():
+    """Test that incremental typewriter layout equals wrapping from scratch."""
+    font = pygame.font.Font(None, 32)
+    text = "Now we see through a glass, darkly; but then face to face."
+    incremental = TextRenderer()
+    for length in range(len(text) + 1):
+        expected = TextRenderer().wrap_prefix(font, text[:length], 150)
+        assert incremental.wrap_prefix(font, text[:length], 150) == expected
+    assert len(incremental.wrap_prefix(font, text, 150)) > 1
@@ -0,0 +1,43 @@
+import pygame
+from ..game.core.asset_cache import AssetCache
+from ..game.core.resource_manager import ResourceManager
+from ..game.core.texture_atlas import AtlasBuilder, TextureAtlas
+
+COLORS = {
+    "items/red": ((255, 0, 0, 255), (20, 20)),
+    "items/green": ((0, 255, 0, 255), (12, 10)),
+    "items/blue": ((0, 0, 255, 128), (16, 16)),
+}
+
+def build_atlas(tmp_path):
+    builder = AtlasBuilder("items", sheet_size=(32, 32), padding=2)
+    for name, (color, size) in COLORS.items():
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        sprite.fill(color)
+        builder.add(name, sprite)
+    return builder.save(str(tmp_path))
+
+def test_packed_sprites_keep_their_rects_and_pixels(tmp_path):
+    """Test that every packed sprite reads back at its rect unchanged."""
+    atlas = TextureAtlas.load(build_atlas(tmp_path))
+
+    # Tallest first; blue fits neither beside nor below red, so it opens a second sheet
+    assert atlas.sprites["items/red"] == {'sheet': 0, 'rect': [0, 0, 20, 20]}
+    assert atlas.sprites["items/blue"] == {'sheet': 1, 'rect': [0, 0, 16, 16]}
+    assert atlas.sprites["items/green"] == {'sheet': 1, 'rect': [18, 0, 12, 10]}
+    for name, (color, size) in COLORS.items():
+        sprite = atlas.get(name)
+        assert sprite.get_size() == size
+        assert sprite.get_at((0, 0)) == color
+        assert sprite.get_at((size[0] - 1, size[1] - 1)) == color
+    assert atlas.get("items/missing") is None
+
+def test_get_sprite_uses_the_atlas_named_by_the_path(tmp_path):
+    """Test that ResourceManager looks sprites up by logical name."""
+    build_atlas(tmp_path)
+    manager = ResourceManager(AssetCache())
+    manager.base_paths['atlases'] = str(tmp_path)
+
+    assert manager.get_sprite("items/blue").get_size() == (16, 16)
+    assert manager.get_sprite("items/missing") is None
+    assert manager.get_sprite("ui/button") is None
@@ -0,0 +1,206 @@
+"""
+Scene Benchmark
+Headless, deterministic frame-cost benchmark for the registered scenes.
+
+Each scene is constructed with the SDL dummy video and audio drivers, then
+driven for a number of frames with a fixed timestep and a scripted input
+sequence. Construction time, update/render time percentiles and Python
+allocations per frame are written as JSON.
+
+Run from the project root:
+    python -m src.utils.benchmark_scenes --frames 600 --output bench.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+# Must be set before pygame initializes its video and audio subsystems
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Allow running as a plain script from any directory
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import pygame
+
+from src.game.core.event_batcher import EventBatcher
+from src.game.core.game_clock import get_game_clock
+from src.game.core.game_state import GameState
+from src.game.scenes.registry import SCENES
+
+SCREEN_SIZE = (1280, 720)
+
+def scripted_events(frame: int) -> List[pygame.event.Event]:
+    """Get the input events injected before a frame.
+
+    The pointer sweeps a Lissajous path over the play area, clicking every
+    90 frames, while the arrow keys walk the character right and left.
+
+    Args:
+        frame: Index of the frame.
+
+    Returns:
+        List[pygame.event.Event]: Events to hand to the scene.
+    """
+    def pointer(index: int) -> tuple:
+        return (int(640 + 500 * math.sin(index * 0.05)), int(420 + 180 * math.sin(index * 0.031)))
+
+    pos = pointer(frame)
+    previous = pointer(frame - 1)
+    events = [pygame.event.Event(pygame.MOUSEMOTION, {
+        'pos': pos, 'rel': (pos[0] - previous[0], pos[1] - previous[1]), 'buttons': (0, 0, 0)
+    })]
+    if frame % 90 == 45:
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': pos, 'button': 1}))
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, {'pos': pos, 'button': 1}))
+    key_script = {30: (pygame.KEYDOWN, pygame.K_RIGHT), 90: (pygame.KEYUP, pygame.K_RIGHT),
+                  150: (pygame.KEYDOWN, pygame.K_LEFT), 210: (pygame.KEYUP, pygame.K_LEFT)}
+    if frame % 240 in key_script:
+        event_type, key = key_script[frame % 240]
+        events.append(pygame.event.Event(event_type, {'key': key, 'mod': 0, 'unicode': '', 'scancode': 0}))
+    return events
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize timings in milliseconds as mean, p95, p99 and max."""
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {'mean': value, 'p95': value, 'p99': value, 'max': value}
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {
+        'mean': statistics.fmean(samples),
+        'p95': cuts[94],
+        'p99': cuts[98],
+        'max': max(samples),
+    }
+
+def run_frames(scene, screen: pygame.Surface, batcher: EventBatcher,
+               first_frame: int, frames: int, dt: float,
+               update_times: Optional[List[float]] = None,
+               render_times: Optional[List[float]] = None,
+               allocations: Optional[List[float]] = None) -> None:
+    """Drive a scene through scripted frames, recording what is asked for."""
+    clock = get_game_clock()
+    for frame in range(first_frame, first_frame + frames):
+        if allocations is not None:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        events, snapshot = batcher.process(scripted_events(frame))
+        for event in events:
+            scene.handle_events(event)
+        scene.handle_input(snapshot)
+        for step in clock.advance(dt):
+            scene.update(step)
+        updated = time.perf_counter()
+        screen.fill((0, 0, 0))
+        scene.render(screen)
+        rendered = time.perf_counter()
+
+        if update_times is not None:
+            update_times.append((updated - start) * 1000.0)
+        if render_times is not None:
+            render_times.append((rendered - updated) * 1000.0)
+        if allocations is not None:
+            allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+
+def benchmark_scene(name: str, screen: pygame.Surface, frames: int, dt: float,
+                    alloc_frames: int, seed: int) -> Dict[str, object]:
+    """Benchmark one registered scene.
+
+    Args:
+        name: Registered scene name.
+        screen: Display surface to render to.
+        frames: Number of timed frames.
+        dt: Fixed simulation step in seconds.
+        alloc_frames: Number of further frames run under tracemalloc.
+        seed: Random seed, so procedural visuals are the same every run.
+
+    Returns:
+        Dict[str, object]: The scene's results.
+    """
+    random.seed(seed)
+    clock = get_game_clock()
+    clock.reset()
+    clock.step = dt
+
+    gc.collect()
+    start = time.perf_counter()
+    scene = SCENES[name](GameState())
+    construct_ms = (time.perf_counter() - start) * 1000.0
+
+    update_times: List[float] = []
+    render_times: List[float] = []
+    batcher = EventBatcher()
+    run_frames(scene, screen, batcher, 0, frames, dt, update_times, render_times)
+
+    # Allocation tracing slows frames down, so it gets its own pass
+    allocations: List[float] = []
+    if alloc_frames:
+        tracemalloc.start()
+        run_frames(scene, screen, batcher, frames, alloc_frames, dt, allocations=allocations)
+        tracemalloc.stop()
+
+    scene.cleanup()
+    return {
+        'construct_ms': construct_ms,
+        'update_ms': summarize(update_times),
+        'render_ms': summarize(render_times),
+        'alloc_bytes_per_frame': summarize(allocations),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600, help='timed frames per scene')
+    parser.add_argument('--dt', type=float, default=1.0 / 60.0, help='fixed timestep in seconds')
+    parser.add_argument('--alloc-frames', type=int, default=120,
+                        help='extra frames run under tracemalloc (0 to skip)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--scenes', nargs='+', choices=sorted(SCENES), default=list(SCENES),
+                        help='scenes to benchmark')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    try:
+        results = {
+            'config': {
+                'frames': args.frames,
+                'dt': args.dt,
+                'alloc_frames': args.alloc_frames,
+                'seed': args.seed,
+                'pygame': pygame.version.ver,
+                'sdl': '.'.join(map(str, pygame.get_sdl_version())),
+                'python': sys.version.split()[0],
+            },
+            'scenes': {
+                name: benchmark_scene(name, screen, args.frames, args.dt, args.alloc_frames, args.seed)
+                for name in args.scenes
+            },
+        }
+    finally:
+        pygame.quit()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())